@@ -0,0 +1,40 @@
+"""Backend routes mounted next to the Reflex event handlers."""
+
+from pathlib import Path
+import reflex as rx
+from starlette.applications import Starlette
+from starlette.background import BackgroundTask
+from starlette.responses import FileResponse, PlainTextResponse
+from starlette.routing import Route
+
+EXPORTS_ROUTE = "/exports"
+
+
+def export_dir() -> Path:
+    """Directory holding finished exports until they are downloaded."""
+    return rx.get_upload_dir() / "exports"
+
+
+def import_dir() -> Path:
+    """Directory holding uploaded import files until they are processed."""
+    return rx.get_upload_dir() / "imports"
+
+
+def export_url(filename: str) -> str:
+    return f"{rx.config.get_config().api_url}{EXPORTS_ROUTE}/{filename}"
+
+
+async def download_export(request):
+    """Streams a finished export to the browser and deletes it afterwards."""
+    filename = request.path_params["filename"]
+    path = export_dir() / filename
+    if path.name != filename or path.suffix == ".part" or not path.is_file():
+        return PlainTextResponse("Export not found.", status_code=404)
+    return FileResponse(
+        path,
+        filename=filename,
+        background=BackgroundTask(path.unlink, missing_ok=True),
+    )
+
+
+api = Starlette(routes=[Route(f"{EXPORTS_ROUTE}/{{filename}}", download_export)])
@@ -12,6 +12,10 @@ from app.components.alerts import alerts_panel
 from app.components.insights import insights_widget
 from app.pages.budgets import budget_modal
 from app.pages.expenses import expense_modal
+from app.api import api
+from app.states.budget_state import BudgetState
+from app.states.goals_state import GoalsState
+from app.states.team_state import TeamState
 
 
 def dashboard_content() -> rx.Component:
@@ -91,16 +95,18 @@ from app.pages.settings import settings_page
 from app.pages.team import team_page
 from app.pages.goals import goals_page
 
+load_data = [BudgetState.load_data, GoalsState.load_goals, TeamState.load_team]
 app = rx.App(
+    api_transformer=api,
     theme=rx.theme(appearance="light"),
     stylesheets=[
         "https://fonts.googleapis.com/css2?family=Inter:wght@400;500;600;700&display=swap"
     ],
 )
-app.add_page(index, route="/")
-app.add_page(budgets_page, route="/budgets")
-app.add_page(expenses_page, route="/expenses")
-app.add_page(team_page, route="/team")
-app.add_page(goals_page, route="/goals")
-app.add_page(reports_page, route="/reports")
-app.add_page(settings_page, route="/settings")
\ No newline at end of file
+app.add_page(index, route="/", on_load=load_data)
+app.add_page(budgets_page, route="/budgets", on_load=load_data)
+app.add_page(expenses_page, route="/expenses", on_load=load_data)
+app.add_page(team_page, route="/team", on_load=load_data)
+app.add_page(goals_page, route="/goals", on_load=load_data)
+app.add_page(reports_page, route="/reports", on_load=load_data)
+app.add_page(settings_page, route="/settings", on_load=load_data)
\ No newline at end of file
@@ -74,5 +74,29 @@ def activity_feed() -> rx.Component:
             rx.foreach(TeamState.filtered_activities, activity_item),
             class_name="max-h-[400px] overflow-y-auto pr-2 custom-scrollbar",
         ),
+        rx.cond(
+            TeamState.activity_page_count > 1,
+            rx.el.div(
+                rx.el.button(
+                    rx.icon("chevron-left", size=14),
+                    "Newer",
+                    on_click=TeamState.prev_activity_page,
+                    disabled=TeamState.activity_page == 0,
+                    class_name="flex items-center gap-1 text-xs font-medium text-gray-600 hover:text-indigo-600 disabled:opacity-40",
+                ),
+                rx.el.span(
+                    f"{TeamState.activity_page + 1} / {TeamState.activity_page_count}",
+                    class_name="text-xs text-gray-400",
+                ),
+                rx.el.button(
+                    "Older",
+                    rx.icon("chevron-right", size=14),
+                    on_click=TeamState.next_activity_page,
+                    disabled=TeamState.activity_page + 1 >= TeamState.activity_page_count,
+                    class_name="flex items-center gap-1 text-xs font-medium text-gray-600 hover:text-indigo-600 disabled:opacity-40",
+                ),
+                class_name="flex items-center justify-between mt-4 pt-4 border-t border-gray-100",
+            ),
+        ),
         class_name="bg-white/70 backdrop-blur-xl p-6 rounded-2xl border border-white/50 shadow-[0_8px_30px_rgb(0,0,0,0.04)] h-full",
     )
\ No newline at end of file
@@ -122,7 +122,7 @@ def expenses_table() -> rx.Component:
             class_name="flex items-center justify-between mb-6",
         ),
         rx.cond(
-            BudgetState.expenses.length() > 0,
+            BudgetState.recent_expenses.length() > 0,
             rx.el.div(
                 rx.el.table(
                     rx.el.thead(
@@ -156,7 +156,7 @@ def expenses_table() -> rx.Component:
                     ),
                     rx.el.tbody(
                         rx.foreach(
-                            BudgetState.expenses, lambda e, i: expense_row(e, i)
+                            BudgetState.recent_expenses, lambda e, i: expense_row(e, i)
                         ),
                         class_name="bg-white/50 divide-y divide-gray-100",
                     ),
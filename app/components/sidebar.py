@@ -1,4 +1,5 @@
 import reflex as rx
+from app.states.budget_state import STORE_POLL_MS, BudgetState
 from app.states.ui_state import UIState
 
 
@@ -69,6 +70,12 @@ def sidebar() -> rx.Component:
             ),
             class_name="h-full bg-white/80 backdrop-blur-xl",
         ),
+        # Every page has the sidebar; its ticks keep the page's data current.
+        rx.moment(
+            interval=STORE_POLL_MS,
+            on_change=BudgetState.load_data,
+            class_name="hidden",
+        ),
         class_name=rx.cond(
             UIState.is_sidebar_collapsed,
             "w-20 border-r border-white/20 shadow-[4px_0_24px_rgba(0,0,0,0.02)] bg-white/80 h-screen sticky top-0 transition-all duration-300 ease-[cubic-bezier(0.25,0.1,0.25,1)] z-30",
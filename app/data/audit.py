@@ -0,0 +1,51 @@
+"""Field-level revision encoding for the expense audit trail.
+
+Each change to an expense is stored as a revision holding the values the
+fields it changed had before it, so the stored expense row is always the
+newest state and no copy of the expense is kept until it changes. Every
+``SNAPSHOT_EVERY``-th revision holds all fields as they were before it
+instead. The state at any earlier time is rebuilt by undoing the later
+revisions, starting from the nearest snapshot after them or from the stored
+row, so fewer than ``SNAPSHOT_EVERY`` deltas are applied however often the
+expense was edited.
+"""
+
+import datetime
+
+SNAPSHOT_EVERY = 32
+
+
+def timestamp() -> str:
+    return datetime.datetime.now().isoformat(timespec="seconds")
+
+
+def diff(old: dict, new: dict, columns) -> dict:
+    """The `columns` whose value in `new` differs from `old`, with new values."""
+    return {c: new[c] for c in columns if c in new and old.get(c) != new[c]}
+
+
+def is_snapshot(revision: int) -> bool:
+    return revision % SNAPSHOT_EVERY == 0
+
+
+def next_snapshot(revision: int) -> int:
+    """The first snapshot revision at or after `revision`."""
+    return -(-revision // SNAPSHOT_EVERY) * SNAPSHOT_EVERY
+
+
+def revision_fields(old: dict, new: dict, revision: int, columns) -> dict:
+    """What revision `revision` stores for the change from `old` to `new`."""
+    if is_snapshot(revision):
+        return {c: old.get(c) for c in columns}
+    return {c: old.get(c) for c in diff(old, new, columns)}
+
+
+def rewind(current: dict, revisions) -> dict:
+    """Undoes (snapshot, fields) revisions, newest first, from `current`."""
+    state = dict(current)
+    for snapshot, fields in revisions:
+        if snapshot:
+            state = dict(fields)
+        else:
+            state.update(fields)
+    return state
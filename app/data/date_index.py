@@ -0,0 +1,71 @@
+"""Expense ids kept in date order, so listings never have to sort.
+
+Keys are ``(date, id)`` tuples in ascending order, maintained with bisect.
+ISO dates compare correctly as strings, and the id breaks ties so every key is
+unique and removable.
+"""
+
+import bisect
+import heapq
+import itertools
+
+# Below this ratio of matches to indexed rows, ranking the matches directly is
+# cheaper than walking the ordered keys looking for them.
+SPARSE_MATCH_RATIO = 1 / 16
+
+
+class DateIndex:
+    def __init__(self):
+        self._keys: list[tuple[str, str]] = []
+        self._date_by_id: dict[str, str] = {}
+
+    @classmethod
+    def build(cls, expenses) -> "DateIndex":
+        index = cls()
+        index._date_by_id = {e["id"]: e["date"] for e in expenses}
+        index._keys = sorted((date, id) for id, date in index._date_by_id.items())
+        return index
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def add(self, expense: dict):
+        """Inserts at the right position: O(log n) search plus one memmove."""
+        self.remove(expense["id"])
+        self._date_by_id[expense["id"]] = expense["date"]
+        bisect.insort(self._keys, (expense["date"], expense["id"]))
+
+    def remove(self, expense_id: str):
+        date = self._date_by_id.pop(expense_id, None)
+        if date is None:
+            return
+        i = bisect.bisect_left(self._keys, (date, expense_id))
+        del self._keys[i]
+
+    def remove_ids(self, ids: set[str]):
+        """Drops many ids in one O(n) pass instead of one memmove each."""
+        for expense_id in ids:
+            self._date_by_id.pop(expense_id, None)
+        self._keys = [k for k in self._keys if k[1] not in ids]
+
+    def newest(
+        self, ids: set[str] | None = None, start: int = 0, count: int | None = None
+    ) -> list[str]:
+        """Ids newest-first, optionally restricted to `ids`, sliced [start:start+count].
+
+        Walks the ordered keys and stops as soon as the slice is filled. When
+        the restriction is sparse, the matching keys are ranked directly instead.
+        """
+        stop = None if count is None else start + count
+        if ids is None:
+            newest_first = (k[1] for k in reversed(self._keys))
+            return list(itertools.islice(newest_first, start, stop))
+        if len(ids) < len(self._keys) * SPARSE_MATCH_RATIO:
+            keys = ((self._date_by_id[i], i) for i in ids if i in self._date_by_id)
+            if stop is None:
+                ranked = sorted(keys, reverse=True)
+            else:
+                ranked = heapq.nlargest(stop, keys)
+            return [k[1] for k in ranked[start:stop]]
+        newest_first = (k[1] for k in reversed(self._keys) if k[1] in ids)
+        return list(itertools.islice(newest_first, start, stop))
@@ -0,0 +1,26 @@
+"""Memoized parsing of expense date strings.
+
+Expenses store dates as ``YYYY-MM-DD`` strings and there are only a few
+thousand distinct values across years of data, so each string is parsed once
+and every later lookup is a cache hit.
+"""
+
+import datetime
+import functools
+import logging
+
+
+@functools.lru_cache(maxsize=16384)
+def parse(value: str) -> datetime.date | None:
+    """Returns the date for an expense date string, or None if it can't be parsed."""
+    try:
+        return datetime.datetime.strptime(value, "%Y-%m-%d").date()
+    except (TypeError, ValueError) as e:
+        logging.exception(f"Error processing expense date {value!r}: {e}")
+        return None
+
+
+@functools.lru_cache(maxsize=16384)
+def year_month(value: str) -> tuple[int, int] | None:
+    parsed = parse(value)
+    return None if parsed is None else (parsed.year, parsed.month)
@@ -0,0 +1,549 @@
+"""Demo data for a fresh install.
+
+Nothing loads this automatically; run ``python -m app.data.seed`` to copy it
+into the database.
+"""
+
+DEMO_BUDGETS = [
+    {
+        "id": "b1",
+        "name": "Marketing",
+        "type": "Department",
+        "allocated_amount": 50000.0,
+        "period": "Annual",
+    },
+    {
+        "id": "b2",
+        "name": "Engineering",
+        "type": "Department",
+        "allocated_amount": 120000.0,
+        "period": "Annual",
+    },
+    {
+        "id": "b3",
+        "name": "Office Renovation",
+        "type": "Project",
+        "allocated_amount": 15000.0,
+        "period": "One-time",
+    },
+    {
+        "id": "b4",
+        "name": "Software Licenses",
+        "type": "Category",
+        "allocated_amount": 8000.0,
+        "period": "Annual",
+    },
+    {
+        "id": "b5",
+        "name": "Team Events",
+        "type": "Category",
+        "allocated_amount": 5000.0,
+        "period": "Annual",
+    },
+    {
+        "id": "b6",
+        "name": "HR",
+        "type": "Department",
+        "allocated_amount": 30000.0,
+        "period": "Annual",
+    },
+    {
+        "id": "b7",
+        "name": "Sales",
+        "type": "Department",
+        "allocated_amount": 80000.0,
+        "period": "Annual",
+    },
+    {
+        "id": "b8",
+        "name": "Operations",
+        "type": "Department",
+        "allocated_amount": 45000.0,
+        "period": "Annual",
+    },
+    {
+        "id": "b9",
+        "name": "Website Redesign",
+        "type": "Project",
+        "allocated_amount": 25000.0,
+        "period": "One-time",
+    },
+    {
+        "id": "b10",
+        "name": "Q2 Hiring Push",
+        "type": "Project",
+        "allocated_amount": 12000.0,
+        "period": "Q2",
+    },
+]
+
+DEMO_EXPENSES = [
+    {
+        "id": "e1",
+        "date": "2024-01-15",
+        "category": "Software Licenses",
+        "amount": 5000.0,
+        "payment_method": "Bank Transfer",
+        "description": "Annual Enterprise License Renewal",
+        "approval_status": "Approved",
+        "recurring_frequency": "Annual",
+        "has_attachment": True,
+        "tags": ["Software", "Internal"],
+        "splits": [],
+        "comments": [
+            {
+                "id": "c1",
+                "user": "Sarah Marketing",
+                "avatar": "Sarah",
+                "text": "Approved for annual renewal.",
+                "timestamp": "2024-01-16 10:00",
+            }
+        ],
+        "history": [
+            {
+                "action": "Approved",
+                "user": "Sarah Marketing",
+                "timestamp": "2024-01-16 10:00",
+                "note": "Annual renewal",
+            }
+        ],
+        "assigned_approver_id": "",
+        "attachment_url": "https://images.unsplash.com/photo-1554224155-8d04cb21cd6c?auto=format&fit=crop&q=80&w=1000",
+        "submitter_id": "t3",
+    },
+    {
+        "id": "e2",
+        "date": "2024-01-20",
+        "category": "Marketing",
+        "amount": 1200.0,
+        "payment_method": "Credit Card",
+        "description": "Q1 Planning Workshop",
+        "approval_status": "Approved",
+        "recurring_frequency": "One-time",
+        "has_attachment": False,
+        "tags": ["Internal"],
+        "splits": [],
+        "comments": [],
+        "history": [],
+        "assigned_approver_id": "",
+        "attachment_url": "",
+        "submitter_id": "t2",
+    },
+    {
+        "id": "e3",
+        "date": "2024-01-25",
+        "category": "Engineering",
+        "amount": 800.0,
+        "payment_method": "Credit Card",
+        "description": "DevOps Tools",
+        "approval_status": "Approved",
+        "submitter_id": "t3",
+    },
+    {
+        "id": "e4",
+        "date": "2024-02-05",
+        "category": "Engineering",
+        "amount": 3500.0,
+        "payment_method": "Bank Transfer",
+        "description": "AWS Cloud Services - Jan",
+        "approval_status": "Approved",
+        "submitter_id": "t3",
+    },
+    {
+        "id": "e5",
+        "date": "2024-02-10",
+        "category": "Sales",
+        "amount": 1500.0,
+        "payment_method": "Credit Card",
+        "description": "Client Visit - Chicago",
+        "approval_status": "Approved",
+        "submitter_id": "t5",
+    },
+    {
+        "id": "e6",
+        "date": "2024-02-14",
+        "category": "Team Events",
+        "amount": 800.0,
+        "payment_method": "Reimbursement",
+        "description": "Valentine's Day Team Lunch",
+        "approval_status": "Approved",
+        "submitter_id": "t4",
+    },
+    {
+        "id": "e7",
+        "date": "2024-02-28",
+        "category": "Operations",
+        "amount": 450.0,
+        "payment_method": "Credit Card",
+        "description": "Office Supplies Restock",
+        "approval_status": "Approved",
+        "submitter_id": "t6",
+    },
+    {
+        "id": "e8",
+        "date": "2024-03-01",
+        "category": "Marketing",
+        "amount": 1200.5,
+        "payment_method": "Credit Card",
+        "description": "Q1 Ad Campaign Launch",
+        "approval_status": "Approved",
+        "submitter_id": "t2",
+    },
+    {
+        "id": "e9",
+        "date": "2024-03-02",
+        "category": "Engineering",
+        "amount": 3400.0,
+        "payment_method": "Bank Transfer",
+        "description": "AWS Cloud Services - Feb",
+        "approval_status": "Approved",
+        "submitter_id": "t3",
+    },
+    {
+        "id": "e10",
+        "date": "2024-03-05",
+        "category": "Office Renovation",
+        "amount": 850.0,
+        "payment_method": "Invoice",
+        "description": "New Ergonomic Chairs",
+        "approval_status": "Approved",
+        "submitter_id": "t6",
+    },
+    {
+        "id": "e11",
+        "date": "2024-03-10",
+        "category": "HR",
+        "amount": 2500.0,
+        "payment_method": "Invoice",
+        "description": "Recruitment Agency Fee",
+        "approval_status": "Pending",
+        "submitter_id": "t4",
+    },
+    {
+        "id": "e12",
+        "date": "2024-03-15",
+        "category": "Sales",
+        "amount": 3200.0,
+        "payment_method": "Credit Card",
+        "description": "Q1 Sales Conference Tickets",
+        "approval_status": "Approved",
+        "submitter_id": "t5",
+    },
+    {
+        "id": "e13",
+        "date": "2024-03-20",
+        "category": "Engineering",
+        "amount": 2100.0,
+        "payment_method": "Credit Card",
+        "description": "New Test Devices",
+        "approval_status": "Rejected",
+        "submitter_id": "t3",
+    },
+    {
+        "id": "e14",
+        "date": "2024-04-02",
+        "category": "Marketing",
+        "amount": 8000.0,
+        "payment_method": "Invoice",
+        "description": "Q2 Media Buy",
+        "approval_status": "Approved",
+        "submitter_id": "t2",
+    },
+    {
+        "id": "e15",
+        "date": "2024-04-05",
+        "category": "Engineering",
+        "amount": 3600.0,
+        "payment_method": "Bank Transfer",
+        "description": "AWS Cloud Services - Mar",
+        "approval_status": "Approved",
+        "submitter_id": "t3",
+    },
+    {
+        "id": "e16",
+        "date": "2024-04-10",
+        "category": "Website Redesign",
+        "amount": 5000.0,
+        "payment_method": "Bank Transfer",
+        "description": "Design Agency Deposit",
+        "approval_status": "Approved",
+        "submitter_id": "t2",
+    },
+    {
+        "id": "e17",
+        "date": "2024-04-15",
+        "category": "Q2 Hiring Push",
+        "amount": 2000.0,
+        "payment_method": "Credit Card",
+        "description": "LinkedIn Job Slots",
+        "approval_status": "Approved",
+        "submitter_id": "t4",
+    },
+    {
+        "id": "e18",
+        "date": "2024-04-22",
+        "category": "Operations",
+        "amount": 1200.0,
+        "payment_method": "Invoice",
+        "description": "HVAC Maintenance",
+        "approval_status": "Pending",
+        "submitter_id": "t6",
+    },
+    {
+        "id": "e19",
+        "date": "2024-05-03",
+        "category": "Engineering",
+        "amount": 4000.0,
+        "payment_method": "Bank Transfer",
+        "description": "AWS Cloud Services - Apr",
+        "approval_status": "Approved",
+        "submitter_id": "t3",
+    },
+    {
+        "id": "e20",
+        "date": "2024-05-10",
+        "category": "HR",
+        "amount": 1500.0,
+        "payment_method": "Credit Card",
+        "description": "Manager Training Workshop",
+        "approval_status": "Approved",
+        "submitter_id": "t4",
+    },
+    {
+        "id": "e21",
+        "date": "2024-05-15",
+        "category": "Website Redesign",
+        "amount": 8000.0,
+        "payment_method": "Bank Transfer",
+        "description": "Development Milestone 1",
+        "approval_status": "Approved",
+        "submitter_id": "t2",
+    },
+    {
+        "id": "e22",
+        "date": "2024-05-20",
+        "category": "Marketing",
+        "amount": 450.0,
+        "payment_method": "Reimbursement",
+        "description": "Client Gifts",
+        "approval_status": "Rejected",
+        "submitter_id": "t2",
+    },
+    {
+        "id": "e23",
+        "date": "2024-06-01",
+        "category": "Team Events",
+        "amount": 1200.0,
+        "payment_method": "Credit Card",
+        "description": "Summer Team Outing",
+        "approval_status": "Pending",
+        "submitter_id": "t4",
+    },
+    {
+        "id": "e24",
+        "date": "2024-06-05",
+        "category": "Engineering",
+        "amount": 4200.0,
+        "payment_method": "Bank Transfer",
+        "description": "AWS Cloud Services - May",
+        "approval_status": "Approved",
+        "submitter_id": "t3",
+    },
+    {
+        "id": "e25",
+        "date": "2024-06-12",
+        "category": "Sales",
+        "amount": 4000.0,
+        "payment_method": "Credit Card",
+        "description": "Annual Client Dinner",
+        "approval_status": "Approved",
+        "submitter_id": "t5",
+    },
+    {
+        "id": "e26",
+        "date": "2024-06-25",
+        "category": "Office Renovation",
+        "amount": 5500.0,
+        "payment_method": "Invoice",
+        "description": "Painting and Flooring",
+        "approval_status": "Approved",
+        "submitter_id": "t6",
+    },
+    {
+        "id": "e27",
+        "date": "2024-06-28",
+        "category": "Q2 Hiring Push",
+        "amount": 3500.0,
+        "payment_method": "Invoice",
+        "description": "Headhunter Success Fee",
+        "approval_status": "Pending",
+        "submitter_id": "t4",
+    },
+]
+
+DEMO_GOALS = [
+    {
+        "id": "g1",
+        "name": "Emergency Fund",
+        "target_amount": 20000.0,
+        "current_amount": 15000.0,
+        "deadline": "2024-12-31",
+        "category": "Savings",
+        "status": "On Track",
+        "notes": "3 months of operating expenses",
+    },
+    {
+        "id": "g2",
+        "name": "New Office Equipment",
+        "target_amount": 5000.0,
+        "current_amount": 1200.0,
+        "deadline": "2024-06-30",
+        "category": "Equipment",
+        "status": "At Risk",
+        "notes": "Laptops and monitors for new hires",
+    },
+    {
+        "id": "g3",
+        "name": "Team Retreat",
+        "target_amount": 10000.0,
+        "current_amount": 10000.0,
+        "deadline": "2024-08-15",
+        "category": "Events",
+        "status": "Completed",
+        "notes": "Annual summer gathering",
+    },
+    {
+        "id": "g4",
+        "name": "Software Migration",
+        "target_amount": 8000.0,
+        "current_amount": 3500.0,
+        "deadline": "2024-09-01",
+        "category": "Technology",
+        "status": "On Track",
+        "notes": "Moving to new CRM",
+    },
+]
+
+DEMO_TEAM_MEMBERS = [
+    {
+        "id": "t1",
+        "name": "Alex Finance",
+        "role": "Admin",
+        "department": "Finance",
+        "avatar_seed": "Felix",
+        "email": "alex@company.com",
+        "phone": "+1 (555) 0101",
+        "status": "Active",
+        "joined_date": "2023-01-15",
+        "assigned_budget": 0.0,
+    },
+    {
+        "id": "t2",
+        "name": "Sarah Marketing",
+        "role": "Department Head",
+        "department": "Marketing",
+        "avatar_seed": "Sarah",
+        "email": "sarah@company.com",
+        "phone": "+1 (555) 0102",
+        "status": "Active",
+        "joined_date": "2023-02-01",
+        "assigned_budget": 50000.0,
+    },
+    {
+        "id": "t3",
+        "name": "Mike Engineering",
+        "role": "CTO",
+        "department": "Engineering",
+        "avatar_seed": "Mike",
+        "email": "mike@company.com",
+        "phone": "+1 (555) 0103",
+        "status": "Active",
+        "joined_date": "2023-01-10",
+        "assigned_budget": 120000.0,
+    },
+    {
+        "id": "t4",
+        "name": "Jessica HR",
+        "role": "HR Manager",
+        "department": "HR",
+        "avatar_seed": "Jessica",
+        "email": "jessica@company.com",
+        "phone": "+1 (555) 0104",
+        "status": "Remote",
+        "joined_date": "2023-03-15",
+        "assigned_budget": 30000.0,
+    },
+    {
+        "id": "t5",
+        "name": "David Sales",
+        "role": "VP of Sales",
+        "department": "Sales",
+        "avatar_seed": "David",
+        "email": "david@company.com",
+        "phone": "+1 (555) 0105",
+        "status": "On Leave",
+        "joined_date": "2023-04-01",
+        "assigned_budget": 80000.0,
+    },
+    {
+        "id": "t6",
+        "name": "Emily Ops",
+        "role": "Operations Manager",
+        "department": "Operations",
+        "avatar_seed": "Emily",
+        "email": "emily@company.com",
+        "phone": "+1 (555) 0106",
+        "status": "Active",
+        "joined_date": "2023-05-12",
+        "assigned_budget": 45000.0,
+    },
+]
+
+# Newest first, as shown in the activity feed.
+DEMO_ACTIVITIES = [
+    {
+        "id": "a1",
+        "user_name": "Sarah Marketing",
+        "user_avatar": "Sarah",
+        "action": "approved expense",
+        "target": "Q2 Media Buy ($8,000)",
+        "timestamp": "2 hours ago",
+        "type": "expense",
+    },
+    {
+        "id": "a2",
+        "user_name": "Mike Engineering",
+        "user_avatar": "Mike",
+        "action": "created budget",
+        "target": "AI Research Project",
+        "timestamp": "5 hours ago",
+        "type": "budget",
+    },
+    {
+        "id": "a3",
+        "user_name": "Alex Finance",
+        "user_avatar": "Felix",
+        "action": "updated settings",
+        "target": "Global Currency Format",
+        "timestamp": "1 day ago",
+        "type": "system",
+    },
+    {
+        "id": "a4",
+        "user_name": "Jessica HR",
+        "user_avatar": "Jessica",
+        "action": "added member",
+        "target": "Tom Intern",
+        "timestamp": "1 day ago",
+        "type": "system",
+    },
+    {
+        "id": "a5",
+        "user_name": "David Sales",
+        "user_avatar": "David",
+        "action": "exceeded budget",
+        "target": "Travel Q1",
+        "timestamp": "2 days ago",
+        "type": "warning",
+    },
+]
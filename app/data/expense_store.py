@@ -0,0 +1,246 @@
+"""Process-wide expense rows, spend ledger and indexes shared by every session.
+
+Sessions keep only their view parameters (page, filters, selection) and the
+store `version` their vars were computed from. They read rows and aggregates
+from the one ``STORE``, so the dataset is never copied into, or pickled with,
+a session's state.
+
+Every write goes through the store, which writes SQLite first and then applies
+the same delta to the ledger and indexes and bumps `version`. Writes run on the
+event loop. Loads run on a worker thread and are swapped in on the loop, and a
+load that overlapped a write is retried so the write is not lost.
+
+Other processes (more than one backend worker, or ``app.data.seed``) write the
+same database. The store remembers the ``storage.expenses_version`` its copy
+matches; `refresh`, which every page load runs, rereads everything once that
+counter has moved on for any reason other than the store's own writes.
+"""
+
+import asyncio
+import collections
+import datetime
+import logging
+import os
+from app.data import forecast, ledger, recurring, storage
+from app.data.date_index import DateIndex
+from app.data.memo import VersionedMemo
+from app.data.search_index import ExpenseSearchIndex
+
+LEDGER_DEBUG = os.environ.get("BUDGET_TRACKER_LEDGER_DEBUG", "") == "1"
+# Filter results kept for the current version, shared by sessions paging
+# through the same search.
+FILTER_CACHE_SIZE = 64
+
+
+def load_snapshot() -> tuple:
+    """Loads expenses with their ledger and indexes, and the expenses_version
+    read first, which they are at least as new as; safe to run off the event
+    loop."""
+    db_version = storage.expenses_version()
+    expenses = storage.load_expenses()
+    return (
+        db_version,
+        {e["id"]: e for e in expenses},
+        storage.load_ledger(),
+        ExpenseSearchIndex.build(expenses),
+        DateIndex.build(expenses),
+    )
+
+
+class ExpenseStore:
+    def __init__(self):
+        # Rows keyed by id, in insertion order. Stored dicts are replaced on
+        # change, never mutated, so rows handed to a session stay as read.
+        self.expenses: dict[str, dict] = {}
+        self.ledger: dict = ledger.empty_ledger()
+        self.search_index = ExpenseSearchIndex()
+        self.date_index = DateIndex()
+        self.template_ids: set[str] = set()
+        # Bumped on every change; sessions key their vars and memos on it.
+        self.version = 0
+        # The storage.expenses_version this copy matches; None once it is
+        # known to be stale.
+        self.db_version: int | None = None
+        self.memo = VersionedMemo()
+        self.materialized_on: datetime.date | None = None
+        self._filters: collections.OrderedDict = collections.OrderedDict()
+        self._loading = asyncio.Lock()
+
+    def stale(self) -> bool:
+        """Whether the database has changes this copy lacks."""
+        return self.db_version != storage.expenses_version()
+
+    async def refresh(self, today: datetime.date):
+        """Loads the store on first use or once it is stale, and stores the
+        recurring occurrences due by `today`, once per day."""
+        if self.materialized_on == today and not self.stale():
+            return
+        async with self._loading:
+            if self.materialized_on != today:
+                created = await asyncio.to_thread(
+                    storage.materialize_recurring, today
+                )
+                # A store not loaded yet, or stale, picks them up below.
+                if created and self.db_version is not None:
+                    self._add_materialized(created, today)
+                self.materialized_on = today
+            if self.stale():
+                await self._load()
+
+    async def reload(self):
+        """Rereads everything from storage, e.g. after a bulk import."""
+        async with self._loading:
+            await self._load()
+
+    async def _load(self):
+        while True:
+            version = self.version
+            snapshot = await asyncio.to_thread(load_snapshot)
+            if self.version == version:
+                break
+        (
+            self.db_version,
+            self.expenses,
+            self.ledger,
+            self.search_index,
+            self.date_index,
+        ) = snapshot
+        self.template_ids = {
+            id for id, e in self.expenses.items() if recurring.is_template(e)
+        }
+        self._changed()
+
+    def filtered_ids(self, search: str, category: str) -> set[str] | None:
+        """Ids passing the search and category filters, or None when unfiltered."""
+        key = (self.version, search, category)
+        if key in self._filters:
+            self._filters.move_to_end(key)
+            return self._filters[key]
+        ids = self.search_index.search(search)
+        if category != "All":
+            category_ids = self.search_index.category_ids(category)
+            ids = category_ids if ids is None else ids & category_ids
+        self._filters[key] = ids
+        if len(self._filters) > FILTER_CACHE_SIZE:
+            self._filters.popitem(last=False)
+        return ids
+
+    def forecast(self, model: str, start_month: int, horizon: int) -> list[float]:
+        """`forecast.project` over the ledger, memoized per model for the
+        current version, so switching models back and forth, or sessions
+        asking for the same fit, do not refit."""
+        name = f"forecast:{model}"
+        key = (self.version, start_month, horizon)
+        projected = self.memo.get(name, key)
+        if projected is None:
+            projected = self.memo.put(
+                name, key, forecast.project(self.ledger, model, start_month, horizon)
+            )
+        return projected
+
+    def add(self, expense: dict):
+        storage.save_expense(expense)
+        self._wrote()
+        self.expenses[expense["id"]] = expense
+        self._apply(None, expense)
+        self._changed()
+
+    def save(self, expense: dict) -> dict | None:
+        """Stores a new version of an expense; returns the version it replaced.
+
+        `recurring_through` only moves forward, as in storage, so a template
+        edited from a copy older than the last materialization keeps its date.
+        """
+        old = self.expenses.get(expense["id"])
+        if old is not None and old["recurring_through"] > expense["recurring_through"]:
+            expense = {**expense, "recurring_through": old["recurring_through"]}
+        storage.save_expense(expense)
+        self._wrote()
+        self.expenses[expense["id"]] = expense
+        self._apply(old, expense)
+        self._changed()
+        return old
+
+    def delete(self, ids) -> list[dict]:
+        """Deletes the expenses with these ids and returns them."""
+        removed = [self.expenses.pop(id) for id in ids if id in self.expenses]
+        removed_ids = {e["id"] for e in removed}
+        storage.delete_expenses(removed_ids)
+        self._wrote()
+        for e in removed:
+            ledger.apply_expense(self.ledger, e, -1)
+            self.search_index.remove(e["id"])
+        self.date_index.remove_ids(removed_ids)
+        self.template_ids -= removed_ids
+        self._changed()
+        return removed
+
+    def set_status(self, ids, status: str) -> list[dict]:
+        """Sets the approval status of these expenses and returns them."""
+        changed = []
+        for id in ids:
+            old = self.expenses.get(id)
+            if old is None:
+                continue
+            new = self.expenses[id] = {**old, "approval_status": status}
+            ledger.apply_expense(self.ledger, old, -1)
+            ledger.apply_expense(self.ledger, new)
+            changed.append(new)
+        storage.set_expense_status([e["id"] for e in changed], status)
+        self._wrote()
+        self._changed()
+        return changed
+
+    def materialize(self, today: datetime.date):
+        """Stores the recurring occurrences due by `today` and adds them here."""
+        created = storage.materialize_recurring(today)
+        if created:
+            self._add_materialized(created, today)
+
+    def _add_materialized(self, created: list[dict], today: datetime.date):
+        """Adds occurrences just stored, and moves their templates' dates as
+        storage did."""
+        self._wrote()
+        for e in created:
+            self.expenses[e["id"]] = e
+            self._apply(None, e)
+        for id in {e["recurring_parent_id"] for e in created}:
+            old = self.expenses.get(id)
+            if old is not None and old["recurring_through"] < today.isoformat():
+                self.expenses[id] = {**old, "recurring_through": today.isoformat()}
+        self._changed()
+
+    def _wrote(self):
+        """Follows one write of the store's own to storage. Any other change
+        to expenses_version came from elsewhere and makes the copy stale."""
+        version = storage.expenses_version()
+        if self.db_version is not None and version == self.db_version + 1:
+            self.db_version = version
+        else:
+            self.db_version = None
+
+    def _apply(self, old: dict | None, new: dict | None):
+        """Applies the ledger and index deltas for replacing `old` with `new`."""
+        if old is not None:
+            ledger.apply_expense(self.ledger, old, -1)
+            self.search_index.remove(old["id"])
+            self.date_index.remove(old["id"])
+            self.template_ids.discard(old["id"])
+        if new is not None:
+            ledger.apply_expense(self.ledger, new)
+            self.search_index.add(new)
+            self.date_index.add(new)
+            if recurring.is_template(new):
+                self.template_ids.add(new["id"])
+
+    def _changed(self):
+        """Bumps the version; in debug mode, checks the ledger against a recompute."""
+        self.version += 1
+        self._filters.clear()
+        if not LEDGER_DEBUG:
+            return
+        for problem in ledger.ledger_mismatches(self.ledger, self.expenses.values()):
+            logging.error(f"Spend ledger drift: {problem}")
+
+
+STORE = ExpenseStore()
@@ -0,0 +1,129 @@
+"""Streaming expense exports.
+
+Rows are read from SQLite a batch at a time and written straight to a file, so
+exporting millions of expenses needs memory for one batch rather than the
+whole export. Files are written under a ``.part`` name and renamed when
+complete. Parquet is written with pyarrow, listed in requirements.txt; where it
+is not installed ``HAS_PYARROW`` is False and only CSV and JSONL are offered.
+"""
+
+import csv
+import gzip
+import json
+import os
+from app.data import storage
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+    pq = None
+
+HAS_PYARROW = pa is not None
+CSV_COLUMNS = (
+    ("date", "Date"),
+    ("category", "Category"),
+    ("description", "Description"),
+    ("amount", "Amount"),
+    ("payment_method", "Payment Method"),
+    ("approval_status", "Status"),
+    ("recurring_frequency", "Recurring"),
+)
+COLUMNS = tuple(column for column, _ in CSV_COLUMNS)
+FORMATS = ["csv", "jsonl", "parquet"] if HAS_PYARROW else ["csv", "jsonl"]
+BATCH_ROWS = 2000
+
+
+class Progress:
+    """Rows processed so far, updated by a worker thread and polled by the UI."""
+
+    def __init__(self, total: int):
+        self.total = total
+        self.rows = 0
+
+    @property
+    def percent(self) -> int:
+        if self.total <= 0:
+            return 100
+        return min(100, self.rows * 100 // self.total)
+
+
+def filename(stem: str, fmt: str, compress: bool = False) -> str:
+    name = f"{stem}.{fmt}"
+    if compress and fmt != "parquet":
+        name += ".gz"
+    return name
+
+
+def open_text(path, compress: bool):
+    if compress:
+        return gzip.open(path, "wt", encoding="utf-8", newline="")
+    return open(path, "w", encoding="utf-8", newline="")
+
+
+def _write_csv(path, batches, compress: bool, progress):
+    with open_text(path, compress) as f:
+        writer = csv.writer(f)
+        writer.writerow([header for _, header in CSV_COLUMNS])
+        for batch in batches:
+            writer.writerows(batch)
+            progress(len(batch))
+
+
+def _write_jsonl(path, batches, compress: bool, progress):
+    with open_text(path, compress) as f:
+        for batch in batches:
+            f.writelines(json.dumps(dict(zip(COLUMNS, row))) + "\n" for row in batch)
+            progress(len(batch))
+
+
+def _write_parquet(path, batches, compress: bool, progress):
+    schema = pa.schema(
+        [(c, pa.float64() if c == "amount" else pa.string()) for c in COLUMNS]
+    )
+    with pq.ParquetWriter(path, schema) as writer:
+        for batch in batches:
+            arrays = [
+                pa.array(values, type=field.type)
+                for values, field in zip(zip(*batch), schema)
+            ]
+            writer.write_batch(pa.record_batch(arrays, schema=schema))
+            progress(len(batch))
+
+
+WRITERS = {"csv": _write_csv, "jsonl": _write_jsonl, "parquet": _write_parquet}
+
+
+def write_expenses(
+    path,
+    fmt: str = "csv",
+    ids=None,
+    compress: bool = False,
+    progress: Progress | None = None,
+) -> int:
+    """Streams expenses (all, or only `ids`) into `path` and returns the row count.
+
+    Parquet files use Parquet's own compression, so `compress` only gzips the
+    text formats.
+    """
+    if fmt not in FORMATS:
+        raise ValueError(f"Unsupported export format: {fmt}")
+    written = 0
+
+    def advance(rows: int):
+        nonlocal written
+        written += rows
+        if progress is not None:
+            progress.rows = written
+
+    partial = f"{path}.part"
+    try:
+        batches = storage.iter_expense_batches(COLUMNS, BATCH_ROWS, ids)
+        WRITERS[fmt](partial, batches, compress, advance)
+        os.replace(partial, path)
+    except BaseException:
+        if os.path.exists(partial):
+            os.remove(partial)
+        raise
+    return written
@@ -0,0 +1,105 @@
+"""Spend forecasts fitted to the monthly rollup series.
+
+History is the dense month x category matrix from ``app.data.trends``, taken
+from the ledger's cube, so fitting costs the same however many expenses there
+are. Every model fits all matrix columns at once as NumPy arrays:
+
+- ``linear``: least-squares trend line.
+- ``holt_winters``: additive Holt-Winters with a twelve-month season (falls
+  back to the trend line until two seasons of history exist).
+- ``per_category``: Holt-Winters fitted to each category, then summed.
+- ``average``: the mean of recent months with spend plus a flat monthly growth.
+
+NumPy is listed in requirements.txt. Where it is not installed ``HAS_NUMPY``
+is False and only ``average`` is offered, so the model picker shrinks to it.
+"""
+
+from app.data import trends
+from app.data.ledger import MONEY_PLACES
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+HAS_NUMPY = np is not None
+MODELS = (
+    ("average", "linear", "holt_winters", "per_category") if HAS_NUMPY else ("average",)
+)
+DEFAULT_MODEL = "holt_winters" if HAS_NUMPY else "average"
+MODEL_LABELS = {
+    "average": "Average + 2% growth",
+    "linear": "Linear trend",
+    "holt_winters": "Seasonal (Holt-Winters)",
+    "per_category": "Seasonal per category",
+}
+SEASON = 12
+GROWTH_PER_MONTH = 0.02
+# Holt-Winters smoothing for level, trend and season.
+ALPHA, BETA, GAMMA = 0.3, 0.1, 0.2
+
+
+def _average(totals: list[float], horizon: int) -> list[float]:
+    """The mean of the months with spend among the last twelve of `totals`,
+    growing GROWTH_PER_MONTH a month from the first projected one.
+
+    This is not the inline projection the reports page used before: that
+    averaged the current calendar year's months with spend, the partial
+    current month included, and started the growth a month later.
+    """
+    recent = [t for t in totals[-SEASON:] if t > 0]
+    average = sum(recent) / max(1, len(recent))
+    return [average * (1 + step * GROWTH_PER_MONTH) for step in range(horizon)]
+
+
+def _linear(history, horizon: int):
+    n = len(history)
+    if n == 1:
+        return np.repeat(history, horizon, axis=0)
+    t = np.arange(n, dtype=np.float64)
+    centered = t - t.mean()
+    mean = history.mean(axis=0)
+    slope = centered @ (history - mean) / (centered @ centered)
+    future = np.arange(n, n + horizon, dtype=np.float64)[:, None]
+    return mean + slope * (future - t.mean())
+
+
+def _holt_winters(history, horizon: int):
+    n = len(history)
+    if n < 2 * SEASON:
+        return _linear(history, horizon)
+    level = history[:SEASON].mean(axis=0)
+    trend = (history[SEASON : 2 * SEASON].mean(axis=0) - level) / SEASON
+    seasonal = history[:SEASON] - level
+    for t in range(SEASON, n):
+        season = seasonal[t % SEASON]
+        previous = level
+        level = ALPHA * (history[t] - season) + (1 - ALPHA) * (level + trend)
+        trend = BETA * (level - previous) + (1 - BETA) * trend
+        seasonal[t % SEASON] = GAMMA * (history[t] - level) + (1 - GAMMA) * season
+    steps = np.arange(1, horizon + 1)
+    return level + steps[:, None] * trend + seasonal[(n + steps - 1) % SEASON]
+
+
+def project(ledger, model: str, start_month: int, horizon: int) -> list[float]:
+    """Projected non-rejected spend for `horizon` months from `start_month`
+    (a month index, year * 12 + month - 1), fitted to the complete months
+    before it. Months between the last spend and `start_month` count as zero.
+    """
+    if model not in MODELS:
+        raise ValueError(f"Unknown forecast model {model!r}")
+    history = trends.month_category_matrix(ledger, ("", trends.month_key(start_month)))
+    if history.first_month is None or horizon <= 0:
+        return [0.0] * max(0, horizon)
+    idle = start_month - history.first_month - len(history.months)
+    if model == "average":
+        totals = [sum(row) for row in history.values] + [0.0] * idle
+        return [round(p, MONEY_PLACES) for p in _average(totals, horizon)]
+    matrix = np.asarray(history.values, dtype=np.float64)
+    matrix = np.vstack([matrix, np.zeros((idle, matrix.shape[1]))])
+    if model == "per_category":
+        projected = _holt_winters(matrix, horizon).clip(min=0).sum(axis=1)
+    else:
+        fit = _linear if model == "linear" else _holt_winters
+        projected = fit(matrix.sum(axis=1, keepdims=True), horizon)[:, 0]
+    return projected.clip(min=0).round(MONEY_PLACES).tolist()
@@ -0,0 +1,241 @@
+"""Bulk import of expenses from the layout the exports write.
+
+Files are read and validated a chunk at a time, optionally across a process
+pool, and each chunk of valid rows is inserted with one ``executemany``.
+Rejected rows are collected with their line number and reason for a report.
+Rows are imported as the One-time expenses they record: a file's Recurring
+column is not read, since an export lists each occurrence already stored and
+a backfill of past bills is history, not a set of schedules to expand.
+Callers rebuild their in-memory aggregates once after the import instead of
+once per row. Excel files need openpyxl, which is optional: without it
+``HAS_OPENPYXL`` is False and only CSV (plain or gzipped) is accepted.
+"""
+
+import collections
+import concurrent.futures
+import csv
+import datetime
+import functools
+import gzip
+import os
+import uuid
+from app.data import storage
+from app.data.export import CSV_COLUMNS
+from app.data.ledger import MONEY_PLACES, valid_amount
+
+try:
+    import openpyxl
+except ImportError:
+    openpyxl = None
+
+HAS_OPENPYXL = openpyxl is not None
+EXTENSIONS = (".csv", ".csv.gz", ".xlsx") if HAS_OPENPYXL else (".csv", ".csv.gz")
+CHUNK_ROWS = 5000
+# Validation runs in this many worker processes; 0 or 1 validates in-process.
+WORKERS = int(os.environ.get("BUDGET_TRACKER_IMPORT_WORKERS", "0"))
+PAYMENT_METHODS = ("Credit Card", "Bank Transfer", "Invoice", "Reimbursement", "Cash")
+APPROVAL_STATUSES = ("Pending", "Approved", "Rejected")
+REQUIRED_COLUMNS = ("date", "category", "description", "amount")
+# Both the export's header labels and the raw column names are accepted.
+HEADER_COLUMNS = {label.lower(): column for column, label in CSV_COLUMNS} | {
+    column: column for column, _ in CSV_COLUMNS
+}
+
+
+# validate_row fills these leading storage columns; the rest take defaults,
+# encoded once and shared by every imported row.
+VALIDATED_COLUMNS = (
+    "id",
+    "date",
+    "category",
+    "amount",
+    "payment_method",
+    "description",
+    "approval_status",
+)
+if storage.EXPENSE_COLUMNS[: len(VALIDATED_COLUMNS)] != VALIDATED_COLUMNS:
+    raise RuntimeError("VALIDATED_COLUMNS must lead storage.EXPENSE_COLUMNS")
+_DEFAULT_TAIL = storage.expense_to_row(storage.EXPENSE_DEFAULTS)[
+    len(VALIDATED_COLUMNS) :
+]
+
+
+class ImportResult:
+    def __init__(self, header: list[str]):
+        self.header = header
+        self.imported = 0
+        self.rejected: list[tuple[int, str, list]] = []
+
+
+def column_positions(header) -> dict[str, int]:
+    """Maps expense columns to their index in `header`; raises if any are missing."""
+    positions = {}
+    for i, name in enumerate(header or ()):
+        column = HEADER_COLUMNS.get(str(name or "").strip().lower())
+        if column is not None:
+            positions.setdefault(column, i)
+    missing = [c for c in REQUIRED_COLUMNS if c not in positions]
+    if missing:
+        raise ValueError(f"Missing required columns: {', '.join(missing)}")
+    return positions
+
+
+def _text(value) -> str:
+    return "" if value is None else str(value).strip()
+
+
+@functools.lru_cache(maxsize=16384)
+def _parse_date_text(value: str) -> str | None:
+    if len(value) != 10 or value[4] != "-" or value[7] != "-":
+        return None
+    try:
+        return datetime.date.fromisoformat(value).isoformat()
+    except ValueError:
+        return None
+
+
+def _parse_date(value) -> str | None:
+    if isinstance(value, datetime.datetime):
+        return value.date().isoformat()
+    if isinstance(value, datetime.date):
+        return value.isoformat()
+    return _parse_date_text(_text(value))
+
+
+def _parse_amount(value) -> float | None:
+    try:
+        amount = float(_text(value).replace(",", "").lstrip("$"))
+    except ValueError:
+        return None
+    if not valid_amount(amount):
+        return None
+    return round(amount, MONEY_PLACES)
+
+
+def validate_row(positions: dict[str, int], row) -> tuple[tuple | None, str]:
+    """Returns (storage row, "") for a valid row, or (None, reason) for a
+    rejected one."""
+    values = {
+        column: row[i] if i < len(row) else None for column, i in positions.items()
+    }
+    date = _parse_date(values["date"])
+    if date is None:
+        return None, "Date must be YYYY-MM-DD"
+    amount = _parse_amount(values["amount"])
+    if amount is None:
+        return None, "Amount must be a number, zero or more"
+    category = _text(values["category"])
+    if not category:
+        return None, "Category is required"
+    description = _text(values["description"])
+    if not description:
+        return None, "Description is required"
+    payment_method = _text(values.get("payment_method")) or "Credit Card"
+    if payment_method not in PAYMENT_METHODS:
+        return None, f"Unknown payment method {payment_method!r}"
+    status = _text(values.get("approval_status")) or "Pending"
+    if status not in APPROVAL_STATUSES:
+        return None, f"Unknown status {status!r}"
+    values = (
+        str(uuid.uuid4()),
+        date,
+        category,
+        amount,
+        payment_method,
+        description,
+        status,
+    )
+    return values + _DEFAULT_TAIL, ""
+
+
+def validate_chunk(positions: dict[str, int], first_line: int, rows: list) -> tuple:
+    """Validates one chunk; module-level so it can run in a worker process.
+
+    Returns (rows, rejected) where rows are ready for
+    `storage.insert_expense_rows` and rejected holds (line, reason, row).
+    """
+    valid, rejected = [], []
+    for line, row in enumerate(rows, first_line):
+        if not any(_text(v) for v in row):
+            continue
+        values, reason = validate_row(positions, row)
+        if values is None:
+            rejected.append((line, reason, [_text(v) for v in row]))
+        else:
+            valid.append(values)
+    return valid, rejected
+
+
+def read_rows(path):
+    """Yields the rows of a CSV, gzipped CSV or Excel file, header first."""
+    name = str(path).lower()
+    if name.endswith(".xlsx"):
+        if not HAS_OPENPYXL:
+            raise ValueError("Excel import needs openpyxl installed.")
+        workbook = openpyxl.load_workbook(path, read_only=True, data_only=True)
+        try:
+            yield from workbook.active.iter_rows(values_only=True)
+        finally:
+            workbook.close()
+        return
+    opener = gzip.open if name.endswith(".gz") else open
+    with opener(path, "rt", encoding="utf-8-sig", newline="") as f:
+        yield from csv.reader(f)
+
+
+def _chunks(rows, size: int):
+    """Yields (first line number, rows) pairs; data starts on line 2."""
+    chunk, first_line = [], 2
+    for row in rows:
+        chunk.append(row)
+        if len(chunk) == size:
+            yield first_line, chunk
+            first_line += size
+            chunk = []
+    if chunk:
+        yield first_line, chunk
+
+
+def _validate_in_pool(positions, chunks, workers: int):
+    """Validates chunks across processes, keeping at most 2 chunks per worker
+    in flight so a large file is never fully buffered."""
+    with concurrent.futures.ProcessPoolExecutor(workers) as pool:
+        pending = collections.deque()
+        for first_line, rows in chunks:
+            pending.append(pool.submit(validate_chunk, positions, first_line, rows))
+            if len(pending) >= workers * 2:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def import_expenses(path, workers: int = WORKERS, progress=None) -> ImportResult:
+    """Validates and inserts every row of `path`, a chunk at a time.
+
+    `progress`, if given, has its `rows` attribute advanced as rows are read.
+    """
+    rows = read_rows(path)
+    header = next(rows, None)
+    positions = column_positions(header)
+    chunks = _chunks(rows, CHUNK_ROWS)
+    if workers > 1:
+        results = _validate_in_pool(positions, chunks, workers)
+    else:
+        results = (validate_chunk(positions, line, chunk) for line, chunk in chunks)
+    result = ImportResult([_text(name) for name in header])
+    for valid, rejected in results:
+        storage.insert_expense_rows(valid)
+        result.imported += len(valid)
+        result.rejected.extend(rejected)
+        if progress is not None:
+            progress.rows = result.imported + len(result.rejected)
+    return result
+
+
+def write_reject_report(path, result: ImportResult):
+    """Writes the rejected rows, as read, after their line number and reason."""
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(["Line", "Reason", *result.header])
+        for line, reason, row in result.rejected:
+            writer.writerow([line, reason, *row])
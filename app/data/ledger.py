@@ -0,0 +1,179 @@
+"""Running spend ledger maintained by deltas from expense mutations.
+
+The ledger is kept as plain nested dicts/lists. One ledger, held by the
+shared ``app.data.expense_store``, serves every session; sessions recompute
+the vars reading it when the store's version changes.
+
+Layout::
+
+    {
+        "category": {category: [spent, count]},    # non-rejected rows only
+        "month": {"YYYY-MM": [spent, count]},      # non-rejected rows only
+        "member": {submitter_id: [spent, count]},  # non-rejected, attributed
+        "member_month": {("YYYY-MM", submitter_id): [spent, count]},  # same rows
+        "status": {status: [amount, count]},       # every row
+        "cube": {("YYYY-MM", category, status): [amount, count]},  # every row
+    }
+
+The cube is the monthly rollup the report charts read; it stays as small as
+(months x categories x statuses) however many expenses there are, and
+member_month does the same for ranged per-member totals. The category
+and cube sections count each expense's `allocations`, so a split expense adds
+to every category it is split across; the other sections count whole amounts.
+"""
+
+import logging
+import math
+from app.data import dates
+
+MONEY_PLACES = 2
+
+
+def empty_ledger() -> dict:
+    return {
+        "category": {},
+        "month": {},
+        "member": {},
+        "member_month": {},
+        "status": {},
+        "cube": {},
+    }
+
+
+def valid_amount(amount: float) -> bool:
+    """Whether an expense may hold `amount`: a finite number, zero or more.
+    The expense form and the importer both check it."""
+    return math.isfinite(amount) and amount >= 0
+
+
+def _bump(bucket, key: str, amount: float, sign: int):
+    entry = bucket.get(key)
+    if entry is None:
+        if sign < 0:
+            logging.warning(f"Ledger underflow for {key!r}")
+            return
+        bucket[key] = [round(amount, MONEY_PLACES), 1]
+        return
+    count = entry[1] + sign
+    if count <= 0:
+        del bucket[key]
+        return
+    entry[0] = round(entry[0] + sign * amount, MONEY_PLACES)
+    entry[1] = count
+
+
+def allocations(expense: dict) -> dict[str, float]:
+    """The expense's amount per category: positive splits go to their own
+    categories and any unsplit remainder stays in the expense's category.
+
+    Splits adding up to more than the amount are scaled down to it, so the
+    allocations always sum to the amount.
+    """
+    amount = expense.get("amount", 0) or 0
+    category = expense.get("category", "")
+    shares: dict[str, float] = {}
+    for split in expense.get("splits") or ():
+        share = split.get("amount", 0) or 0
+        if share > 0:
+            key = split.get("category", "")
+            shares[key] = shares.get(key, 0) + share
+    if not shares:
+        return {category: amount}
+    split_total = sum(shares.values())
+    if split_total > amount:
+        scale = amount / split_total
+        return {key: round(share * scale, MONEY_PLACES) for key, share in shares.items()}
+    remainder = round(amount - split_total, MONEY_PLACES)
+    if remainder > 0:
+        shares[category] = shares.get(category, 0) + remainder
+    return {key: round(share, MONEY_PLACES) for key, share in shares.items()}
+
+
+def apply_expense(ledger, expense: dict, sign: int = 1):
+    """Adds (sign=1) or removes (sign=-1) a single expense row."""
+    amount = expense.get("amount", 0) or 0
+    status = expense.get("approval_status", "")
+    month = expense.get("date", "")[:7]
+    shares = allocations(expense)
+    _bump(ledger["status"], status, amount, sign)
+    for category, share in shares.items():
+        _bump(ledger["cube"], (month, category, status), share, sign)
+    if expense.get("approval_status") == "Rejected":
+        return
+    for category, share in shares.items():
+        _bump(ledger["category"], category, share, sign)
+    _bump(ledger["month"], month, amount, sign)
+    if expense.get("submitter_id"):
+        _bump(ledger["member"], expense["submitter_id"], amount, sign)
+        _bump(ledger["member_month"], (month, expense["submitter_id"]), amount, sign)
+
+
+def build_ledger(expenses) -> dict:
+    """Full recompute, used for seeding and by the debug consistency check."""
+    ledger = empty_ledger()
+    for e in expenses:
+        apply_expense(ledger, e)
+    return ledger
+
+
+def ledger_mismatches(ledger, expenses) -> list[str]:
+    """Compares a ledger against a full recompute and describes each difference."""
+    expected = build_ledger(expenses)
+    problems = []
+    for section, buckets in expected.items():
+        actual = ledger[section]
+        for key in set(buckets) | set(actual):
+            want = buckets.get(key, [0, 0])
+            got = actual.get(key, [0, 0])
+            if want[1] != got[1] or not math.isclose(
+                want[0], got[0], abs_tol=10**-MONEY_PLACES
+            ):
+                problems.append(
+                    f"{section}[{key!r}]: ledger={list(got)} recomputed={want}"
+                )
+    return problems
+
+
+def _year_month(month: str) -> tuple[int, int] | None:
+    return dates.year_month(f"{month}-01")
+
+
+def in_bounds(month: str, bounds: tuple[str, str] | None) -> bool:
+    return bounds is None or bounds[0] <= month < bounds[1]
+
+
+def spent_by_category(ledger, bounds: tuple[str, str] | None = None) -> dict:
+    """Non-rejected spend per category in the half-open "YYYY-MM" `bounds`
+    (all months when None), summed from the cube rather than the expenses."""
+    if bounds is None:
+        return {category: entry[0] for category, entry in ledger["category"].items()}
+    spent: dict[str, float] = {}
+    for (month, category, status), entry in ledger["cube"].items():
+        if status != "Rejected" and in_bounds(month, bounds):
+            spent[category] = spent.get(category, 0) + entry[0]
+    return {category: round(amount, MONEY_PLACES) for category, amount in spent.items()}
+
+
+def spent_by_member(ledger, bounds: tuple[str, str] | None = None) -> dict:
+    """Non-rejected attributed spend per submitter in the half-open "YYYY-MM"
+    `bounds` (all months when None), summed per month rather than per expense."""
+    if bounds is None:
+        return {member: entry[0] for member, entry in ledger["member"].items()}
+    spent: dict[str, float] = {}
+    for (month, member), entry in ledger["member_month"].items():
+        if in_bounds(month, bounds):
+            spent[member] = spent.get(member, 0) + entry[0]
+    return {member: round(amount, MONEY_PLACES) for member, amount in spent.items()}
+
+
+def month_totals(ledger, year: int) -> list[float]:
+    """Non-rejected spend per month of `year`, indexed 1-12 (index 0 is unused)."""
+    totals = [0.0] * 13
+    prefix = f"{year:04d}-"
+    for month, entry in ledger["month"].items():
+        if not month.startswith(prefix):
+            continue
+        parsed = _year_month(month)
+        if parsed is not None:
+            totals[parsed[1]] += entry[0]
+    return totals
@@ -0,0 +1,25 @@
+"""Memoization keyed on the version counters of a computation's inputs."""
+
+from typing import Any
+
+
+class VersionedMemo:
+    """Keeps the last result per name together with the input versions it used.
+
+    Callers build the key from the version counters (and any scalar inputs)
+    the computation reads; an unchanged key returns the cached result.
+    """
+
+    def __init__(self):
+        self._entries: dict[str, tuple[tuple, Any]] = {}
+
+    def get(self, name: str, key: tuple, default: Any = None) -> Any:
+        """Returns the cached result if it was built from `key`, else `default`."""
+        entry = self._entries.get(name)
+        if entry is not None and entry[0] == key:
+            return entry[1]
+        return default
+
+    def put(self, name: str, key: tuple, value: Any) -> Any:
+        self._entries[name] = (key, value)
+        return value
@@ -0,0 +1,151 @@
+"""Expansion of recurring expense templates into dated occurrences.
+
+A template is an expense whose ``recurring_frequency`` is not One-time and
+that was not itself generated from another template; it counts as its own
+first occurrence. ``recurring_through`` records the date up to which its later
+occurrences have been stored as concrete One-time expenses pointing back at it
+through ``recurring_parent_id``.
+
+Occurrences are generated lazily, one date at a time, so callers can store
+them in batches or total the committed spend of future months without ever
+holding the rows of years of schedule.
+"""
+
+import calendar
+import datetime
+import itertools
+import uuid
+from app.data.ledger import MONEY_PLACES, allocations
+
+# Step of each frequency as (days, months).
+STEPS = {
+    "Weekly": (7, 0),
+    "Monthly": (0, 1),
+    "Quarterly": (0, 3),
+    "Annual": (0, 12),
+}
+SCHEDULE_USER = "Recurring schedule"
+
+
+def is_template(expense: dict) -> bool:
+    return (
+        expense.get("recurring_frequency", "One-time") in STEPS
+        and not expense.get("recurring_parent_id")
+    )
+
+
+def _add_months(first: datetime.date, months: int) -> datetime.date:
+    """Moves `first` by whole months, clamping the day to the month's length."""
+    year, month = divmod(first.year * 12 + first.month - 1 + months, 12)
+    day = min(first.day, calendar.monthrange(year, month + 1)[1])
+    return datetime.date(year, month + 1, day)
+
+
+def _nth(first: datetime.date, frequency: str, n: int) -> datetime.date:
+    days, months = STEPS[frequency]
+    if days:
+        return first + datetime.timedelta(days=days * n)
+    return _add_months(first, months * n)
+
+
+def occurrences(
+    first: datetime.date,
+    frequency: str,
+    after: datetime.date | None,
+    until: datetime.date,
+):
+    """Yields the dates of later occurrences in (after, until], in order.
+
+    Each date is computed from `first` rather than from the previous one, so
+    a schedule starting on the 31st returns to the 31st after short months.
+    The starting step is found arithmetically instead of by walking forward.
+    """
+    days, months = STEPS[frequency]
+    n = 1
+    if after is not None and after > first:
+        if days:
+            n = max(1, (after - first).days // days)
+        else:
+            elapsed = (after.year - first.year) * 12 + after.month - first.month
+            n = max(1, elapsed // months)
+    for n in itertools.count(n):
+        date = _nth(first, frequency, n)
+        if date > until:
+            return
+        if after is None or date > after:
+            yield date
+
+
+def _parse(value: str) -> datetime.date | None:
+    try:
+        return datetime.date.fromisoformat(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _schedule(template: dict, after: datetime.date | None, until: datetime.date):
+    first = _parse(template.get("date", ""))
+    if first is None:
+        return iter(())
+    through = _parse(template.get("recurring_through", ""))
+    if through is not None and (after is None or through > after):
+        after = through
+    return occurrences(first, template["recurring_frequency"], after, until)
+
+
+def instance(template: dict, date: datetime.date) -> dict:
+    """A concrete One-time expense for one occurrence of `template`."""
+    return {
+        **template,
+        "id": str(uuid.uuid4()),
+        "date": date.isoformat(),
+        "approval_status": "Pending",
+        "recurring_frequency": "One-time",
+        "recurring_parent_id": template["id"],
+        "recurring_through": "",
+        "tags": list(template.get("tags", [])),
+        "splits": [dict(s) for s in template.get("splits", [])],
+    }
+
+
+def created_entry(template: dict) -> dict:
+    """The history entry recorded for each stored occurrence of `template`."""
+    return {
+        "action": "Created",
+        "user": SCHEDULE_USER,
+        "timestamp": datetime.datetime.now().strftime("%Y-%m-%d %H:%M"),
+        "note": f"{template['recurring_frequency']} occurrence of "
+        f"{template.get('description', '')}",
+    }
+
+
+def pending_instances(templates, until: datetime.date):
+    """Lazily yields the instances of every template's occurrences that are
+    due by `until` and not yet stored."""
+    for template in templates:
+        if template.get("approval_status") == "Rejected":
+            continue
+        for date in _schedule(template, None, until):
+            yield instance(template, date)
+
+
+def committed_spend(
+    templates, start: datetime.date, end: datetime.date
+) -> dict[tuple[str, str], float]:
+    """Spend the templates commit to after `start` through `end`, per
+    ("YYYY-MM", category), for occurrences that are not stored yet.
+
+    Only dates are generated, one at a time; nothing is materialized.
+    Rejected templates commit nothing.
+    """
+    committed: dict[tuple[str, str], float] = {}
+    for template in templates:
+        if template.get("approval_status") == "Rejected":
+            continue
+        shares = allocations(template)
+        for date in _schedule(template, start, end):
+            month = date.isoformat()[:7]
+            for category, share in shares.items():
+                key = (month, category)
+                committed[key] = committed.get(key, 0) + share
+    return {key: round(amount, MONEY_PLACES) for key, amount in committed.items()}
@@ -0,0 +1,120 @@
+"""Inverted token index for expense search.
+
+Each expense is tokenized over its description, category, tags and payment
+method. A query matches an expense when every query token is a prefix of one
+of the expense's tokens, so "aws clo" finds "AWS Cloud Services". Prefix
+lookups bisect a sorted vocabulary, so a search only touches the postings of
+tokens that actually match. Exact category postings are kept alongside so the
+category filter is a set lookup too.
+"""
+
+import bisect
+import re
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+
+def tokenize(text: str) -> list[str]:
+    return _TOKEN_RE.findall(text.lower())
+
+
+def expense_tokens(expense: dict) -> frozenset[str]:
+    text = " ".join(
+        [
+            expense.get("description", ""),
+            expense.get("category", ""),
+            expense.get("payment_method", ""),
+            *expense.get("tags", []),
+        ]
+    )
+    return frozenset(tokenize(text))
+
+
+class ExpenseSearchIndex:
+    """Token -> expense id postings plus a sorted vocabulary for prefixes."""
+
+    def __init__(self):
+        self._postings: dict[str, set[str]] = {}
+        self._vocabulary: list[str] = []
+        self._doc_tokens: dict[str, frozenset[str]] = {}
+        self._category_ids: dict[str, set[str]] = {}
+        self._doc_category: dict[str, str] = {}
+
+    @classmethod
+    def build(cls, expenses) -> "ExpenseSearchIndex":
+        index = cls()
+        postings = index._postings
+        for expense in expenses:
+            expense_id = expense["id"]
+            tokens = expense_tokens(expense)
+            index._doc_tokens[expense_id] = tokens
+            for token in tokens:
+                posting = postings.get(token)
+                if posting is None:
+                    posting = postings[token] = set()
+                posting.add(expense_id)
+            index._add_category(expense_id, expense.get("category", ""))
+        index._vocabulary = sorted(postings)
+        return index
+
+    def __len__(self) -> int:
+        return len(self._doc_tokens)
+
+    def add(self, expense: dict):
+        """Indexes an expense, replacing any previous entry with the same id."""
+        self.remove(expense["id"])
+        tokens = expense_tokens(expense)
+        self._doc_tokens[expense["id"]] = tokens
+        for token in tokens:
+            posting = self._postings.get(token)
+            if posting is None:
+                posting = self._postings[token] = set()
+                bisect.insort(self._vocabulary, token)
+            posting.add(expense["id"])
+        self._add_category(expense["id"], expense.get("category", ""))
+
+    def _add_category(self, expense_id: str, category: str):
+        self._doc_category[expense_id] = category
+        self._category_ids.setdefault(category, set()).add(expense_id)
+
+    def remove(self, expense_id: str):
+        for token in self._doc_tokens.pop(expense_id, ()):
+            posting = self._postings[token]
+            posting.discard(expense_id)
+            if not posting:
+                del self._postings[token]
+                del self._vocabulary[bisect.bisect_left(self._vocabulary, token)]
+        category = self._doc_category.pop(expense_id, None)
+        if category is not None:
+            ids = self._category_ids[category]
+            ids.discard(expense_id)
+            if not ids:
+                del self._category_ids[category]
+
+    def category_ids(self, category: str) -> set[str]:
+        return self._category_ids.get(category, set())
+
+    def _prefix_ids(self, prefix: str) -> set[str]:
+        start = bisect.bisect_left(self._vocabulary, prefix)
+        end = bisect.bisect_left(self._vocabulary, prefix + "\uffff", start)
+        if end - start == 1:
+            return self._postings[self._vocabulary[start]]
+        ids = set()
+        for token in self._vocabulary[start:end]:
+            ids |= self._postings[token]
+        return ids
+
+    def search(self, query: str) -> set[str] | None:
+        """Returns the ids matching every query token, or None for an empty query."""
+        tokens = set(tokenize(query))
+        if not tokens:
+            return None
+        # Longer prefixes are more selective; start there to keep the
+        # intersection small.
+        matches = None
+        for token in sorted(tokens, key=len, reverse=True):
+            ids = self._prefix_ids(token)
+            matches = set(ids) if matches is None else matches & ids
+            if not matches:
+                return set()
+        return matches
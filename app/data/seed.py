@@ -0,0 +1,28 @@
+"""Loads the demo data into the database.
+
+Usage: ``python -m app.data.seed [--force]``
+"""
+
+import argparse
+from app.data import storage
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Seed Budget Tracker demo data.")
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="replace existing rows instead of only filling empty tables",
+    )
+    args = parser.parse_args()
+    seeded = storage.seed_demo_data(force=args.force)
+    if not seeded:
+        print(f"{storage.DB_PATH} already has data; nothing seeded.")
+        return
+    for table, count in seeded.items():
+        print(f"Seeded {count} rows into {table}.")
+    print(f"Total spent: {storage.total_spent():,.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,812 @@
+"""SQLite persistence for budgets, expenses, goals, team members and activity.
+
+The database lives in a single file (``BUDGET_TRACKER_DB``, default
+``budget_tracker.db`` in the working directory). States hydrate from it on page
+load and write every mutation straight through, so data survives restarts and
+is shared between sessions. The demo data is only loaded on request, see
+``app.data.seed``.
+"""
+
+import datetime
+import itertools
+import json
+import os
+import sqlite3
+import threading
+from app.data import audit, recurring
+from app.data.ledger import MONEY_PLACES, allocations, empty_ledger
+
+DB_PATH = os.environ.get("BUDGET_TRACKER_DB", "budget_tracker.db")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS budgets (
+    id TEXT PRIMARY KEY,
+    name TEXT NOT NULL,
+    type TEXT NOT NULL DEFAULT 'Department',
+    allocated_amount REAL NOT NULL DEFAULT 0,
+    period TEXT NOT NULL DEFAULT 'Annual'
+);
+CREATE TABLE IF NOT EXISTS expenses (
+    id TEXT PRIMARY KEY,
+    date TEXT NOT NULL,
+    category TEXT NOT NULL,
+    amount REAL NOT NULL DEFAULT 0,
+    payment_method TEXT NOT NULL DEFAULT '',
+    description TEXT NOT NULL DEFAULT '',
+    approval_status TEXT NOT NULL DEFAULT 'Pending',
+    recurring_frequency TEXT NOT NULL DEFAULT 'One-time',
+    has_attachment INTEGER NOT NULL DEFAULT 0,
+    tags TEXT NOT NULL DEFAULT '[]',
+    splits TEXT NOT NULL DEFAULT '[]',
+    assigned_approver_id TEXT NOT NULL DEFAULT '',
+    attachment_url TEXT NOT NULL DEFAULT '',
+    submitter_id TEXT NOT NULL DEFAULT '',
+    recurring_parent_id TEXT NOT NULL DEFAULT '',
+    recurring_through TEXT NOT NULL DEFAULT '',
+    -- When the row was first stored (audit.timestamp).
+    created_at TEXT NOT NULL DEFAULT ''
+);
+CREATE INDEX IF NOT EXISTS idx_expenses_date
+    ON expenses (date, approval_status, amount);
+CREATE INDEX IF NOT EXISTS idx_expenses_category
+    ON expenses (category, approval_status, amount);
+CREATE INDEX IF NOT EXISTS idx_expenses_status
+    ON expenses (approval_status, amount);
+CREATE INDEX IF NOT EXISTS idx_expenses_submitter
+    ON expenses (submitter_id, approval_status, amount);
+CREATE INDEX IF NOT EXISTS idx_expenses_recurring_templates
+    ON expenses (recurring_frequency)
+    WHERE recurring_frequency != 'One-time' AND recurring_parent_id = '';
+-- Each occurrence of a template is stored at most once.
+CREATE UNIQUE INDEX IF NOT EXISTS idx_expenses_recurring_occurrence
+    ON expenses (recurring_parent_id, date) WHERE recurring_parent_id != '';
+-- A counter bumped by every transaction that changes expenses, so a process
+-- can tell whether its in-memory copy (app.data.expense_store) is current.
+CREATE TABLE IF NOT EXISTS expenses_version (
+    id INTEGER PRIMARY KEY CHECK (id = 0),
+    version INTEGER NOT NULL
+);
+INSERT OR IGNORE INTO expenses_version VALUES (0, 0);
+-- Each expense's amount per category (see ledger.allocations), rewritten
+-- whenever the expense is saved.
+CREATE TABLE IF NOT EXISTS expense_allocations (
+    expense_id TEXT NOT NULL,
+    category TEXT NOT NULL,
+    month TEXT NOT NULL,
+    approval_status TEXT NOT NULL,
+    amount REAL NOT NULL DEFAULT 0,
+    PRIMARY KEY (expense_id, category)
+) WITHOUT ROWID;
+-- Monthly rollup of the allocations, kept current by the triggers below.
+CREATE TABLE IF NOT EXISTS expense_rollup (
+    month TEXT NOT NULL,
+    category TEXT NOT NULL,
+    approval_status TEXT NOT NULL,
+    amount REAL NOT NULL DEFAULT 0,
+    count INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (month, category, approval_status)
+) WITHOUT ROWID;
+CREATE TRIGGER IF NOT EXISTS expense_allocation_insert
+AFTER INSERT ON expense_allocations
+BEGIN
+    INSERT INTO expense_rollup VALUES (
+        NEW.month, NEW.category, NEW.approval_status, ROUND(NEW.amount, 2), 1
+    )
+    ON CONFLICT (month, category, approval_status) DO UPDATE SET
+        amount = ROUND(amount + excluded.amount, 2), count = count + 1;
+END;
+CREATE TRIGGER IF NOT EXISTS expense_allocation_delete
+AFTER DELETE ON expense_allocations
+BEGIN
+    UPDATE expense_rollup
+    SET amount = ROUND(amount - OLD.amount, 2), count = count - 1
+    WHERE month = OLD.month AND category = OLD.category
+        AND approval_status = OLD.approval_status;
+    DELETE FROM expense_rollup WHERE count <= 0;
+END;
+CREATE TRIGGER IF NOT EXISTS expense_allocation_update
+AFTER UPDATE OF approval_status ON expense_allocations
+BEGIN
+    UPDATE expense_rollup
+    SET amount = ROUND(amount - OLD.amount, 2), count = count - 1
+    WHERE month = OLD.month AND category = OLD.category
+        AND approval_status = OLD.approval_status;
+    DELETE FROM expense_rollup WHERE count <= 0;
+    INSERT INTO expense_rollup VALUES (
+        NEW.month, NEW.category, NEW.approval_status, ROUND(NEW.amount, 2), 1
+    )
+    ON CONFLICT (month, category, approval_status) DO UPDATE SET
+        amount = ROUND(amount + excluded.amount, 2), count = count + 1;
+END;
+-- Append-only comments and history of each expense, read only when the
+-- expense modal shows them.
+CREATE TABLE IF NOT EXISTS expense_log (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    expense_id TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    entry TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_expense_log_expense
+    ON expense_log (expense_id, kind, seq);
+-- Field-level revisions of each changed expense, see app.data.audit.
+CREATE TABLE IF NOT EXISTS expense_revisions (
+    expense_id TEXT NOT NULL,
+    revision INTEGER NOT NULL,
+    timestamp TEXT NOT NULL,
+    snapshot INTEGER NOT NULL DEFAULT 0,
+    fields TEXT NOT NULL,
+    PRIMARY KEY (expense_id, revision)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_expense_revisions_timestamp
+    ON expense_revisions (expense_id, timestamp);
+CREATE TABLE IF NOT EXISTS goals (
+    id TEXT PRIMARY KEY,
+    name TEXT NOT NULL,
+    target_amount REAL NOT NULL DEFAULT 0,
+    current_amount REAL NOT NULL DEFAULT 0,
+    deadline TEXT NOT NULL DEFAULT '',
+    category TEXT NOT NULL DEFAULT 'General',
+    status TEXT NOT NULL DEFAULT 'On Track',
+    notes TEXT NOT NULL DEFAULT ''
+);
+CREATE TABLE IF NOT EXISTS team_members (
+    id TEXT PRIMARY KEY,
+    name TEXT NOT NULL,
+    role TEXT NOT NULL DEFAULT '',
+    department TEXT NOT NULL DEFAULT '',
+    avatar_seed TEXT NOT NULL DEFAULT '',
+    email TEXT NOT NULL DEFAULT '',
+    phone TEXT NOT NULL DEFAULT '',
+    status TEXT NOT NULL DEFAULT 'Active',
+    joined_date TEXT NOT NULL DEFAULT '',
+    assigned_budget REAL NOT NULL DEFAULT 0
+);
+CREATE TABLE IF NOT EXISTS activities (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    id TEXT NOT NULL UNIQUE,
+    user_name TEXT NOT NULL DEFAULT '',
+    user_avatar TEXT NOT NULL DEFAULT '',
+    action TEXT NOT NULL DEFAULT '',
+    target TEXT NOT NULL DEFAULT '',
+    timestamp TEXT NOT NULL DEFAULT '',
+    type TEXT NOT NULL DEFAULT 'system'
+);
+CREATE INDEX IF NOT EXISTS idx_activities_type ON activities (type, seq);
+"""
+
+BUDGET_COLUMNS = ("id", "name", "type", "allocated_amount", "period")
+EXPENSE_COLUMNS = (
+    "id",
+    "date",
+    "category",
+    "amount",
+    "payment_method",
+    "description",
+    "approval_status",
+    "recurring_frequency",
+    "has_attachment",
+    "tags",
+    "splits",
+    "assigned_approver_id",
+    "attachment_url",
+    "submitter_id",
+    "recurring_parent_id",
+    "recurring_through",
+)
+EXPENSE_DEFAULTS = {
+    "payment_method": "",
+    "description": "",
+    "approval_status": "Pending",
+    "recurring_frequency": "One-time",
+    "has_attachment": False,
+    "tags": [],
+    "splits": [],
+    "assigned_approver_id": "",
+    "attachment_url": "",
+    "submitter_id": "",
+    "recurring_parent_id": "",
+    "recurring_through": "",
+}
+EXPENSE_SELECT = f"SELECT {', '.join(EXPENSE_COLUMNS)} FROM expenses"
+# Columns written when an expense is first stored; created_at is never updated.
+EXPENSE_INSERT_COLUMNS = EXPENSE_COLUMNS + ("created_at",)
+EXPENSE_INSERT = (
+    f"INTO expenses ({', '.join(EXPENSE_INSERT_COLUMNS)}) "
+    f"VALUES ({', '.join('?' for _ in EXPENSE_INSERT_COLUMNS)})"
+)
+EXPENSE_JSON_COLUMNS = ("tags", "splits")
+# Columns whose changes expense_revisions records.
+REVISION_COLUMNS = EXPENSE_COLUMNS[1:]
+# Kinds of expense_log entry.
+EXPENSE_LOG_KINDS = ("comments", "history")
+MATERIALIZE_BATCH_ROWS = 1000
+GOAL_COLUMNS = (
+    "id",
+    "name",
+    "target_amount",
+    "current_amount",
+    "deadline",
+    "category",
+    "status",
+    "notes",
+)
+TEAM_MEMBER_COLUMNS = (
+    "id",
+    "name",
+    "role",
+    "department",
+    "avatar_seed",
+    "email",
+    "phone",
+    "status",
+    "joined_date",
+    "assigned_budget",
+)
+
+ACTIVITY_COLUMNS = (
+    "id",
+    "user_name",
+    "user_avatar",
+    "action",
+    "target",
+    "timestamp",
+    "type",
+)
+
+_local = threading.local()
+
+
+def connect() -> sqlite3.Connection:
+    """Returns this thread's connection, creating the schema on first use."""
+    conn = getattr(_local, "conn", None)
+    if conn is None:
+        conn = sqlite3.connect(DB_PATH)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.executescript(SCHEMA)
+        _local.conn = conn
+    return conn
+
+
+def allocation_rows(expense: dict) -> list[tuple]:
+    month = expense["date"][:7]
+    status = expense["approval_status"]
+    return [
+        (expense["id"], category, month, status, amount)
+        for category, amount in allocations(expense).items()
+    ]
+
+
+def _insert_allocations(conn: sqlite3.Connection, expenses):
+    conn.executemany(
+        "INSERT INTO expense_allocations VALUES (?, ?, ?, ?, ?)",
+        (row for e in expenses for row in allocation_rows(e)),
+    )
+
+
+def _delete_allocations(conn: sqlite3.Connection, ids):
+    conn.executemany(
+        "DELETE FROM expense_allocations WHERE expense_id = ?", ((i,) for i in ids)
+    )
+
+
+def _append_log(conn: sqlite3.Connection, entries):
+    conn.executemany(
+        "INSERT INTO expense_log (expense_id, kind, entry) VALUES (?, ?, ?)",
+        ((id, kind, json.dumps(entry)) for id, kind, entry in entries),
+    )
+
+
+def _bump_expenses_version(conn: sqlite3.Connection):
+    conn.execute("UPDATE expenses_version SET version = version + 1")
+
+
+def expenses_version() -> int:
+    """The expenses_version counter; it changes whenever expenses do."""
+    return connect().execute("SELECT version FROM expenses_version").fetchone()[0]
+
+
+def _upsert_sql(
+    table: str, columns: tuple[str, ...], keep_max=(), insert_only=()
+) -> str:
+    """Upsert of `columns`; columns in `keep_max` never move backwards and
+    columns in `insert_only` keep the value first inserted."""
+    updates = ", ".join(
+        f"{c} = MAX({c}, excluded.{c})" if c in keep_max else f"{c} = excluded.{c}"
+        for c in columns
+        if c != "id" and c not in insert_only
+    )
+    return (
+        f"INSERT INTO {table} ({', '.join(columns)}) "
+        f"VALUES ({', '.join('?' for _ in columns)}) "
+        f"ON CONFLICT(id) DO UPDATE SET {updates}"
+    )
+
+
+def _upsert(table: str, columns: tuple[str, ...], rows):
+    conn = connect()
+    with conn:
+        conn.executemany(_upsert_sql(table, columns), rows)
+
+
+def _delete(table: str, ids):
+    conn = connect()
+    with conn:
+        conn.executemany(f"DELETE FROM {table} WHERE id = ?", ((i,) for i in ids))
+
+
+def _load(table: str) -> list[dict]:
+    return [dict(row) for row in connect().execute(f"SELECT * FROM {table} ORDER BY rowid")]
+
+
+def expense_to_row(expense: dict) -> tuple:
+    row = []
+    for column in EXPENSE_COLUMNS:
+        value = expense.get(column, EXPENSE_DEFAULTS.get(column))
+        if column in EXPENSE_JSON_COLUMNS:
+            value = json.dumps(value)
+        elif column == "has_attachment":
+            value = int(bool(value))
+        row.append(value)
+    return tuple(row)
+
+
+def row_to_expense(row) -> dict:
+    expense = dict(row)
+    for column in EXPENSE_JSON_COLUMNS:
+        expense[column] = json.loads(expense[column])
+    expense["has_attachment"] = bool(expense["has_attachment"])
+    return expense
+
+
+def load_budgets() -> list[dict]:
+    return _load("budgets")
+
+
+def save_budget(budget: dict):
+    _upsert("budgets", BUDGET_COLUMNS, [tuple(budget[c] for c in BUDGET_COLUMNS)])
+
+
+def delete_budget(id: str):
+    _delete("budgets", [id])
+
+
+def load_expenses() -> list[dict]:
+    return [
+        row_to_expense(row)
+        for row in connect().execute(f"{EXPENSE_SELECT} ORDER BY rowid")
+    ]
+
+
+def count_expenses() -> int:
+    return connect().execute("SELECT COUNT(*) FROM expenses").fetchone()[0]
+
+
+def iter_expense_batches(
+    columns: tuple[str, ...], batch_size: int = 1000, ids=None
+):
+    """Yields lists of up to `batch_size` rows of `columns`, in rowid order.
+
+    Rows are pulled from the cursor one batch at a time, so callers streaming
+    the whole table hold at most one batch in memory. When `ids` is given only
+    those expenses are read; the ids go into a temp table that the query joins
+    against, rather than into an IN list bounded by SQLite's parameter limit.
+    """
+    conn = connect()
+    where = ""
+    if ids is not None:
+        with conn:
+            _fill_id_table(conn, "selected_ids", ids)
+        where = " WHERE id IN (SELECT id FROM temp.selected_ids)"
+    cursor = conn.execute(
+        f"SELECT {', '.join(columns)} FROM expenses{where} ORDER BY rowid"
+    )
+    while batch := cursor.fetchmany(batch_size):
+        yield batch
+
+
+def _fill_id_table(conn: sqlite3.Connection, table: str, ids):
+    """Replaces the contents of the one-column temp table `table` with `ids`."""
+    conn.execute(f"CREATE TEMP TABLE IF NOT EXISTS {table} (id TEXT PRIMARY KEY)")
+    conn.execute(f"DELETE FROM temp.{table}")
+    conn.executemany(
+        f"INSERT OR IGNORE INTO temp.{table} VALUES (?)", ((i,) for i in ids)
+    )
+
+
+def _stored_expenses(
+    conn: sqlite3.Connection, ids, columns: tuple[str, ...] = EXPENSE_COLUMNS
+) -> dict[str, tuple[dict, int]]:
+    """The stored `columns` of these expenses with their latest revision (0
+    if none), read in one query that joins the ids through a temp table."""
+    _fill_id_table(conn, "revised_ids", ids)
+    rows = conn.execute(
+        f"SELECT {', '.join(f'e.{c}' for c in columns)}, "
+        "(SELECT MAX(revision) FROM expense_revisions r "
+        "WHERE r.expense_id = e.id) AS last_revision "
+        "FROM temp.revised_ids s JOIN expenses e ON e.id = s.id"
+    )
+    stored = {}
+    for row in rows:
+        expense = row_to_expense(row) if columns == EXPENSE_COLUMNS else dict(row)
+        stored[expense["id"]] = (expense, expense.pop("last_revision") or 0)
+    return stored
+
+
+def _record_revisions(conn: sqlite3.Connection, changes, now: str):
+    """Records a revision at `now` for each (stored, last revision, new)
+    version of an expense whose new version differs from the stored one."""
+    rows = []
+    for old, last, new in changes:
+        if not audit.diff(old, new, REVISION_COLUMNS):
+            continue
+        revision = last + 1
+        fields = audit.revision_fields(old, new, revision, REVISION_COLUMNS)
+        snapshot = int(audit.is_snapshot(revision))
+        rows.append((old["id"], revision, now, snapshot, json.dumps(fields)))
+    conn.executemany("INSERT INTO expense_revisions VALUES (?, ?, ?, ?, ?)", rows)
+
+
+def save_expenses(expenses):
+    """Upserts expenses, recording a revision for each changed one, and
+    rewrites their allocations in one transaction."""
+    expenses = list(expenses)
+    conn = connect()
+    with conn:
+        now = audit.timestamp()
+        stored = _stored_expenses(conn, (e["id"] for e in expenses))
+        _record_revisions(
+            conn,
+            ((*stored[e["id"]], e) for e in expenses if e["id"] in stored),
+            now,
+        )
+        # recurring_through is advanced only by materialize_recurring; a copy
+        # saved from a session that loaded it earlier must not rewind it.
+        conn.executemany(
+            _upsert_sql(
+                "expenses",
+                EXPENSE_INSERT_COLUMNS,
+                keep_max=("recurring_through",),
+                insert_only=("created_at",),
+            ),
+            (expense_to_row(e) + (now,) for e in expenses),
+        )
+        _delete_allocations(conn, (e["id"] for e in expenses))
+        _insert_allocations(conn, expenses)
+        _bump_expenses_version(conn)
+
+
+def _row_allocation_source(row: tuple) -> dict:
+    expense = dict(zip(EXPENSE_COLUMNS, row))
+    expense["splits"] = json.loads(expense["splits"])
+    return expense
+
+
+def insert_expense_rows(rows):
+    """Bulk-inserts `expense_to_row` tuples for new expenses in one transaction."""
+    rows = list(rows)
+    conn = connect()
+    with conn:
+        now = audit.timestamp()
+        conn.executemany(f"INSERT {EXPENSE_INSERT}", (row + (now,) for row in rows))
+        _insert_allocations(conn, (_row_allocation_source(row) for row in rows))
+        _bump_expenses_version(conn)
+
+
+def save_expense(expense: dict):
+    save_expenses([expense])
+
+
+def append_expense_log(entries):
+    """Appends (expense id, kind, entry) triples; kind is one of
+    EXPENSE_LOG_KINDS. Entries are never rewritten."""
+    conn = connect()
+    with conn:
+        _append_log(conn, entries)
+
+
+def load_expense_log(expense_id: str, kind: str) -> list[dict]:
+    """Returns one expense's entries of `kind`, oldest first."""
+    rows = connect().execute(
+        "SELECT entry FROM expense_log WHERE expense_id = ? AND kind = ? ORDER BY seq",
+        (expense_id, kind),
+    )
+    return [json.loads(entry) for entry, in rows]
+
+
+def expense_as_of(expense_id: str, timestamp: str) -> dict | None:
+    """Rebuilds an expense as it stood at `timestamp` (ISO, as
+    `audit.timestamp` writes it) by undoing the revisions recorded after it.
+    None if the expense does not exist, or was first stored after
+    `timestamp`.
+    """
+    conn = connect()
+    row = conn.execute(
+        f"SELECT created_at, {', '.join(EXPENSE_COLUMNS)} FROM expenses WHERE id = ?",
+        (expense_id,),
+    ).fetchone()
+    if row is None or timestamp < row["created_at"]:
+        return None
+    current = row_to_expense(row)
+    del current["created_at"]
+    row = conn.execute(
+        "SELECT revision FROM expense_revisions WHERE expense_id = ? "
+        "AND timestamp > ? ORDER BY timestamp, revision LIMIT 1",
+        (expense_id, timestamp),
+    ).fetchone()
+    if row is None:
+        return current
+    first = row[0]
+    # Undo from the nearest snapshot at or after `first`, or from the stored
+    # row when no snapshot has been recorded since.
+    last = conn.execute(
+        "SELECT MAX(revision) FROM expense_revisions WHERE expense_id = ?",
+        (expense_id,),
+    ).fetchone()[0]
+    last = min(last, audit.next_snapshot(first))
+    rows = conn.execute(
+        "SELECT snapshot, fields FROM expense_revisions WHERE expense_id = ? "
+        "AND revision BETWEEN ? AND ? ORDER BY revision DESC",
+        (expense_id, first, last),
+    )
+    return {
+        **audit.rewind(
+            current, ((snapshot, json.loads(fields)) for snapshot, fields in rows)
+        ),
+        "id": expense_id,
+    }
+
+
+def _delete_expense_rows(conn: sqlite3.Connection, ids: list[str]):
+    _delete_allocations(conn, ids)
+    conn.executemany(
+        "DELETE FROM expense_log WHERE expense_id = ?", ((i,) for i in ids)
+    )
+    conn.executemany(
+        "DELETE FROM expense_revisions WHERE expense_id = ?", ((i,) for i in ids)
+    )
+    conn.executemany("DELETE FROM expenses WHERE id = ?", ((i,) for i in ids))
+
+
+def delete_expenses(ids):
+    ids = list(ids)
+    conn = connect()
+    with conn:
+        _delete_expense_rows(conn, ids)
+        _bump_expenses_version(conn)
+
+
+def set_expense_status(ids, status: str):
+    ids = list(ids)
+    conn = connect()
+    with conn:
+        # Only the status is read, except for the expenses whose next
+        # revision is a snapshot and so records every field.
+        stored = _stored_expenses(conn, ids, ("id", "approval_status"))
+        snapshot_ids = [
+            id
+            for id, (e, last) in stored.items()
+            if e["approval_status"] != status and audit.is_snapshot(last + 1)
+        ]
+        stored |= _stored_expenses(conn, snapshot_ids)
+        _record_revisions(
+            conn,
+            (
+                (e, last, {**e, "approval_status": status})
+                for e, last in stored.values()
+            ),
+            audit.timestamp(),
+        )
+        conn.executemany(
+            "UPDATE expenses SET approval_status = ? WHERE id = ?",
+            ((status, i) for i in ids),
+        )
+        conn.executemany(
+            "UPDATE expense_allocations SET approval_status = ? WHERE expense_id = ?",
+            ((status, i) for i in ids),
+        )
+        _bump_expenses_version(conn)
+
+
+def materialize_recurring(
+    until: datetime.date, batch_size: int = MATERIALIZE_BATCH_ROWS
+) -> list[dict]:
+    """Stores every recurring occurrence due by `until` that is not stored yet
+    and returns the new expenses.
+
+    Instances are generated lazily, `batch_size` at a time, from each
+    template's `recurring_through`. That date only skips work: occurrences go
+    in with INSERT OR IGNORE against the unique (template, date) index, so
+    one that is already stored is never stored again, whatever the template
+    row says. Only templates that got new occurrences move their date, so a
+    run that stores nothing changes nothing. Everything runs in one immediate
+    transaction.
+    """
+    conn = connect()
+    now = audit.timestamp()
+    created = []
+    with conn:
+        conn.execute("BEGIN IMMEDIATE")
+        templates = [
+            row_to_expense(row)
+            for row in conn.execute(
+                f"{EXPENSE_SELECT} WHERE recurring_frequency != 'One-time' "
+                "AND recurring_parent_id = ''"
+            )
+        ]
+        created_entries = {t["id"]: recurring.created_entry(t) for t in templates}
+        instances = recurring.pending_instances(templates, until)
+        while batch := list(itertools.islice(instances, batch_size)):
+            stored = [
+                e
+                for e in batch
+                if conn.execute(
+                    f"INSERT OR IGNORE {EXPENSE_INSERT}", expense_to_row(e) + (now,)
+                ).rowcount
+            ]
+            _insert_allocations(conn, stored)
+            _append_log(
+                conn,
+                (
+                    (e["id"], "history", created_entries[e["recurring_parent_id"]])
+                    for e in stored
+                ),
+            )
+            created.extend(stored)
+        if created:
+            conn.executemany(
+                "UPDATE expenses SET recurring_through = MAX(recurring_through, ?) "
+                "WHERE id = ?",
+                (
+                    (until.isoformat(), id)
+                    for id in {e["recurring_parent_id"] for e in created}
+                ),
+            )
+            _bump_expenses_version(conn)
+    return created
+
+
+def load_goals() -> list[dict]:
+    return _load("goals")
+
+
+def save_goal(goal: dict):
+    _upsert("goals", GOAL_COLUMNS, [tuple(goal[c] for c in GOAL_COLUMNS)])
+
+
+def delete_goal(id: str):
+    _delete("goals", [id])
+
+
+def load_team_members() -> list[dict]:
+    return _load("team_members")
+
+
+def save_team_member(member: dict):
+    _upsert(
+        "team_members",
+        TEAM_MEMBER_COLUMNS,
+        [tuple(member[c] for c in TEAM_MEMBER_COLUMNS)],
+    )
+
+
+def delete_team_member(id: str):
+    _delete("team_members", [id])
+
+
+def save_activity(activity: dict):
+    _upsert(
+        "activities",
+        ACTIVITY_COLUMNS,
+        [tuple(activity[c] for c in ACTIVITY_COLUMNS)],
+    )
+
+
+def load_activities(type: str | None = None, offset: int = 0, limit: int = 50):
+    """Returns activities newest first, optionally of one type."""
+    where, params = ("WHERE type = ? ", [type]) if type is not None else ("", [])
+    rows = connect().execute(
+        f"SELECT {', '.join(ACTIVITY_COLUMNS)} FROM activities {where}"
+        "ORDER BY seq DESC LIMIT ? OFFSET ?",
+        (*params, limit, offset),
+    )
+    return [dict(row) for row in rows]
+
+
+def count_activities() -> dict[str, int]:
+    """Returns the number of activities per type."""
+    rows = connect().execute("SELECT type, COUNT(*) FROM activities GROUP BY type")
+    return {type: count for type, count in rows}
+
+
+def load_ledger() -> dict:
+    """Builds the spend ledger. The split-aware category and cube sections come
+    from the allocation rollup, whose size depends on the months and categories
+    in use rather than the number of expenses; the whole-amount sections are
+    GROUP BY queries over the covering indexes."""
+    conn = connect()
+    ledger = empty_ledger()
+    rows = conn.execute(
+        "SELECT month, category, approval_status, amount, count FROM expense_rollup"
+    )
+    for month, category, status, amount, count in rows:
+        ledger["cube"][(month, category, status)] = [amount, count]
+    queries = {
+        "status": "SELECT approval_status, SUM(amount), COUNT(*) FROM expenses "
+        "GROUP BY approval_status",
+        "category": "SELECT category, SUM(amount), SUM(count) FROM expense_rollup "
+        "WHERE approval_status != 'Rejected' GROUP BY category",
+        "month": "SELECT substr(date, 1, 7), SUM(amount), COUNT(*) FROM expenses "
+        "WHERE approval_status != 'Rejected' GROUP BY substr(date, 1, 7)",
+        "member": "SELECT submitter_id, SUM(amount), COUNT(*) FROM expenses "
+        "WHERE approval_status != 'Rejected' AND submitter_id != '' "
+        "GROUP BY submitter_id",
+    }
+    for section, sql in queries.items():
+        for key, amount, count in conn.execute(sql):
+            ledger[section][key] = [round(amount, MONEY_PLACES), count]
+    rows = conn.execute(
+        "SELECT substr(date, 1, 7), submitter_id, SUM(amount), COUNT(*) "
+        "FROM expenses WHERE approval_status != 'Rejected' AND submitter_id != '' "
+        "GROUP BY substr(date, 1, 7), submitter_id"
+    )
+    for month, member, amount, count in rows:
+        ledger["member_month"][(month, member)] = [round(amount, MONEY_PLACES), count]
+    return ledger
+
+
+def total_spent() -> float:
+    row = connect().execute(
+        "SELECT COALESCE(SUM(amount), 0) FROM expenses "
+        "WHERE approval_status != 'Rejected'"
+    ).fetchone()
+    return round(row[0], MONEY_PLACES)
+
+
+def seed_demo_data(force: bool = False) -> dict[str, int]:
+    """Copies the demo data into every empty table (or every table when forced)."""
+    from app.data import demo
+
+    tables = {
+        "budgets": (BUDGET_COLUMNS, demo.DEMO_BUDGETS),
+        "expenses": (EXPENSE_INSERT_COLUMNS, demo.DEMO_EXPENSES),
+        "goals": (GOAL_COLUMNS, demo.DEMO_GOALS),
+        "team_members": (TEAM_MEMBER_COLUMNS, demo.DEMO_TEAM_MEMBERS),
+        # Stored oldest first so newer entries get higher sequence numbers.
+        "activities": (ACTIVITY_COLUMNS, demo.DEMO_ACTIVITIES[::-1]),
+    }
+    conn = connect()
+    now = audit.timestamp()
+    seeded = {}
+    with conn:
+        for table, (columns, rows) in tables.items():
+            if force:
+                if table == "expenses":
+                    conn.execute("DELETE FROM expense_allocations")
+                    conn.execute("DELETE FROM expense_log")
+                    conn.execute("DELETE FROM expense_revisions")
+                conn.execute(f"DELETE FROM {table}")
+            elif conn.execute(f"SELECT 1 FROM {table} LIMIT 1").fetchone():
+                continue
+            if table == "expenses":
+                values = [expense_to_row(e) + (now,) for e in rows]
+            else:
+                values = [tuple(r[c] for c in columns) for r in rows]
+            conn.executemany(_upsert_sql(table, columns), values)
+            if table == "expenses":
+                _delete_allocations(conn, (e["id"] for e in rows))
+                _insert_allocations(conn, rows)
+                # The demo expenses carry their comments and history inline.
+                _append_log(
+                    conn,
+                    (
+                        (e["id"], kind, entry)
+                        for e in rows
+                        for kind in EXPENSE_LOG_KINDS
+                        for entry in e.get(kind, [])
+                    ),
+                )
+                _bump_expenses_version(conn)
+            seeded[table] = len(values)
+    return seeded
@@ -0,0 +1,94 @@
+"""Month-by-category spend matrices built from the ledger's monthly cube.
+
+Rows run over every (year, month) from the first to the last month with spend,
+so months with no spend are explicit zeros and January of different years
+never merge. With NumPy (listed in requirements.txt) the cube cells are summed
+into the matrix in one ``bincount`` pass; where it is not installed
+``HAS_NUMPY`` is False and a plain loop fills the same matrix.
+"""
+
+import calendar
+from app.data import dates
+from app.data.ledger import MONEY_PLACES, in_bounds
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+HAS_NUMPY = np is not None
+
+
+class TrendMatrix:
+    def __init__(
+        self,
+        months: list[str],
+        categories: list[str],
+        values: list,
+        first_month: int | None = None,
+    ):
+        self.months = months
+        # Month index (year * 12 + month - 1) of the first row, None when empty.
+        self.first_month = first_month
+        self.categories = categories
+        # values[row][column] is the spend of months[row] in categories[column].
+        self.values = values
+
+    def records(self) -> list[dict]:
+        """One {"name": month label, category: spend, ...} dict per month."""
+        return [
+            {"name": month, **dict(zip(self.categories, row))}
+            for month, row in zip(self.months, self.values)
+        ]
+
+
+def month_key(index: int) -> str:
+    """Formats a month index (year * 12 + month - 1) as "YYYY-MM"."""
+    return f"{index // 12:04d}-{index % 12 + 1:02d}"
+
+
+def _month_index(month: str) -> int | None:
+    parsed = dates.year_month(f"{month}-01")
+    return None if parsed is None else parsed[0] * 12 + parsed[1] - 1
+
+
+def _label(index: int) -> str:
+    return f"{calendar.month_abbr[index % 12 + 1]} {index // 12}"
+
+
+def month_category_matrix(ledger, bounds: tuple[str, str] | None = None) -> TrendMatrix:
+    """Dense non-rejected spend per (year, month) and category within the
+    half-open "YYYY-MM" `bounds` (all months when None)."""
+    category_codes: dict[str, int] = {}
+    month_indexes, codes, amounts = [], [], []
+    for (month, category, status), entry in ledger["cube"].items():
+        if status == "Rejected" or not in_bounds(month, bounds):
+            continue
+        index = _month_index(month)
+        if index is None:
+            continue
+        month_indexes.append(index)
+        codes.append(category_codes.setdefault(category, len(category_codes)))
+        amounts.append(entry[0])
+    if not month_indexes:
+        return TrendMatrix([], [], [])
+    first = min(month_indexes)
+    n_months = max(month_indexes) - first + 1
+    n_categories = len(category_codes)
+    if HAS_NUMPY:
+        cells = (np.asarray(month_indexes) - first) * n_categories + np.asarray(codes)
+        totals = np.bincount(
+            cells, weights=np.asarray(amounts), minlength=n_months * n_categories
+        )
+        values = totals.reshape(n_months, n_categories).round(MONEY_PLACES).tolist()
+    else:
+        values = [[0.0] * n_categories for _ in range(n_months)]
+        for index, code, amount in zip(month_indexes, codes, amounts):
+            values[index - first][code] += amount
+        values = [[round(v, MONEY_PLACES) for v in row] for row in values]
+    return TrendMatrix(
+        [_label(first + i) for i in range(n_months)],
+        list(category_codes),
+        values,
+        first,
+    )
@@ -259,6 +259,16 @@ def budgets_page() -> rx.Component:
                                 class_name="text-gray-500 mt-2 text-lg",
                             ),
                         ),
+                        rx.el.label(
+                            rx.el.input(
+                                type="checkbox",
+                                checked=BudgetState.include_committed_spend,
+                                on_change=BudgetState.toggle_include_committed_spend,
+                                class_name="mr-2 rounded border-gray-300 text-indigo-600",
+                            ),
+                            "Include committed recurring spend",
+                            class_name="flex items-center text-sm text-gray-600 cursor-pointer",
+                        ),
                         class_name="flex flex-col sm:flex-row sm:items-center justify-between gap-4 mb-10",
                     ),
                     rx.cond(
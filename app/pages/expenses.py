@@ -2,7 +2,13 @@ import reflex as rx
 from app.components.sidebar import sidebar
 from app.components.header import header
 from app.components.empty_state import empty_state
-from app.states.budget_state import BudgetState, Expense, ExpenseSplit
+from app.states.budget_state import (
+    BudgetState,
+    Expense,
+    ExpenseSplit,
+    EXPENSE_PAGE_SIZES,
+    EXPORT_FORMATS,
+)
 from app.states.team_state import TeamState
 
 
@@ -203,6 +209,25 @@ def expense_details_tab() -> rx.Component:
             ),
             class_name="mb-4",
         ),
+        rx.el.div(
+            rx.el.label(
+                "Submitted By",
+                class_name="block text-sm font-medium text-gray-700 mb-1",
+            ),
+            rx.el.select(
+                rx.el.option("Unassigned", value=""),
+                rx.foreach(
+                    TeamState.team_members,
+                    lambda m: rx.el.option(m["name"], value=m["id"]),
+                ),
+                value=BudgetState.current_expense["submitter_id"],
+                on_change=lambda val: BudgetState.update_current_expense(
+                    "submitter_id", val
+                ),
+                class_name="w-full rounded-lg border-gray-300 shadow-sm focus:border-indigo-500 focus:ring-indigo-500 px-4 py-2 border",
+            ),
+            class_name="mb-4",
+        ),
         rx.el.div(
             rx.el.div(
                 rx.el.label(
@@ -322,7 +347,7 @@ def expense_comments_tab() -> rx.Component:
     return rx.el.div(
         rx.el.div(
             rx.foreach(
-                BudgetState.current_expense["comments"],
+                BudgetState.expense_comments,
                 lambda comment: rx.el.div(
                     rx.el.div(
                         rx.image(
@@ -351,7 +376,7 @@ def expense_comments_tab() -> rx.Component:
                 ),
             ),
             rx.cond(
-                BudgetState.current_expense["comments"].length() == 0,
+                BudgetState.expense_comments.length() == 0,
                 rx.el.p(
                     "No comments yet.",
                     class_name="text-center text-sm text-gray-400 py-4 italic",
@@ -424,7 +449,7 @@ def expense_history_tab() -> rx.Component:
         ),
         rx.el.div(
             rx.foreach(
-                BudgetState.current_expense["history"],
+                BudgetState.expense_history,
                 lambda item: rx.el.div(
                     rx.el.div(
                         rx.icon(
@@ -466,7 +491,7 @@ def expense_history_tab() -> rx.Component:
                 ),
             ),
             rx.cond(
-                BudgetState.current_expense["history"].length() == 0,
+                BudgetState.expense_history.length() == 0,
                 rx.el.div(
                     rx.icon("history", size=48, class_name="text-gray-200 mb-2"),
                     rx.el.p(
@@ -806,11 +831,11 @@ def expense_row_actions(expense: Expense) -> rx.Component:
 
 def bulk_actions_toolbar() -> rx.Component:
     return rx.cond(
-        BudgetState.selected_expense_ids.length() > 0,
+        BudgetState.selected_expense_count > 0,
         rx.el.div(
             rx.el.div(
                 rx.el.span(
-                    f"{BudgetState.selected_expense_ids.length()} selected",
+                    f"{BudgetState.selected_expense_count} selected",
                     class_name="text-sm font-semibold text-gray-700 bg-gray-100 px-3 py-1 rounded-full",
                 ),
                 rx.el.div(
@@ -826,10 +851,21 @@ def bulk_actions_toolbar() -> rx.Component:
                         on_click=BudgetState.reject_selected_expenses,
                         class_name="flex items-center px-3 py-2 bg-white border border-gray-200 hover:bg-orange-50 hover:text-orange-600 text-gray-700 text-sm font-medium rounded-lg transition-colors",
                     ),
+                    rx.el.select(
+                        *[
+                            rx.el.option(fmt.upper(), value=fmt)
+                            for fmt in EXPORT_FORMATS
+                        ],
+                        value=BudgetState.export_format,
+                        on_change=BudgetState.set_export_format,
+                        class_name="px-3 py-2 bg-white border border-gray-200 text-gray-700 text-sm font-medium rounded-lg",
+                    ),
                     rx.el.button(
                         rx.icon("download", size=16, class_name="mr-2"),
                         "Export",
-                        on_click=BudgetState.export_selected_expenses,
+                        on_click=BudgetState.export_selected_expenses(
+                            BudgetState.export_format
+                        ),
                         class_name="flex items-center px-3 py-2 bg-white border border-gray-200 hover:bg-gray-50 text-gray-700 text-sm font-medium rounded-lg transition-colors",
                     ),
                     rx.el.button(
@@ -847,6 +883,41 @@ def bulk_actions_toolbar() -> rx.Component:
     )
 
 
+def pagination_bar() -> rx.Component:
+    return rx.el.div(
+        rx.el.span(BudgetState.expense_page_label, class_name="text-sm text-gray-500"),
+        rx.el.div(
+            rx.el.select(
+                *[
+                    rx.el.option(f"{size} / page", value=str(size))
+                    for size in EXPENSE_PAGE_SIZES
+                ],
+                value=BudgetState.expense_page_size.to_string(),
+                on_change=BudgetState.set_expense_page_size,
+                class_name="px-3 py-1.5 rounded-lg border border-gray-200 text-sm bg-white/50 focus:outline-none focus:ring-2 focus:ring-indigo-500",
+            ),
+            rx.el.button(
+                rx.icon("chevron-left", size=16),
+                on_click=BudgetState.prev_expense_page,
+                disabled=BudgetState.expense_page == 0,
+                class_name="p-2 rounded-lg border border-gray-200 text-gray-600 hover:bg-gray-50 disabled:opacity-40 transition-colors",
+            ),
+            rx.el.span(
+                f"{BudgetState.expense_page + 1} / {BudgetState.expense_page_count}",
+                class_name="text-sm font-medium text-gray-700",
+            ),
+            rx.el.button(
+                rx.icon("chevron-right", size=16),
+                on_click=BudgetState.next_expense_page,
+                disabled=BudgetState.expense_page >= BudgetState.expense_page_count - 1,
+                class_name="p-2 rounded-lg border border-gray-200 text-gray-600 hover:bg-gray-50 disabled:opacity-40 transition-colors",
+            ),
+            class_name="flex items-center gap-3",
+        ),
+        class_name="flex items-center justify-between px-6 py-4 border-t border-gray-100 bg-gray-50/30",
+    )
+
+
 def fab_add_expense() -> rx.Component:
     return rx.el.button(
         rx.icon("plus", size=24, class_name="text-white"),
@@ -908,7 +979,7 @@ def expenses_page() -> rx.Component:
                     ),
                     rx.el.div(
                         rx.cond(
-                            BudgetState.filtered_expenses.length() > 0,
+                            BudgetState.expense_total_count > 0,
                             rx.el.div(
                                 rx.el.table(
                                     rx.el.thead(
@@ -917,8 +988,8 @@ def expenses_page() -> rx.Component:
                                                 rx.el.input(
                                                     type="checkbox",
                                                     on_change=lambda _: BudgetState.toggle_all_expenses(),
-                                                    checked=BudgetState.selected_expense_ids.length()
-                                                    == BudgetState.filtered_expenses.length(),
+                                                    checked=BudgetState.selected_expense_count
+                                                    == BudgetState.expense_total_count,
                                                     class_name="rounded border-gray-300 text-indigo-600 focus:ring-indigo-500 h-4 w-4",
                                                 ),
                                                 class_name="px-6 py-4 text-left w-4",
@@ -955,13 +1026,14 @@ def expenses_page() -> rx.Component:
                                     ),
                                     rx.el.tbody(
                                         rx.foreach(
-                                            BudgetState.filtered_expenses,
+                                            BudgetState.paged_expenses,
                                             expense_row_actions,
                                         ),
                                         class_name="bg-white/50 divide-y divide-gray-100",
                                     ),
                                     class_name="min-w-full divide-y divide-gray-200",
                                 ),
+                                pagination_bar(),
                                 class_name="overflow-x-auto",
                             ),
                             empty_state(
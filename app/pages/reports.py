@@ -1,9 +1,12 @@
 import reflex as rx
 from app.components.sidebar import sidebar
 from app.components.header import header
-from app.states.budget_state import BudgetState
+from app.states.budget_state import FORECAST_MODELS, REPORT_DATE_RANGES, BudgetState
 from app.states.team_state import TeamState, TeamMember
 
+# Line colors of the trend chart, by category column.
+TREND_COLORS = ["#6366f1", "#f97316", "#14b8a6", "#ec4899", "#8b5cf6", "#3b82f6"]
+
 
 def summary_stat(
     label: str,
@@ -53,14 +56,16 @@ def legend_item(label: str, color: str) -> rx.Component:
     )
 
 
+def _trend_color(index) -> rx.Var:
+    return rx.Var.create(TREND_COLORS)[index % len(TREND_COLORS)]
+
+
 def custom_legend() -> rx.Component:
     return rx.el.div(
-        legend_item("Marketing", "#6366f1"),
-        legend_item("Engineering", "#f97316"),
-        legend_item("Office Renovation", "#14b8a6"),
-        legend_item("Sales", "#ec4899"),
-        legend_item("HR", "#8b5cf6"),
-        legend_item("Website Redesign", "#3b82f6"),
+        rx.foreach(
+            BudgetState.monthly_trend_categories,
+            lambda category, i: legend_item(category, _trend_color(i)),
+        ),
         class_name="flex flex-wrap items-center gap-4 justify-center mt-4",
     )
 
@@ -94,47 +99,15 @@ def trend_chart() -> rx.Component:
                         "boxShadow": "0 4px 6px -1px rgb(0 0 0 / 0.1)",
                     },
                 ),
-                rx.recharts.line(
-                    data_key="Marketing",
-                    stroke="#6366f1",
-                    stroke_width=2,
-                    dot=False,
-                    active_dot={"r": 6},
-                ),
-                rx.recharts.line(
-                    data_key="Engineering",
-                    stroke="#f97316",
-                    stroke_width=2,
-                    dot=False,
-                    active_dot={"r": 6},
-                ),
-                rx.recharts.line(
-                    data_key="Office Renovation",
-                    stroke="#14b8a6",
-                    stroke_width=2,
-                    dot=False,
-                    active_dot={"r": 6},
-                ),
-                rx.recharts.line(
-                    data_key="Sales",
-                    stroke="#ec4899",
-                    stroke_width=2,
-                    dot=False,
-                    active_dot={"r": 6},
-                ),
-                rx.recharts.line(
-                    data_key="HR",
-                    stroke="#8b5cf6",
-                    stroke_width=2,
-                    dot=False,
-                    active_dot={"r": 6},
-                ),
-                rx.recharts.line(
-                    data_key="Website Redesign",
-                    stroke="#3b82f6",
-                    stroke_width=2,
-                    dot=False,
-                    active_dot={"r": 6},
+                rx.foreach(
+                    BudgetState.monthly_trend_categories,
+                    lambda category, i: rx.recharts.line(
+                        data_key=category,
+                        stroke=_trend_color(i),
+                        stroke_width=2,
+                        dot=False,
+                        active_dot={"r": 6},
+                    ),
                 ),
                 data=BudgetState.monthly_trends,
                 height=300,
@@ -155,7 +128,7 @@ def distribution_chart() -> rx.Component:
         rx.el.div(
             rx.recharts.pie_chart(
                 rx.recharts.pie(
-                    data=BudgetState.category_distribution,
+                    data=BudgetState.report_category_distribution,
                     data_key="value",
                     name_key="name",
                     cx="50%",
@@ -200,8 +173,18 @@ def create_gradient(color: str, id: str) -> rx.Component:
 
 def forecast_chart() -> rx.Component:
     return rx.el.div(
-        rx.el.h3(
-            "Spending Projection", class_name="text-lg font-bold text-gray-900 mb-6"
+        rx.el.div(
+            rx.el.h3("Spending Projection", class_name="text-lg font-bold text-gray-900"),
+            rx.el.select(
+                *[
+                    rx.el.option(label, value=model)
+                    for model, label in FORECAST_MODELS
+                ],
+                value=BudgetState.forecast_model,
+                on_change=BudgetState.set_forecast_model,
+                class_name="px-3 py-1.5 rounded-lg border border-gray-200 text-sm font-medium bg-white",
+            ),
+            class_name="flex items-center justify-between gap-4 mb-6",
         ),
         rx.el.div(
             rx.recharts.area_chart(
@@ -247,6 +230,14 @@ def forecast_chart() -> rx.Component:
                     stroke_width=2,
                     type_="monotone",
                 ),
+                rx.recharts.area(
+                    data_key="committed",
+                    name="Committed Recurring",
+                    stroke="#14b8a6",
+                    fill="none",
+                    stroke_width=2,
+                    type_="monotone",
+                ),
                 data=BudgetState.spending_forecast,
                 height=300,
                 width="100%",
@@ -401,7 +392,7 @@ def comparison_table() -> rx.Component:
                 ),
                 rx.el.tbody(
                     rx.foreach(
-                        BudgetState.budget_stats,
+                        BudgetState.report_budget_stats,
                         lambda b: rx.el.tr(
                             rx.el.td(
                                 rx.el.div(
@@ -458,18 +449,18 @@ def comparison_table() -> rx.Component:
                             class_name="px-6 py-4 whitespace-nowrap text-sm font-bold text-gray-900 text-right",
                         ),
                         rx.el.td(
-                            f"${BudgetState.total_spent:,.2f}",
+                            f"${BudgetState.report_total_spent:,.2f}",
                             class_name="px-6 py-4 whitespace-nowrap text-sm font-bold text-gray-900 text-right",
                         ),
                         rx.el.td(
                             rx.el.span(
                                 rx.cond(
-                                    BudgetState.remaining_budget >= 0,
-                                    f"+${BudgetState.remaining_budget:,.2f}",
-                                    f"${BudgetState.remaining_budget:,.2f}",
+                                    BudgetState.report_remaining_budget >= 0,
+                                    f"+${BudgetState.report_remaining_budget:,.2f}",
+                                    f"${BudgetState.report_remaining_budget:,.2f}",
                                 ),
                                 class_name=rx.cond(
-                                    BudgetState.remaining_budget >= 0,
+                                    BudgetState.report_remaining_budget >= 0,
                                     "text-emerald-600 font-bold",
                                     "text-red-600 font-bold",
                                 ),
@@ -479,8 +470,8 @@ def comparison_table() -> rx.Component:
                         rx.el.td(
                             rx.el.div(
                                 rx.el.span(
-                                    f"{BudgetState.utilization_percentage}%",
-                                    class_name=f"inline-flex items-center px-2.5 py-0.5 rounded-full text-xs font-bold {BudgetState.budget_health_bg} {BudgetState.budget_health_color}",
+                                    f"{BudgetState.report_utilization_percentage}%",
+                                    class_name=f"inline-flex items-center px-2.5 py-0.5 rounded-full text-xs font-bold {BudgetState.report_health_bg} {BudgetState.report_health_color}",
                                 ),
                                 class_name="flex justify-end",
                             ),
@@ -519,10 +510,10 @@ def reports_page() -> rx.Component:
                             ),
                         ),
                         rx.el.select(
-                            rx.el.option("Year to Date", value="Year to Date"),
-                            rx.el.option("Last 6 Months", value="Last 6 Months"),
-                            rx.el.option("Last 3 Months", value="Last 3 Months"),
-                            rx.el.option("All Time", value="All Time"),
+                            *[
+                                rx.el.option(date_range, value=date_range)
+                                for date_range in REPORT_DATE_RANGES
+                            ],
                             value=BudgetState.report_date_range,
                             on_change=BudgetState.set_report_date_range,
                             class_name="px-4 py-2.5 rounded-xl border border-gray-200 focus:outline-none focus:ring-2 focus:ring-indigo-500 text-sm font-medium bg-white/50 backdrop-blur-sm",
@@ -531,16 +522,16 @@ def reports_page() -> rx.Component:
                     ),
                     rx.el.div(
                         summary_stat(
-                            "Total Spent YTD",
-                            f"${BudgetState.total_spent:,.2f}",
+                            "Total Spent",
+                            f"${BudgetState.report_total_spent:,.2f}",
                             "+12% vs last year",
                             icon="dollar-sign",
                             icon_color="blue",
                         ),
                         summary_stat(
                             "Remaining Budget",
-                            f"${BudgetState.remaining_budget:,.2f}",
-                            f"{100 - BudgetState.utilization_percentage}% of total",
+                            f"${BudgetState.report_remaining_budget:,.2f}",
+                            f"{100 - BudgetState.report_utilization_percentage}% of total",
                             icon="wallet",
                             icon_color="emerald",
                         ),
@@ -593,7 +584,9 @@ def reports_page() -> rx.Component:
                                 rx.el.button(
                                     rx.icon("table", size=20, class_name="mr-2"),
                                     "Export as CSV",
-                                    on_click=BudgetState.export_selected_expenses,
+                                    on_click=BudgetState.export_selected_expenses(
+                                        "csv"
+                                    ),
                                     class_name="w-full flex items-center justify-center px-4 py-3 bg-white border border-gray-200 hover:bg-gray-50 text-gray-700 font-medium rounded-xl transition-colors shadow-sm",
                                 ),
                                 class_name="bg-gradient-to-br from-indigo-50/50 to-purple-50/50 p-6 rounded-2xl border border-indigo-100 shadow-sm h-full flex flex-col justify-center",
@@ -4,6 +4,8 @@ from app.components.header import header
 from app.states.budget_state import BudgetState
 from app.states.settings_state import SettingsState
 
+IMPORT_UPLOAD_ID = "expense_import"
+
 
 def section_header(title: str, description: str) -> rx.Component:
     return rx.el.div(
@@ -273,14 +275,69 @@ def general_settings() -> rx.Component:
                             class_name="text-xs text-gray-500",
                         ),
                     ),
-                    rx.el.button(
-                        rx.icon("download", size=16, class_name="mr-2"),
-                        "Export CSV",
-                        on_click=SettingsState.export_data,
-                        class_name="flex items-center px-3 py-2 bg-white border border-gray-300 rounded-lg text-sm font-medium text-gray-700 hover:bg-gray-50",
+                    rx.el.div(
+                        rx.el.label(
+                            rx.el.input(
+                                type="checkbox",
+                                checked=SettingsState.export_gzip,
+                                on_change=SettingsState.toggle_export_gzip,
+                                class_name="mr-2 rounded border-gray-300 text-indigo-600",
+                            ),
+                            "Gzip",
+                            class_name="flex items-center text-xs text-gray-600 cursor-pointer",
+                        ),
+                        rx.el.button(
+                            rx.icon("download", size=16, class_name="mr-2"),
+                            rx.cond(
+                                SettingsState.export_in_progress,
+                                f"Exporting {SettingsState.export_progress}%",
+                                "Export CSV",
+                            ),
+                            on_click=SettingsState.export_data,
+                            disabled=SettingsState.export_in_progress,
+                            class_name="flex items-center px-3 py-2 bg-white border border-gray-300 rounded-lg text-sm font-medium text-gray-700 hover:bg-gray-50 disabled:opacity-60 disabled:cursor-wait",
+                        ),
+                        class_name="flex items-center gap-3",
                     ),
                     class_name="flex items-center justify-between p-4 bg-gray-50 rounded-lg",
                 ),
+                rx.el.div(
+                    rx.el.div(
+                        rx.el.p(
+                            "Import Expenses",
+                            class_name="text-sm font-medium text-gray-900",
+                        ),
+                        rx.el.p(
+                            "Upload a CSV in the export format; bad rows are reported.",
+                            class_name="text-xs text-gray-500",
+                        ),
+                    ),
+                    rx.upload.root(
+                        rx.el.button(
+                            rx.icon("upload", size=16, class_name="mr-2"),
+                            rx.cond(
+                                SettingsState.import_in_progress,
+                                f"Importing {SettingsState.import_rows} rows",
+                                "Import File",
+                            ),
+                            disabled=SettingsState.import_in_progress,
+                            class_name="flex items-center px-3 py-2 bg-white border border-gray-300 rounded-lg text-sm font-medium text-gray-700 hover:bg-gray-50 disabled:opacity-60 disabled:cursor-wait",
+                        ),
+                        id=IMPORT_UPLOAD_ID,
+                        accept={
+                            "text/csv": [".csv"],
+                            "application/gzip": [".gz"],
+                            "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet": [
+                                ".xlsx"
+                            ],
+                        },
+                        max_files=1,
+                        on_drop=SettingsState.handle_import_upload(
+                            rx.upload_files(upload_id=IMPORT_UPLOAD_ID)
+                        ),
+                    ),
+                    class_name="flex items-center justify-between p-4 mt-3 bg-gray-50 rounded-lg",
+                ),
                 class_name="bg-white p-5 rounded-xl border border-gray-200",
             ),
             class_name="grid grid-cols-1 md:grid-cols-2 gap-6",
@@ -1,8 +1,61 @@
 import reflex as rx
 from typing import TypedDict
+import asyncio
+import calendar
+import copy
 import datetime
 import uuid
 import logging
+import os
+import secrets
+from app.api import export_dir, export_url
+from app.data import audit, export, forecast, ledger, recurring, storage, trends
+from app.data.expense_store import STORE
+
+RECENT_EXPENSES_LIMIT = 8
+# Search boxes apply only the latest query after this quiet period.
+SEARCH_DEBOUNCE_SECONDS = float(
+    os.environ.get("BUDGET_TRACKER_SEARCH_DEBOUNCE", "0.3")
+)
+# How often an open page reruns load_data to pick up other sessions' writes.
+STORE_POLL_MS = 30_000
+EXPENSE_PAGE_SIZES = [10, 25, 50, 100]
+EXPORT_FORMATS = export.FORMATS
+FORECAST_MODELS = [(model, forecast.MODEL_LABELS[model]) for model in forecast.MODELS]
+REPORT_DATE_RANGES = ["Year to Date", "Last 6 Months", "Last 3 Months", "All Time"]
+
+
+def report_bounds(
+    date_range: str, today: datetime.date | None = None
+) -> tuple[str, str] | None:
+    """Half-open ("YYYY-MM", "YYYY-MM") month bounds of a report range ending
+    with the current month, or None for all time."""
+    today = today or datetime.date.today()
+    current = today.year * 12 + today.month - 1
+    months = {
+        "Year to Date": today.month,
+        "Last 6 Months": 6,
+        "Last 3 Months": 3,
+    }.get(date_range)
+    if months is None:
+        return None
+    return trends.month_key(current - months + 1), trends.month_key(current + 1)
+
+
+def _health_color(utilization: float, warning: float, critical: float) -> str:
+    if utilization > critical:
+        return "text-red-600"
+    elif utilization > warning:
+        return "text-orange-500"
+    return "text-emerald-600"
+
+
+def _health_bg(utilization: float, warning: float, critical: float) -> str:
+    if utilization > critical:
+        return "bg-red-100"
+    elif utilization > warning:
+        return "bg-orange-100"
+    return "bg-emerald-100"
 
 
 class Budget(TypedDict):
@@ -45,10 +98,11 @@ class Expense(TypedDict):
     has_attachment: bool
     tags: list[str]
     splits: list[ExpenseSplit]
-    comments: list[ExpenseComment]
-    history: list[ExpenseHistory]
     assigned_approver_id: str
     attachment_url: str
+    submitter_id: str
+    recurring_parent_id: str
+    recurring_through: str
 
 
 class ChartData(TypedDict):
@@ -79,6 +133,10 @@ class BudgetState(rx.State):
     is_attachment_preview_open: bool = False
     active_expense_tab: str = "details"
     new_comment_text: str = ""
+    # The open expense's comments and history, read from the expense log when
+    # their tab is first shown.
+    expense_comments: list[ExpenseComment] = []
+    expense_history: list[ExpenseHistory] = []
     attachment_zoom: int = 100
     current_budget: Budget = {
         "id": "",
@@ -99,12 +157,17 @@ class BudgetState(rx.State):
         "has_attachment": False,
         "tags": [],
         "splits": [],
-        "comments": [],
-        "history": [],
         "assigned_approver_id": "",
         "attachment_url": "",
+        "submitter_id": "",
+        "recurring_parent_id": "",
+        "recurring_through": "",
     }
-    selected_expense_ids: list[str] = []
+    _selected_expense_ids: set[str] = set()
+    # Expense log kinds already read for the open expense.
+    _loaded_expense_logs: set[str] = set()
+    include_committed_spend: bool = False
+    export_format: str = "csv"
     available_tags: list[str] = [
         "Travel",
         "Software",
@@ -116,368 +179,40 @@ class BudgetState(rx.State):
     ]
     expense_search: str = ""
     expense_category_filter: str = "All"
-    budgets: list[Budget] = [
-        {
-            "id": "b1",
-            "name": "Marketing",
-            "type": "Department",
-            "allocated_amount": 50000.0,
-            "period": "Annual",
-        },
-        {
-            "id": "b2",
-            "name": "Engineering",
-            "type": "Department",
-            "allocated_amount": 120000.0,
-            "period": "Annual",
-        },
-        {
-            "id": "b3",
-            "name": "Office Renovation",
-            "type": "Project",
-            "allocated_amount": 15000.0,
-            "period": "One-time",
-        },
-        {
-            "id": "b4",
-            "name": "Software Licenses",
-            "type": "Category",
-            "allocated_amount": 8000.0,
-            "period": "Annual",
-        },
-        {
-            "id": "b5",
-            "name": "Team Events",
-            "type": "Category",
-            "allocated_amount": 5000.0,
-            "period": "Annual",
-        },
-        {
-            "id": "b6",
-            "name": "HR",
-            "type": "Department",
-            "allocated_amount": 30000.0,
-            "period": "Annual",
-        },
-        {
-            "id": "b7",
-            "name": "Sales",
-            "type": "Department",
-            "allocated_amount": 80000.0,
-            "period": "Annual",
-        },
-        {
-            "id": "b8",
-            "name": "Operations",
-            "type": "Department",
-            "allocated_amount": 45000.0,
-            "period": "Annual",
-        },
-        {
-            "id": "b9",
-            "name": "Website Redesign",
-            "type": "Project",
-            "allocated_amount": 25000.0,
-            "period": "One-time",
-        },
-        {
-            "id": "b10",
-            "name": "Q2 Hiring Push",
-            "type": "Project",
-            "allocated_amount": 12000.0,
-            "period": "Q2",
-        },
-    ]
-    expenses: list[Expense] = [
-        {
-            "id": "e1",
-            "date": "2024-01-15",
-            "category": "Software Licenses",
-            "amount": 5000.0,
-            "payment_method": "Bank Transfer",
-            "description": "Annual Enterprise License Renewal",
-            "approval_status": "Approved",
-            "recurring_frequency": "Annual",
-            "has_attachment": True,
-            "tags": ["Software", "Internal"],
-            "splits": [],
-            "comments": [
-                {
-                    "id": "c1",
-                    "user": "Sarah Marketing",
-                    "avatar": "Sarah",
-                    "text": "Approved for annual renewal.",
-                    "timestamp": "2024-01-16 10:00",
-                }
-            ],
-            "history": [
-                {
-                    "action": "Approved",
-                    "user": "Sarah Marketing",
-                    "timestamp": "2024-01-16 10:00",
-                    "note": "Annual renewal",
-                }
-            ],
-            "assigned_approver_id": "",
-            "attachment_url": "https://images.unsplash.com/photo-1554224155-8d04cb21cd6c?auto=format&fit=crop&q=80&w=1000",
-        },
-        {
-            "id": "e2",
-            "date": "2024-01-20",
-            "category": "Marketing",
-            "amount": 1200.0,
-            "payment_method": "Credit Card",
-            "description": "Q1 Planning Workshop",
-            "approval_status": "Approved",
-            "recurring_frequency": "One-time",
-            "has_attachment": False,
-            "tags": ["Internal"],
-            "splits": [],
-            "comments": [],
-            "history": [],
-            "assigned_approver_id": "",
-            "attachment_url": "",
-        },
-        {
-            "id": "e3",
-            "date": "2024-01-25",
-            "category": "Engineering",
-            "amount": 800.0,
-            "payment_method": "Credit Card",
-            "description": "DevOps Tools",
-            "approval_status": "Approved",
-        },
-        {
-            "id": "e4",
-            "date": "2024-02-05",
-            "category": "Engineering",
-            "amount": 3500.0,
-            "payment_method": "Bank Transfer",
-            "description": "AWS Cloud Services - Jan",
-            "approval_status": "Approved",
-        },
-        {
-            "id": "e5",
-            "date": "2024-02-10",
-            "category": "Sales",
-            "amount": 1500.0,
-            "payment_method": "Credit Card",
-            "description": "Client Visit - Chicago",
-            "approval_status": "Approved",
-        },
-        {
-            "id": "e6",
-            "date": "2024-02-14",
-            "category": "Team Events",
-            "amount": 800.0,
-            "payment_method": "Reimbursement",
-            "description": "Valentine's Day Team Lunch",
-            "approval_status": "Approved",
-        },
-        {
-            "id": "e7",
-            "date": "2024-02-28",
-            "category": "Operations",
-            "amount": 450.0,
-            "payment_method": "Credit Card",
-            "description": "Office Supplies Restock",
-            "approval_status": "Approved",
-        },
-        {
-            "id": "e8",
-            "date": "2024-03-01",
-            "category": "Marketing",
-            "amount": 1200.5,
-            "payment_method": "Credit Card",
-            "description": "Q1 Ad Campaign Launch",
-            "approval_status": "Approved",
-        },
-        {
-            "id": "e9",
-            "date": "2024-03-02",
-            "category": "Engineering",
-            "amount": 3400.0,
-            "payment_method": "Bank Transfer",
-            "description": "AWS Cloud Services - Feb",
-            "approval_status": "Approved",
-        },
-        {
-            "id": "e10",
-            "date": "2024-03-05",
-            "category": "Office Renovation",
-            "amount": 850.0,
-            "payment_method": "Invoice",
-            "description": "New Ergonomic Chairs",
-            "approval_status": "Approved",
-        },
-        {
-            "id": "e11",
-            "date": "2024-03-10",
-            "category": "HR",
-            "amount": 2500.0,
-            "payment_method": "Invoice",
-            "description": "Recruitment Agency Fee",
-            "approval_status": "Pending",
-        },
-        {
-            "id": "e12",
-            "date": "2024-03-15",
-            "category": "Sales",
-            "amount": 3200.0,
-            "payment_method": "Credit Card",
-            "description": "Q1 Sales Conference Tickets",
-            "approval_status": "Approved",
-        },
-        {
-            "id": "e13",
-            "date": "2024-03-20",
-            "category": "Engineering",
-            "amount": 2100.0,
-            "payment_method": "Credit Card",
-            "description": "New Test Devices",
-            "approval_status": "Rejected",
-        },
-        {
-            "id": "e14",
-            "date": "2024-04-02",
-            "category": "Marketing",
-            "amount": 8000.0,
-            "payment_method": "Invoice",
-            "description": "Q2 Media Buy",
-            "approval_status": "Approved",
-        },
-        {
-            "id": "e15",
-            "date": "2024-04-05",
-            "category": "Engineering",
-            "amount": 3600.0,
-            "payment_method": "Bank Transfer",
-            "description": "AWS Cloud Services - Mar",
-            "approval_status": "Approved",
-        },
-        {
-            "id": "e16",
-            "date": "2024-04-10",
-            "category": "Website Redesign",
-            "amount": 5000.0,
-            "payment_method": "Bank Transfer",
-            "description": "Design Agency Deposit",
-            "approval_status": "Approved",
-        },
-        {
-            "id": "e17",
-            "date": "2024-04-15",
-            "category": "Q2 Hiring Push",
-            "amount": 2000.0,
-            "payment_method": "Credit Card",
-            "description": "LinkedIn Job Slots",
-            "approval_status": "Approved",
-        },
-        {
-            "id": "e18",
-            "date": "2024-04-22",
-            "category": "Operations",
-            "amount": 1200.0,
-            "payment_method": "Invoice",
-            "description": "HVAC Maintenance",
-            "approval_status": "Pending",
-        },
-        {
-            "id": "e19",
-            "date": "2024-05-03",
-            "category": "Engineering",
-            "amount": 4000.0,
-            "payment_method": "Bank Transfer",
-            "description": "AWS Cloud Services - Apr",
-            "approval_status": "Approved",
-        },
-        {
-            "id": "e20",
-            "date": "2024-05-10",
-            "category": "HR",
-            "amount": 1500.0,
-            "payment_method": "Credit Card",
-            "description": "Manager Training Workshop",
-            "approval_status": "Approved",
-        },
-        {
-            "id": "e21",
-            "date": "2024-05-15",
-            "category": "Website Redesign",
-            "amount": 8000.0,
-            "payment_method": "Bank Transfer",
-            "description": "Development Milestone 1",
-            "approval_status": "Approved",
-        },
-        {
-            "id": "e22",
-            "date": "2024-05-20",
-            "category": "Marketing",
-            "amount": 450.0,
-            "payment_method": "Reimbursement",
-            "description": "Client Gifts",
-            "approval_status": "Rejected",
-        },
-        {
-            "id": "e23",
-            "date": "2024-06-01",
-            "category": "Team Events",
-            "amount": 1200.0,
-            "payment_method": "Credit Card",
-            "description": "Summer Team Outing",
-            "approval_status": "Pending",
-        },
-        {
-            "id": "e24",
-            "date": "2024-06-05",
-            "category": "Engineering",
-            "amount": 4200.0,
-            "payment_method": "Bank Transfer",
-            "description": "AWS Cloud Services - May",
-            "approval_status": "Approved",
-        },
-        {
-            "id": "e25",
-            "date": "2024-06-12",
-            "category": "Sales",
-            "amount": 4000.0,
-            "payment_method": "Credit Card",
-            "description": "Annual Client Dinner",
-            "approval_status": "Approved",
-        },
-        {
-            "id": "e26",
-            "date": "2024-06-25",
-            "category": "Office Renovation",
-            "amount": 5500.0,
-            "payment_method": "Invoice",
-            "description": "Painting and Flooring",
-            "approval_status": "Approved",
-        },
-        {
-            "id": "e27",
-            "date": "2024-06-28",
-            "category": "Q2 Hiring Push",
-            "amount": 3500.0,
-            "payment_method": "Invoice",
-            "description": "Headhunter Success Fee",
-            "approval_status": "Pending",
-        },
-    ]
+    expense_page: int = 0
+    expense_page_size: int = 25
+    # Rows keyed by id, in insertion order, so single-row edits are O(1).
+    _budgets: dict[str, Budget] = {}
     departments: list[str] = ["Marketing", "Engineering", "HR", "Sales", "Operations"]
     projects: list[str] = ["Office Renovation", "Website Redesign", "Q2 Hiring Push"]
     warning_threshold: int = 75
     critical_threshold: int = 90
     report_date_range: str = "Year to Date"
+    forecast_model: str = forecast.DEFAULT_MODEL
+    _expense_search_seq: int = 0
+    # Bumped whenever the budgets change; vars of other states read it so
+    # that dependency tracking recomputes them then.
+    _budgets_version: int = 0
+    # The STORE version this session's expense vars were computed from; every
+    # var reading the store depends on it.
+    _store_version: int = 0
+
+    @rx.var
+    def budgets(self) -> list[Budget]:
+        return list(self._budgets.values())
 
     @rx.var
     def total_budget(self) -> float:
         return sum((b["allocated_amount"] for b in self.budgets))
 
-    @rx.var
+    @rx.var(deps=["_store_version"])
     def total_spent(self) -> float:
         return sum(
-            (e["amount"] for e in self.expenses if e["approval_status"] != "Rejected")
+            (
+                entry[0]
+                for status, entry in STORE.ledger["status"].items()
+                if status != "Rejected"
+            )
         )
 
     @rx.var
@@ -488,153 +223,154 @@ class BudgetState(rx.State):
     def utilization_percentage(self) -> float:
         if self.total_budget == 0:
             return 0.0
-        return round(self.total_spent / self.total_budget * 100, 1)
+        spent = self.total_spent + sum(self._committed_by_category.values())
+        return round(spent / self.total_budget * 100, 1)
 
     @rx.var
     def budget_health_color(self) -> str:
         """Returns a tailwind color class based on budget health."""
-        if self.utilization_percentage > self.critical_threshold:
-            return "text-red-600"
-        elif self.utilization_percentage > self.warning_threshold:
-            return "text-orange-500"
-        return "text-emerald-600"
+        return _health_color(
+            self.utilization_percentage, self.warning_threshold, self.critical_threshold
+        )
 
     @rx.var
     def budget_health_bg(self) -> str:
         """Returns a tailwind bg class based on budget health."""
-        if self.utilization_percentage > self.critical_threshold:
-            return "bg-red-100"
-        elif self.utilization_percentage > self.warning_threshold:
-            return "bg-orange-100"
-        return "bg-emerald-100"
+        return _health_bg(
+            self.utilization_percentage, self.warning_threshold, self.critical_threshold
+        )
+
+    @rx.var(deps=["_store_version"])
+    def _spent_by_category(self) -> dict[str, float]:
+        """Non-rejected spend per category, read from the running ledger."""
+        return ledger.spent_by_category(STORE.ledger)
+
+    @rx.var
+    def _report_bounds(self) -> tuple[str, str] | None:
+        return report_bounds(self.report_date_range)
+
+    @rx.var(deps=["_store_version"])
+    def _report_spent_by_category(self) -> dict[str, float]:
+        """Spend per category within the report range, summed from the cube."""
+        return ledger.spent_by_category(STORE.ledger, self._report_bounds)
+
+    @rx.var
+    def report_total_spent(self) -> float:
+        return round(
+            sum(self._report_spent_by_category.values()), ledger.MONEY_PLACES
+        )
+
+    @rx.var
+    def report_remaining_budget(self) -> float:
+        return self.total_budget - self.report_total_spent
+
+    @rx.var
+    def report_utilization_percentage(self) -> float:
+        if self.total_budget == 0:
+            return 0.0
+        return round(self.report_total_spent / self.total_budget * 100, 1)
+
+    @rx.var
+    def report_health_color(self) -> str:
+        return _health_color(
+            self.report_utilization_percentage,
+            self.warning_threshold,
+            self.critical_threshold,
+        )
+
+    @rx.var
+    def report_health_bg(self) -> str:
+        return _health_bg(
+            self.report_utilization_percentage,
+            self.warning_threshold,
+            self.critical_threshold,
+        )
 
     @rx.var
     def budget_vs_actual_data(self) -> list[ChartData]:
-        data = []
-        for budget in self.budgets:
-            category_spent = sum(
-                (
-                    e["amount"]
-                    for e in self.expenses
-                    if e["category"] == budget["name"]
-                    and e["approval_status"] != "Rejected"
-                )
-            )
-            data.append(
-                {
-                    "name": budget["name"],
-                    "allocated": budget["allocated_amount"],
-                    "spent": category_spent,
-                }
-            )
-        return data
+        spent_by_category = self._spent_by_category
+        return [
+            {
+                "name": budget["name"],
+                "allocated": budget["allocated_amount"],
+                "spent": spent_by_category.get(budget["name"], 0),
+            }
+            for budget in self.budgets
+        ]
+
+    @rx.var(deps=["_store_version"])
+    def _committed_spend(self) -> dict[tuple[str, str], float]:
+        """Spend recurring templates commit to from tomorrow to the end of the
+        year, per (month, category); dates are generated, rows are not."""
+        today = datetime.date.today()
+        expenses = STORE.expenses
+        templates = [expenses[i] for i in STORE.template_ids]
+        return recurring.committed_spend(
+            templates, today, datetime.date(today.year, 12, 31)
+        )
+
+    @rx.var
+    def _committed_by_category(self) -> dict[str, float]:
+        """Committed recurring spend per category when it counts toward
+        utilization, else empty."""
+        committed = {}
+        if self.include_committed_spend:
+            for (_, category), amount in self._committed_spend.items():
+                committed[category] = committed.get(category, 0) + amount
+        return committed
 
     @rx.var
     def budget_stats(self) -> list[BudgetStats]:
-        stats = []
-        for b in self.budgets:
-            spent = sum(
-                (
-                    e["amount"]
-                    for e in self.expenses
-                    if e["category"] == b["name"] and e["approval_status"] != "Rejected"
-                )
-            )
-            total = b["allocated_amount"]
-            utilization = spent / total * 100 if total > 0 else 0.0
-            stats.append(
-                {
-                    "id": b["id"],
-                    "name": b["name"],
-                    "type": b["type"],
-                    "allocated_amount": total,
-                    "period": b["period"],
-                    "spent": spent,
-                    "remaining": total - spent,
-                    "utilization": round(utilization, 1),
-                    "health_color": "text-red-600"
-                    if utilization > self.critical_threshold
-                    else "text-orange-500"
-                    if utilization > self.warning_threshold
-                    else "text-emerald-600",
-                    "health_bg": "bg-red-50"
-                    if utilization > self.critical_threshold
-                    else "bg-orange-50"
-                    if utilization > self.warning_threshold
-                    else "bg-emerald-50",
-                    "progress_color": "bg-red-600"
-                    if utilization > self.critical_threshold
-                    else "bg-orange-500"
-                    if utilization > self.warning_threshold
-                    else "bg-emerald-600",
-                }
-            )
-        return stats
+        spent_by_category = self._spent_by_category
+        committed = self._committed_by_category
+        if committed:
+            spent_by_category = {
+                category: spent_by_category.get(category, 0) + committed.get(category, 0)
+                for category in spent_by_category.keys() | committed.keys()
+            }
+        return self._budget_stats(spent_by_category)
 
     @rx.var
+    def report_budget_stats(self) -> list[BudgetStats]:
+        """Budget stats with spend limited to the report range."""
+        return self._budget_stats(self._report_spent_by_category)
+
+    @rx.var(deps=["_store_version"])
     def pending_approvals_count(self) -> int:
-        return len([e for e in self.expenses if e["approval_status"] == "Pending"])
+        pending = STORE.ledger["status"].get("Pending")
+        return pending[1] if pending else 0
 
     @rx.var
     def category_distribution(self) -> list[dict]:
         """Returns data for pie chart distribution."""
-        distribution = {}
-        for e in self.expenses:
-            if e["approval_status"] == "Rejected":
-                continue
-            cat = e["category"]
-            distribution[cat] = distribution.get(cat, 0) + e["amount"]
+        return [{"name": k, "value": v} for k, v in self._spent_by_category.items()]
+
+    @rx.var
+    def report_category_distribution(self) -> list[dict]:
         return [
-            {"name": k, "value": v} for i, (k, v) in enumerate(distribution.items())
+            {"name": k, "value": v} for k, v in self._report_spent_by_category.items()
         ]
 
+    @rx.var(deps=["_store_version"])
+    def _monthly_trend_matrix(self) -> trends.TrendMatrix:
+        """Dense (year, month) x category spend in the report range, from the cube."""
+        return trends.month_category_matrix(STORE.ledger, self._report_bounds)
+
     @rx.var
     def monthly_trends(self) -> list[dict]:
-        """Returns data for line chart trends."""
-        trends = {}
-        all_categories = set()
-        for e in self.expenses:
-            if e["approval_status"] == "Rejected":
-                continue
-            try:
-                date_obj = datetime.datetime.strptime(e["date"], "%Y-%m-%d")
-                month_key = date_obj.strftime("%b")
-                if month_key not in trends:
-                    trends[month_key] = {"name": month_key}
-                cat = e["category"]
-                all_categories.add(cat)
-                trends[month_key][cat] = trends[month_key].get(cat, 0) + e["amount"]
-            except Exception as e:
-                logging.exception(f"Error processing expense date: {e}")
-                continue
-        months_order = [
-            "Jan",
-            "Feb",
-            "Mar",
-            "Apr",
-            "May",
-            "Jun",
-            "Jul",
-            "Aug",
-            "Sep",
-            "Oct",
-            "Nov",
-            "Dec",
-        ]
-        result = []
-        for m in months_order:
-            if m in trends:
-                for cat in all_categories:
-                    if cat not in trends[m]:
-                        trends[m][cat] = 0
-                result.append(trends[m])
-        return result
+        """Returns data for line chart trends, one dense row per (year, month)."""
+        return self._monthly_trend_matrix.records()
+
+    @rx.var
+    def monthly_trend_categories(self) -> list[str]:
+        """The matrix columns; the trend chart draws one line per entry."""
+        return self._monthly_trend_matrix.categories
 
     @rx.var
     def top_spending_category(self) -> str:
-        if not self.category_distribution:
+        if not self.report_category_distribution:
             return "None"
-        return max(self.category_distribution, key=lambda x: x["value"])["name"]
+        return max(self.report_category_distribution, key=lambda x: x["value"])["name"]
 
     @rx.var
     def current_split_total(self) -> float:
@@ -644,59 +380,100 @@ class BudgetState(rx.State):
     def split_difference(self) -> float:
         return self.current_expense["amount"] - self.current_split_total
 
+    def _filtered_expense_ids(self) -> set[str] | None:
+        """Ids passing the search and category filters, or None when unfiltered.
+
+        A method rather than a cached var, so the id set is never stored (and
+        pickled) with the session; the store caches it per filter instead.
+        """
+        return STORE.filtered_ids(self.expense_search, self.expense_category_filter)
+
+    @rx.var(deps=["_store_version"])
+    def expense_total_count(self) -> int:
+        ids = self._filtered_expense_ids()
+        return len(STORE.expenses) if ids is None else len(ids)
+
     @rx.var
-    def filtered_expenses(self) -> list[Expense]:
-        filtered = self.expenses
-        if self.expense_category_filter != "All":
-            filtered = [
-                e for e in filtered if e["category"] == self.expense_category_filter
-            ]
-        if self.expense_search:
-            search = self.expense_search.lower()
-            filtered = [
-                e
-                for e in filtered
-                if search in e["description"].lower() or search in e["category"].lower()
-            ]
-        return sorted(filtered, key=lambda x: x["date"], reverse=True)
+    def expense_page_count(self) -> int:
+        return max(1, -(-self.expense_total_count // self.expense_page_size))
+
+    @rx.var(deps=["_store_version"])
+    def paged_expenses(self) -> list[Expense]:
+        """The visible page of filtered expenses; the only rows sent to the client."""
+        page = min(self.expense_page, self.expense_page_count - 1)
+        expenses = STORE.expenses
+        return [
+            expenses[i]
+            for i in STORE.date_index.newest(
+                self._filtered_expense_ids(),
+                page * self.expense_page_size,
+                self.expense_page_size,
+            )
+        ]
 
     @rx.var
-    def spending_forecast(self) -> list[dict]:
-        """Returns forecast data for area chart based on actual expenses."""
-        import datetime
-        import calendar
+    def expense_page_label(self) -> str:
+        if self.expense_total_count == 0:
+            return "No expenses"
+        page = min(self.expense_page, self.expense_page_count - 1)
+        start = page * self.expense_page_size
+        end = min(start + self.expense_page_size, self.expense_total_count)
+        return f"Showing {start + 1}-{end} of {self.expense_total_count}"
+
+    @rx.var(deps=["_store_version"])
+    def recent_expenses(self) -> list[Expense]:
+        """The most recent expenses for the dashboard widget."""
+        expenses = STORE.expenses
+        return [
+            expenses[i] for i in STORE.date_index.newest(count=RECENT_EXPENSES_LIMIT)
+        ]
 
-        current_year = datetime.date.today().year
-        monthly_data = {}
-        for m in range(1, 13):
-            month_name = calendar.month_abbr[m]
-            monthly_data[month_name] = {"actual": 0, "projected": 0}
-        for e in self.expenses:
-            if e["approval_status"] == "Rejected":
-                continue
-            try:
-                date_obj = datetime.datetime.strptime(e["date"], "%Y-%m-%d")
-                if date_obj.year == current_year:
-                    month_name = date_obj.strftime("%b")
-                    monthly_data[month_name]["actual"] += e["amount"]
-            except Exception as e:
-                logging.exception(f"Error processing spending forecast: {e}")
-                continue
-        total_actual = sum((d["actual"] for d in monthly_data.values()))
-        months_with_data = len([d for d in monthly_data.values() if d["actual"] > 0])
-        avg_spend = total_actual / max(1, months_with_data)
-        current_month_idx = datetime.date.today().month
+    @rx.var
+    def selected_expense_count(self) -> int:
+        return len(self._selected_expense_ids)
+
+    @rx.var
+    def selected_expense_ids(self) -> list[str]:
+        """Selected ids on the visible page; the full selection stays server-side."""
+        return [
+            e["id"] for e in self.paged_expenses if e["id"] in self._selected_expense_ids
+        ]
+
+    @rx.var(deps=["_store_version"])
+    def spending_forecast(self) -> list[dict]:
+        """Actual spend this year to date, then the selected model's projection,
+        never below the spend recurring templates already commit to.
+
+        Models fit the complete months before the current one; the store
+        memoizes each fit, so switching models back and forth does not refit.
+        """
+        today = datetime.date.today()
+        current_month = today.year * 12 + today.month - 1
+        projected = STORE.forecast(
+            self.forecast_model, current_month, 13 - today.month
+        )
+        monthly_actual = ledger.month_totals(STORE.ledger, today.year)
+        committed = {}
+        for (month, _), amount in self._committed_spend.items():
+            committed[month] = committed.get(month, 0) + amount
         result = []
-        for i, m in enumerate(range(1, 13)):
-            month_name = calendar.month_abbr[m]
-            data_point = {"month": month_name, "actual": 0, "projected": 0}
-            if i < current_month_idx:
-                data_point["actual"] = monthly_data[month_name]["actual"]
-                data_point["projected"] = monthly_data[month_name]["actual"]
+        for m in range(1, 13):
+            data_point = {
+                "month": calendar.month_abbr[m],
+                "actual": 0,
+                "projected": 0,
+                "committed": 0,
+            }
+            if m <= today.month:
+                data_point["actual"] = monthly_actual[m]
+                data_point["projected"] = monthly_actual[m]
             else:
-                growth_factor = 1 + (i - current_month_idx) * 0.02
-                data_point["actual"] = 0
-                data_point["projected"] = round(avg_spend * growth_factor)
+                data_point["committed"] = round(
+                    committed.get(f"{today.year:04d}-{m:02d}", 0)
+                )
+                data_point["projected"] = max(
+                    round(projected[m - today.month]), data_point["committed"]
+                )
             result.append(data_point)
         return result
 
@@ -704,21 +481,77 @@ class BudgetState(rx.State):
     def department_comparison_data(self) -> list[dict]:
         """Returns data for department comparison bar chart."""
         data = []
+        spent_by_category = self._report_spent_by_category
         for b in self.budgets:
             if b["type"] == "Department":
-                spent = sum(
-                    (
-                        e["amount"]
-                        for e in self.expenses
-                        if e["category"] == b["name"]
-                        and e["approval_status"] != "Rejected"
-                    )
-                )
+                spent = spent_by_category.get(b["name"], 0)
                 data.append(
                     {"name": b["name"], "Budget": b["allocated_amount"], "Spent": spent}
                 )
         return sorted(data, key=lambda x: x["Spent"], reverse=True)
 
+    def _budget_stats(self, spent_by_category: dict[str, float]) -> list[BudgetStats]:
+        stats = []
+        for b in self.budgets:
+            spent = spent_by_category.get(b["name"], 0)
+            total = b["allocated_amount"]
+            utilization = spent / total * 100 if total > 0 else 0.0
+            stats.append(
+                {
+                    "id": b["id"],
+                    "name": b["name"],
+                    "type": b["type"],
+                    "allocated_amount": total,
+                    "period": b["period"],
+                    "spent": spent,
+                    "remaining": total - spent,
+                    "utilization": round(utilization, 1),
+                    "health_color": "text-red-600"
+                    if utilization > self.critical_threshold
+                    else "text-orange-500"
+                    if utilization > self.warning_threshold
+                    else "text-emerald-600",
+                    "health_bg": "bg-red-50"
+                    if utilization > self.critical_threshold
+                    else "bg-orange-50"
+                    if utilization > self.warning_threshold
+                    else "bg-emerald-50",
+                    "progress_color": "bg-red-600"
+                    if utilization > self.critical_threshold
+                    else "bg-orange-500"
+                    if utilization > self.warning_threshold
+                    else "bg-emerald-600",
+                }
+            )
+        return stats
+
+    @rx.event(background=True)
+    async def load_data(self):
+        """Brings this session up to date with storage and the shared store.
+
+        The store loads on a worker thread on first use, and again whenever
+        another process has changed expenses; otherwise this only picks up its
+        current version and the budgets. Runs on every page load and on the
+        sidebar's poll, so writes from other sessions show up within
+        STORE_POLL_MS.
+        """
+        await STORE.refresh(datetime.date.today())
+        budgets = await asyncio.to_thread(storage.load_budgets)
+        async with self:
+            budgets = {b["id"]: b for b in budgets}
+            if budgets != self._budgets:
+                self._budgets = budgets
+                self._budgets_version += 1
+            self._sync_store()
+
+    def _sync_store(self):
+        """Points this session's expense vars at the store's current version."""
+        if self._store_version != STORE.version:
+            self._store_version = STORE.version
+            self._selected_expense_ids = {
+                i for i in self._selected_expense_ids if i in STORE.expenses
+            }
+
     @rx.event
     def open_add_budget_modal(self):
         self.current_budget = {
@@ -755,19 +588,21 @@ class BudgetState(rx.State):
         if self.current_budget["name"] == "":
             return
         if self.current_budget["id"]:
-            self.budgets = [
-                b if b["id"] != self.current_budget["id"] else self.current_budget
-                for b in self.budgets
-            ]
+            self._budgets[self.current_budget["id"]] = self.current_budget
+            storage.save_budget(self.current_budget)
         else:
             new_budget = self.current_budget.copy()
             new_budget["id"] = str(uuid.uuid4())
-            self.budgets.append(new_budget)
+            self._budgets[new_budget["id"]] = new_budget
+            storage.save_budget(new_budget)
+        self._budgets_version += 1
         self.close_budget_modal()
 
     @rx.event
     def delete_budget(self, id: str):
-        self.budgets = [b for b in self.budgets if b["id"] != id]
+        self._budgets.pop(id, None)
+        storage.delete_budget(id)
+        self._budgets_version += 1
 
     @rx.event
     def open_add_expense_modal(self):
@@ -784,28 +619,37 @@ class BudgetState(rx.State):
             "has_attachment": False,
             "tags": [],
             "splits": [],
-            "comments": [],
-            "history": [],
             "assigned_approver_id": "",
             "attachment_url": "",
+            "submitter_id": "",
+            "recurring_parent_id": "",
+            "recurring_through": "",
         }
         self.active_expense_tab = "details"
+        self.expense_comments = []
+        self.expense_history = []
+        self._loaded_expense_logs = set()
         self.is_expense_modal_open = True
 
     @rx.event
     def open_edit_expense_modal(self, expense: Expense):
         if "splits" not in expense:
             expense["splits"] = []
-        if "comments" not in expense:
-            expense["comments"] = []
-        if "history" not in expense:
-            expense["history"] = []
         if "assigned_approver_id" not in expense:
             expense["assigned_approver_id"] = ""
         if "attachment_url" not in expense:
             expense["attachment_url"] = ""
+        if "submitter_id" not in expense:
+            expense["submitter_id"] = ""
+        if "recurring_parent_id" not in expense:
+            expense["recurring_parent_id"] = ""
+        if "recurring_through" not in expense:
+            expense["recurring_through"] = ""
         self.current_expense = expense
         self.active_expense_tab = "details"
+        self.expense_comments = []
+        self.expense_history = []
+        self._loaded_expense_logs = set()
         self.is_expense_modal_open = True
 
     @rx.event
@@ -816,6 +660,20 @@ class BudgetState(rx.State):
     @rx.event
     def set_active_expense_tab(self, tab: str):
         self.active_expense_tab = tab
+        if tab in storage.EXPENSE_LOG_KINDS:
+            self._load_expense_log(tab)
+
+    def _load_expense_log(self, kind: str):
+        """Reads the open expense's `kind` log once per opening of the modal."""
+        id = self.current_expense["id"]
+        if not id or kind in self._loaded_expense_logs:
+            return
+        entries = storage.load_expense_log(id, kind)
+        if kind == "comments":
+            self.expense_comments = entries
+        else:
+            self.expense_history = entries
+        self._loaded_expense_logs.add(kind)
 
     @rx.event
     def update_current_expense(self, key: str, value: str):
@@ -835,9 +693,10 @@ class BudgetState(rx.State):
         new_expense["description"] = f"Copy of {expense['description']}"
         new_expense["date"] = datetime.date.today().isoformat()
         new_expense["approval_status"] = "Pending"
-        new_expense["history"] = []
-        new_expense["comments"] = []
-        self.expenses.insert(0, new_expense)
+        new_expense["recurring_parent_id"] = ""
+        new_expense["recurring_through"] = ""
+        STORE.add(new_expense)
+        self._sync_store()
         return rx.toast("Expense duplicated successfully")
 
     @rx.event
@@ -851,7 +710,12 @@ class BudgetState(rx.State):
             "text": self.new_comment_text,
             "timestamp": datetime.datetime.now().strftime("%Y-%m-%d %H:%M"),
         }
-        self.current_expense["comments"].append(comment)
+        if self.current_expense["id"]:
+            self._load_expense_log("comments")
+            storage.append_expense_log(
+                [(self.current_expense["id"], "comments", comment)]
+            )
+        self.expense_comments.append(comment)
         self.new_comment_text = ""
 
     @rx.event
@@ -913,47 +777,98 @@ class BudgetState(rx.State):
     def save_expense(self):
         if self.current_expense["description"] == "":
             return
-        self.current_expense["history"].append(
-            {
-                "action": "Updated",
-                "user": "Alex Finance",
-                "timestamp": datetime.datetime.now().strftime("%Y-%m-%d %H:%M"),
-                "note": "Expense details updated",
-            }
-        )
-        if self.current_expense["id"]:
-            self.expenses = [
-                e if e["id"] != self.current_expense["id"] else self.current_expense
-                for e in self.expenses
-            ]
+        if not ledger.valid_amount(self.current_expense["amount"]):
+            return rx.toast("Amount must be a number, zero or more.")
+        timestamp = datetime.datetime.now().strftime("%Y-%m-%d %H:%M")
+        expense = copy.deepcopy(self.current_expense)
+        if expense["id"]:
+            old_expense = STORE.save(expense)
+            # Diff what was stored: save may keep a later recurring_through.
+            stored = STORE.expenses[expense["id"]]
+            changed = audit.diff(old_expense or {}, stored, storage.REVISION_COLUMNS)
+            storage.append_expense_log(
+                [
+                    (
+                        expense["id"],
+                        "history",
+                        {
+                            "action": "Updated",
+                            "user": "Alex Finance",
+                            "timestamp": timestamp,
+                            "note": (
+                                "Changed "
+                                + ", ".join(c.replace("_", " ") for c in changed)
+                                if changed
+                                else "Expense details updated"
+                            ),
+                        },
+                    )
+                ]
+            )
         else:
-            new_expense = self.current_expense.copy()
-            new_expense["id"] = str(uuid.uuid4())
-            new_expense["history"].append(
-                {
-                    "action": "Created",
-                    "user": "Alex Finance",
-                    "timestamp": datetime.datetime.now().strftime("%Y-%m-%d %H:%M"),
-                    "note": "Initial submission",
-                }
+            expense["id"] = str(uuid.uuid4())
+            STORE.add(expense)
+            # Comments added before the first save were held on the modal.
+            storage.append_expense_log(
+                [(expense["id"], "comments", c) for c in self.expense_comments]
+                + [
+                    (
+                        expense["id"],
+                        "history",
+                        {
+                            "action": "Created",
+                            "user": "Alex Finance",
+                            "timestamp": timestamp,
+                            "note": "Initial submission",
+                        },
+                    )
+                ]
             )
-            self.expenses.append(new_expense)
+        if recurring.is_template(expense):
+            STORE.materialize(datetime.date.today())
+        self._sync_store()
         self.close_expense_modal()
 
     @rx.event
     def delete_expense(self, id: str):
-        self.expenses = [e for e in self.expenses if e["id"] != id]
+        STORE.delete([id])
+        self._selected_expense_ids.discard(id)
+        self._sync_store()
         if self.is_expense_modal_open and self.current_expense["id"] == id:
             self.is_expense_modal_open = False
             return rx.toast("Expense deleted.")
 
-    @rx.event
-    def set_expense_search(self, value: str):
-        self.expense_search = value
+    @rx.event(background=True)
+    async def set_expense_search(self, value: str):
+        """Applies only the latest query once typing pauses, dropping stale ones."""
+        async with self:
+            self._expense_search_seq += 1
+            seq = self._expense_search_seq
+        await asyncio.sleep(SEARCH_DEBOUNCE_SECONDS)
+        async with self:
+            if seq == self._expense_search_seq:
+                self.expense_search = value
+                self.expense_page = 0
 
     @rx.event
     def set_expense_category_filter(self, value: str):
         self.expense_category_filter = value
+        self.expense_page = 0
+
+    @rx.event
+    def set_expense_page_size(self, value: str):
+        self.expense_page_size = int(value)
+        self.expense_page = 0
+
+    @rx.event
+    def next_expense_page(self):
+        if self.expense_page < self.expense_page_count - 1:
+            self.expense_page += 1
+
+    @rx.event
+    def prev_expense_page(self):
+        if self.expense_page > 0:
+            self.expense_page -= 1
 
     @rx.event
     def set_report_date_range(self, value: str):
@@ -993,46 +908,106 @@ class BudgetState(rx.State):
 
     @rx.event
     def toggle_expense_selection(self, id: str):
-        if id in self.selected_expense_ids:
-            self.selected_expense_ids.remove(id)
+        if id in self._selected_expense_ids:
+            self._selected_expense_ids.discard(id)
         else:
-            self.selected_expense_ids.append(id)
+            self._selected_expense_ids.add(id)
 
     @rx.event
     def toggle_all_expenses(self):
-        if len(self.selected_expense_ids) == len(self.filtered_expenses):
-            self.selected_expense_ids = []
+        ids = self._filtered_expense_ids()
+        if self.selected_expense_count == self.expense_total_count:
+            self._selected_expense_ids = set()
+        elif ids is None:
+            self._selected_expense_ids = set(STORE.expenses)
         else:
-            self.selected_expense_ids = [e["id"] for e in self.filtered_expenses]
+            self._selected_expense_ids = set(ids)
+
+    def _selected_ids(self) -> list[str]:
+        return [i for i in self._selected_expense_ids if i in STORE.expenses]
+
+    async def _record_bulk_activity(self, action: str, expenses: list[Expense]):
+        """Adds one activity entry summarizing a bulk action on `expenses`."""
+        from app.states.team_state import TeamState
+
+        team_state = await self.get_state(TeamState)
+        total = sum(e["amount"] for e in expenses)
+        noun = "expense" if len(expenses) == 1 else "expenses"
+        team_state.add_activity(
+            f"{action} {len(expenses)} {noun}", f"${total:,.2f}", "expense"
+        )
+
+    async def _set_selected_status(self, status: str, action: str):
+        changed = STORE.set_status(self._selected_ids(), status)
+        self._selected_expense_ids = set()
+        self._sync_store()
+        if changed:
+            await self._record_bulk_activity(action, changed)
 
     @rx.event
-    def approve_selected_expenses(self):
-        for e in self.expenses:
-            if e["id"] in self.selected_expense_ids:
-                e["approval_status"] = "Approved"
-        self.selected_expense_ids = []
+    async def approve_selected_expenses(self):
+        await self._set_selected_status("Approved", "approved")
         return rx.toast("Selected expenses approved.")
 
     @rx.event
-    def reject_selected_expenses(self):
-        for e in self.expenses:
-            if e["id"] in self.selected_expense_ids:
-                e["approval_status"] = "Rejected"
-        self.selected_expense_ids = []
+    async def reject_selected_expenses(self):
+        await self._set_selected_status("Rejected", "rejected")
         return rx.toast("Selected expenses rejected.")
 
     @rx.event
-    def delete_selected_expenses(self):
-        self.expenses = [
-            e for e in self.expenses if e["id"] not in self.selected_expense_ids
-        ]
-        self.selected_expense_ids = []
+    async def delete_selected_expenses(self):
+        removed = STORE.delete(self._selected_ids())
+        self._selected_expense_ids = set()
+        self._sync_store()
+        if removed:
+            await self._record_bulk_activity("deleted", removed)
         return rx.toast("Selected expenses deleted.")
 
     @rx.event
-    def export_selected_expenses(self):
-        self.selected_expense_ids = []
-        return rx.toast("Exporting selected expenses...", duration=3000)
+    def set_export_format(self, fmt: str):
+        if fmt in EXPORT_FORMATS:
+            self.export_format = fmt
+
+    @rx.event
+    def toggle_include_committed_spend(self):
+        self.include_committed_spend = not self.include_committed_spend
+
+    @rx.event
+    def set_forecast_model(self, model: str):
+        if model in forecast.MODELS:
+            self.forecast_model = model
+
+    @rx.event(background=True)
+    async def export_selected_expenses(self, fmt: str):
+        """Streams the selected expenses (all of them if none are selected) to a
+        `fmt` file on a worker thread, then downloads it. The selection is
+        cleared only once the export succeeds."""
+        if fmt not in EXPORT_FORMATS:
+            return rx.toast(f"Unsupported export format {fmt!r}.")
+        async with self:
+            ids = set(self._selected_expense_ids) or None
+        timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
+        filename = export.filename(
+            f"expenses_{timestamp}_{secrets.token_hex(4)}", fmt
+        )
+        directory = export_dir()
+        try:
+            directory.mkdir(parents=True, exist_ok=True)
+            rows = await asyncio.to_thread(
+                export.write_expenses, directory / filename, fmt, ids
+            )
+        except Exception as e:
+            logging.exception(f"Error exporting selected expenses: {e}")
+            return rx.toast("Export failed. Please try again.")
+        if ids is not None:
+            async with self:
+                # Leave a selection changed while the export ran alone.
+                if self._selected_expense_ids == ids:
+                    self._selected_expense_ids = set()
+        return [
+            rx.download(url=rx.Var.create(export_url(filename)), filename=filename),
+            rx.toast(f"Exported {rows} expenses.", duration=3000),
+        ]
 
     @rx.event
     def export_report_pdf(self):
@@ -3,56 +3,71 @@ from app.states.budget_state import BudgetState
 from app.states.team_state import TeamState
 
 
+def _build_budget_alerts(bs: BudgetState) -> list[str]:
+    alerts = []
+    spent_by_category = bs._spent_by_category
+    for b in bs.budgets:
+        spent = spent_by_category.get(b["name"], 0)
+        total = b["allocated_amount"]
+        if total > 0:
+            utilization = spent / total * 100
+            if utilization > bs.critical_threshold:
+                alerts.append(
+                    f"Critical: {b['name']} is at {utilization:.1f}% utilization"
+                )
+            elif utilization > bs.warning_threshold:
+                alerts.append(
+                    f"Warning: {b['name']} is at {utilization:.1f}% utilization"
+                )
+    return alerts
+
+
+def _build_spending_insights(bs: BudgetState) -> list[str]:
+    insights = []
+    if bs.total_spent > bs.total_budget * 0.8:
+        insights.append(
+            "Spending velocity is high. Consider freezing non-essential expenses."
+        )
+    pending_count = bs.pending_approvals_count
+    if pending_count > 5:
+        insights.append(
+            f"You have {pending_count} pending approvals. Clearing these will update accurate spend data."
+        )
+    if bs.category_distribution:
+        top_cat = max(bs.category_distribution, key=lambda x: x["value"])
+        insights.append(
+            f"{top_cat['name']} accounts for the largest share of expenses. Review mainly recurring costs there."
+        )
+    if not insights:
+        insights.append("Budget health looks good. Keep tracking expenses daily.")
+    return insights
+
+
 class DashboardState(rx.State):
-    """State for managing dashboard specific insights and alerts."""
+    """State for managing dashboard specific insights and alerts.
+
+    Dependency tracking only sees the reads a var makes in its own body, not
+    those in the builders it calls. Each var therefore reads BudgetState's
+    version counters (and thresholds), which change whenever the builder's
+    inputs do, so Reflex recomputes it, and includes it in the delta, only
+    then.
+    """
 
     @rx.var
     async def budget_alerts(self) -> list[str]:
         """Returns a list of critical budget alerts."""
         bs = await self.get_state(BudgetState)
-        alerts = []
-        for b in bs.budgets:
-            spent = sum(
-                (
-                    e["amount"]
-                    for e in bs.expenses
-                    if e["category"] == b["name"] and e["approval_status"] != "Rejected"
-                )
-            )
-            total = b["allocated_amount"]
-            if total > 0:
-                utilization = spent / total * 100
-                if utilization > bs.critical_threshold:
-                    alerts.append(
-                        f"Critical: {b['name']} is at {utilization:.1f}% utilization"
-                    )
-                elif utilization > bs.warning_threshold:
-                    alerts.append(
-                        f"Warning: {b['name']} is at {utilization:.1f}% utilization"
-                    )
-        return alerts
+        _ = (
+            bs._budgets_version,
+            bs._store_version,
+            bs.warning_threshold,
+            bs.critical_threshold,
+        )
+        return _build_budget_alerts(bs)
 
     @rx.var
     async def spending_insights(self) -> list[str]:
         """Returns AI-like spending recommendations."""
         bs = await self.get_state(BudgetState)
-        insights = []
-        if bs.total_spent > bs.total_budget * 0.8:
-            insights.append(
-                "Spending velocity is high. Consider freezing non-essential expenses."
-            )
-        pending_count = len(
-            [e for e in bs.expenses if e["approval_status"] == "Pending"]
-        )
-        if pending_count > 5:
-            insights.append(
-                f"You have {pending_count} pending approvals. Clearing these will update accurate spend data."
-            )
-        if bs.category_distribution:
-            top_cat = max(bs.category_distribution, key=lambda x: x["value"])
-            insights.append(
-                f"{top_cat['name']} accounts for the largest share of expenses. Review mainly recurring costs there."
-            )
-        if not insights:
-            insights.append("Budget health looks good. Keep tracking expenses daily.")
-        return insights
\ No newline at end of file
+        _ = (bs._budgets_version, bs._store_version)
+        return _build_spending_insights(bs)
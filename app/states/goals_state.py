@@ -1,8 +1,10 @@
 import reflex as rx
 from typing import TypedDict
+import asyncio
 import datetime
 import uuid
 import logging
+from app.data import storage
 
 
 class Goal(TypedDict):
@@ -30,48 +32,17 @@ class GoalsState(rx.State):
         "status": "On Track",
         "notes": "",
     }
-    goals: list[Goal] = [
-        {
-            "id": "g1",
-            "name": "Emergency Fund",
-            "target_amount": 20000.0,
-            "current_amount": 15000.0,
-            "deadline": "2024-12-31",
-            "category": "Savings",
-            "status": "On Track",
-            "notes": "3 months of operating expenses",
-        },
-        {
-            "id": "g2",
-            "name": "New Office Equipment",
-            "target_amount": 5000.0,
-            "current_amount": 1200.0,
-            "deadline": "2024-06-30",
-            "category": "Equipment",
-            "status": "At Risk",
-            "notes": "Laptops and monitors for new hires",
-        },
-        {
-            "id": "g3",
-            "name": "Team Retreat",
-            "target_amount": 10000.0,
-            "current_amount": 10000.0,
-            "deadline": "2024-08-15",
-            "category": "Events",
-            "status": "Completed",
-            "notes": "Annual summer gathering",
-        },
-        {
-            "id": "g4",
-            "name": "Software Migration",
-            "target_amount": 8000.0,
-            "current_amount": 3500.0,
-            "deadline": "2024-09-01",
-            "category": "Technology",
-            "status": "On Track",
-            "notes": "Moving to new CRM",
-        },
-    ]
+    _goals: dict[str, Goal] = {}
+
+    @rx.event(background=True)
+    async def load_goals(self):
+        """Rereads the goals on every page load, so changes made by other
+        sessions show up."""
+        goals = await asyncio.to_thread(storage.load_goals)
+        async with self:
+            goals = {g["id"]: g for g in goals}
+            if goals != self._goals:
+                self._goals = goals
 
     @rx.event
     def open_add_modal(self):
@@ -106,6 +77,10 @@ class GoalsState(rx.State):
         else:
             self.current_goal[key] = value
 
+    @rx.var
+    def goals(self) -> list[Goal]:
+        return list(self._goals.values())
+
     @rx.var
     def total_goals_count(self) -> int:
         return len(self.goals)
@@ -139,24 +114,23 @@ class GoalsState(rx.State):
             ):
                 self.current_goal["status"] = "Completed"
         if self.current_goal["id"]:
-            self.goals = [
-                g if g["id"] != self.current_goal["id"] else self.current_goal
-                for g in self.goals
-            ]
+            self._goals[self.current_goal["id"]] = self.current_goal
+            storage.save_goal(self.current_goal)
             team_state.add_activity("updated goal", self.current_goal["name"], "system")
         else:
             new_goal = self.current_goal.copy()
             new_goal["id"] = str(uuid.uuid4())
-            self.goals.append(new_goal)
+            self._goals[new_goal["id"]] = new_goal
+            storage.save_goal(new_goal)
             team_state.add_activity("created goal", new_goal["name"], "system")
         self.close_modal()
 
     @rx.event
     async def delete_goal(self, id: str):
-        goal = next((g for g in self.goals if g["id"] == id), None)
+        goal = self._goals.pop(id, None)
         if goal:
             from app.states.team_state import TeamState
 
             team_state = await self.get_state(TeamState)
             team_state.add_activity("deleted goal", goal["name"], "warning")
-        self.goals = [g for g in self.goals if g["id"] != id]
\ No newline at end of file
+        storage.delete_goal(id)
\ No newline at end of file
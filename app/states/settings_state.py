@@ -1,7 +1,15 @@
 import reflex as rx
-import csv
-import io
+import asyncio
+import logging
+import secrets
 from datetime import datetime
+from pathlib import Path
+from app.api import export_dir, export_url, import_dir
+from app.data import export, importer, storage
+from app.data.expense_store import STORE
+
+PROGRESS_INTERVAL = 0.25
+UPLOAD_CHUNK_BYTES = 1024 * 1024
 
 
 class SettingsState(rx.State):
@@ -14,6 +22,11 @@ class SettingsState(rx.State):
     date_format: str = "MM/DD/YYYY"
     new_department_input: str = ""
     new_project_input: str = ""
+    export_gzip: bool = False
+    export_in_progress: bool = False
+    export_progress: int = 0
+    import_in_progress: bool = False
+    import_rows: int = 0
 
     @rx.event
     def toggle_notifications_email(self, val: bool):
@@ -60,40 +73,136 @@ class SettingsState(rx.State):
         self.new_project_input = ""
 
     @rx.event
+    def toggle_export_gzip(self, val: bool):
+        self.export_gzip = val
+
+    @rx.event(background=True)
     async def export_data(self):
+        """Streams all expenses from the database to a file, then downloads it."""
+        async with self:
+            if self.export_in_progress:
+                return
+            self.export_in_progress = True
+            self.export_progress = 0
+            compress = self.export_gzip
+        try:
+            total = await asyncio.to_thread(storage.count_expenses)
+            progress = export.Progress(total)
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            filename = export.filename(
+                f"budget_track_export_{timestamp}_{secrets.token_hex(4)}",
+                "csv",
+                compress,
+            )
+            directory = export_dir()
+            directory.mkdir(parents=True, exist_ok=True)
+            writer = asyncio.create_task(
+                asyncio.to_thread(
+                    export.write_expenses,
+                    directory / filename,
+                    "csv",
+                    None,
+                    compress,
+                    progress,
+                )
+            )
+            while not writer.done():
+                await asyncio.wait({writer}, timeout=PROGRESS_INTERVAL)
+                async with self:
+                    self.export_progress = progress.percent
+            rows = writer.result()
+        except Exception as e:
+            logging.exception(f"Error exporting expenses: {e}")
+            async with self:
+                self.export_in_progress = False
+            return rx.toast("Export failed. Please try again.")
+        async with self:
+            self.export_in_progress = False
+            self.export_progress = 100
+        return [
+            rx.download(url=rx.Var.create(export_url(filename)), filename=filename),
+            rx.toast(f"Exported {rows} expenses."),
+        ]
+
+    @rx.event
+    async def handle_import_upload(self, files: list[rx.UploadFile]):
+        """Saves an uploaded expense file, then imports it in the background."""
+        if not files or self.import_in_progress:
+            return
+        upload = files[0]
+        name = Path(upload.name or "").name
+        if not name.lower().endswith(importer.EXTENSIONS):
+            return rx.toast(f"Import expects one of: {', '.join(importer.EXTENSIONS)}")
+        directory = import_dir()
+        directory.mkdir(parents=True, exist_ok=True)
+        filename = f"{secrets.token_hex(8)}_{name}"
+        with open(directory / filename, "wb") as f:
+            while chunk := await upload.read(UPLOAD_CHUNK_BYTES):
+                f.write(chunk)
+        return SettingsState.import_expenses(filename)
+
+    @rx.event(background=True)
+    async def import_expenses(self, filename: str):
+        """Validates and bulk-inserts an uploaded file, then rebuilds the expense
+        aggregates once and downloads a report of any rejected rows.
+
+        Chunks are committed as they are inserted, so the store is reloaded
+        even when a later chunk fails and the rows already stored show up.
+        """
         from app.states.budget_state import BudgetState
 
-        budget_state = await self.get_state(BudgetState)
-        output = io.StringIO()
-        writer = csv.writer(output)
-        writer.writerow(
-            [
-                "Date",
-                "Category",
-                "Description",
-                "Amount",
-                "Payment Method",
-                "Status",
-                "Recurring",
-            ]
-        )
-        for expense in budget_state.expenses:
-            writer.writerow(
-                [
-                    expense["date"],
-                    expense["category"],
-                    expense["description"],
-                    expense["amount"],
-                    expense["payment_method"],
-                    expense["approval_status"],
-                    expense.get("recurring_frequency", "One-time"),
-                ]
+        path = import_dir() / filename
+        if path.name != filename or not path.is_file():
+            return
+        async with self:
+            if self.import_in_progress:
+                return
+            self.import_in_progress = True
+            self.import_rows = 0
+        result = error = None
+        try:
+            progress = export.Progress(0)
+            worker = asyncio.create_task(
+                asyncio.to_thread(importer.import_expenses, path, progress=progress)
+            )
+            while not worker.done():
+                await asyncio.wait({worker}, timeout=PROGRESS_INTERVAL)
+                async with self:
+                    self.import_rows = progress.rows
+            result = worker.result()
+        except Exception as e:
+            logging.exception(f"Error importing expenses from {filename}: {e}")
+            error = e
+        finally:
+            path.unlink(missing_ok=True)
+            try:
+                await STORE.reload()
+            finally:
+                async with self:
+                    budget_state = await self.get_state(BudgetState)
+                    budget_state._sync_store()
+                    self.import_in_progress = False
+        if error is not None:
+            return rx.toast(
+                f"Import failed: {error}. Rows stored before the error were kept."
+            )
+        events = [
+            rx.toast(
+                f"Imported {result.imported} expenses, rejected {len(result.rejected)}.",
+                duration=5000,
+            )
+        ]
+        if result.rejected:
+            report = f"import_rejects_{secrets.token_hex(4)}.csv"
+            directory = export_dir()
+            directory.mkdir(parents=True, exist_ok=True)
+            await asyncio.to_thread(
+                importer.write_reject_report, directory / report, result
+            )
+            events.append(
+                rx.download(url=rx.Var.create(export_url(report)), filename=report)
             )
-        csv_content = output.getvalue()
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        return rx.download(
-            data=csv_content, filename=f"budget_track_export_{timestamp}.csv"
-        )
+        return events
 
     @rx.event
     def save_settings(self):
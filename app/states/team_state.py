@@ -1,9 +1,28 @@
 import reflex as rx
 from typing import TypedDict
+import asyncio
+import collections
 import datetime
+import heapq
+import itertools
 import uuid
 import random
 import logging
+from app.data import ledger, storage
+from app.data.expense_store import STORE
+from app.states.budget_state import BudgetState, SEARCH_DEBOUNCE_SECONDS
+
+# Newest entries kept in memory per feed; older pages are read from storage.
+ACTIVITY_FEED_SIZE = 50
+ACTIVITY_PAGE_SIZE = 10
+TOP_SPENDERS_LIMIT = 5
+ALL_ACTIVITY = "All"
+ACTIVITY_FILTER_TYPES = {
+    "Expense": "expense",
+    "Budget": "budget",
+    "System": "system",
+    "Warning": "warning",
+}
 
 
 class TeamMember(TypedDict):
@@ -30,6 +49,18 @@ class Activity(TypedDict):
     type: str
 
 
+def _read_team() -> tuple:
+    """Members, the newest entries of each activity feed and the activity
+    counts per type, read from storage."""
+    feeds = {
+        feed: storage.load_activities(
+            None if feed == ALL_ACTIVITY else feed, 0, ACTIVITY_FEED_SIZE
+        )
+        for feed in (ALL_ACTIVITY, *ACTIVITY_FILTER_TYPES.values())
+    }
+    return storage.load_team_members(), feeds, storage.count_activities()
+
+
 class TeamState(rx.State):
     """State for team management and activity tracking."""
 
@@ -50,136 +81,48 @@ class TeamState(rx.State):
         "assigned_budget": 0.0,
         "spent_amount": 0.0,
     }
-    team_members: list[TeamMember] = [
-        {
-            "id": "t1",
-            "name": "Alex Finance",
-            "role": "Admin",
-            "department": "Finance",
-            "avatar_seed": "Felix",
-            "email": "alex@company.com",
-            "phone": "+1 (555) 0101",
-            "status": "Active",
-            "joined_date": "2023-01-15",
-            "assigned_budget": 0.0,
-            "spent_amount": 0.0,
-        },
-        {
-            "id": "t2",
-            "name": "Sarah Marketing",
-            "role": "Department Head",
-            "department": "Marketing",
-            "avatar_seed": "Sarah",
-            "email": "sarah@company.com",
-            "phone": "+1 (555) 0102",
-            "status": "Active",
-            "joined_date": "2023-02-01",
-            "assigned_budget": 50000.0,
-            "spent_amount": 35420.5,
-        },
-        {
-            "id": "t3",
-            "name": "Mike Engineering",
-            "role": "CTO",
-            "department": "Engineering",
-            "avatar_seed": "Mike",
-            "email": "mike@company.com",
-            "phone": "+1 (555) 0103",
-            "status": "Active",
-            "joined_date": "2023-01-10",
-            "assigned_budget": 120000.0,
-            "spent_amount": 98500.0,
-        },
-        {
-            "id": "t4",
-            "name": "Jessica HR",
-            "role": "HR Manager",
-            "department": "HR",
-            "avatar_seed": "Jessica",
-            "email": "jessica@company.com",
-            "phone": "+1 (555) 0104",
-            "status": "Remote",
-            "joined_date": "2023-03-15",
-            "assigned_budget": 30000.0,
-            "spent_amount": 12500.0,
-        },
-        {
-            "id": "t5",
-            "name": "David Sales",
-            "role": "VP of Sales",
-            "department": "Sales",
-            "avatar_seed": "David",
-            "email": "david@company.com",
-            "phone": "+1 (555) 0105",
-            "status": "On Leave",
-            "joined_date": "2023-04-01",
-            "assigned_budget": 80000.0,
-            "spent_amount": 65000.0,
-        },
-        {
-            "id": "t6",
-            "name": "Emily Ops",
-            "role": "Operations Manager",
-            "department": "Operations",
-            "avatar_seed": "Emily",
-            "email": "emily@company.com",
-            "phone": "+1 (555) 0106",
-            "status": "Active",
-            "joined_date": "2023-05-12",
-            "assigned_budget": 45000.0,
-            "spent_amount": 28900.0,
-        },
-    ]
-    activities: list[Activity] = [
-        {
-            "id": "a1",
-            "user_name": "Sarah Marketing",
-            "user_avatar": "Sarah",
-            "action": "approved expense",
-            "target": "Q2 Media Buy ($8,000)",
-            "timestamp": "2 hours ago",
-            "type": "expense",
-        },
-        {
-            "id": "a2",
-            "user_name": "Mike Engineering",
-            "user_avatar": "Mike",
-            "action": "created budget",
-            "target": "AI Research Project",
-            "timestamp": "5 hours ago",
-            "type": "budget",
-        },
-        {
-            "id": "a3",
-            "user_name": "Alex Finance",
-            "user_avatar": "Felix",
-            "action": "updated settings",
-            "target": "Global Currency Format",
-            "timestamp": "1 day ago",
-            "type": "system",
-        },
-        {
-            "id": "a4",
-            "user_name": "Jessica HR",
-            "user_avatar": "Jessica",
-            "action": "added member",
-            "target": "Tom Intern",
-            "timestamp": "1 day ago",
-            "type": "system",
-        },
-        {
-            "id": "a5",
-            "user_name": "David Sales",
-            "user_avatar": "David",
-            "action": "exceeded budget",
-            "target": "Travel Q1",
-            "timestamp": "2 days ago",
-            "type": "warning",
-        },
-    ]
+    _team_members: dict[str, TeamMember] = {}
+    _member_search_seq: int = 0
+    activity_page: int = 0
+    # Ring buffers of the newest activities: one for the whole feed and one per
+    # type, so a filter switch reads its own buffer instead of scanning.
+    _activity_feeds: dict[str, collections.deque] = {}
+    _activity_counts: dict[str, int] = {}
+    # Deques are not change-tracked; this is bumped whenever a feed changes.
+    _activity_version: int = 0
+
+    @rx.event(background=True)
+    async def load_team(self):
+        """Rereads members and the activity feeds on every page load, so
+        changes made by other sessions show up."""
+        members, feeds, counts = await asyncio.to_thread(_read_team)
+        async with self:
+            members = {m["id"]: m for m in members}
+            if members != self._team_members:
+                self._team_members = members
+            counts = {ALL_ACTIVITY: sum(counts.values()), **counts}
+            if counts != self._activity_counts or any(
+                list(self._activity_feeds.get(feed, ())) != rows
+                for feed, rows in feeds.items()
+            ):
+                self._activity_feeds = {
+                    feed: collections.deque(rows, maxlen=ACTIVITY_FEED_SIZE)
+                    for feed, rows in feeds.items()
+                }
+                self._activity_counts = counts
+                self._activity_version += 1
 
     @rx.var
-    def filtered_members(self) -> list[TeamMember]:
+    def team_members(self) -> list[TeamMember]:
+        return list(self._team_members.values())
+
+    @rx.var
+    async def filtered_members(self) -> list[TeamMember]:
+        """Members matching the filters, with spend taken from the expense ledger."""
+        bs = await self.get_state(BudgetState)
+        # Reading the session's store version makes this var track the store;
+        # version 0 means the session has not loaded expenses yet.
+        spend = STORE.ledger["member"] if bs._store_version else {}
         members = self.team_members
         if self.department_filter != "All":
             members = [m for m in members if m["department"] == self.department_filter]
@@ -190,34 +133,85 @@ class TeamState(rx.State):
                 for m in members
                 if search in m["name"].lower() or search in m["role"].lower()
             ]
-        return sorted(members, key=lambda x: x["name"])
+        return sorted(
+            (
+                {**m, "spent_amount": spend[m["id"]][0] if m["id"] in spend else 0.0}
+                for m in members
+            ),
+            key=lambda x: x["name"],
+        )
 
     @rx.var
+    def _activity_feed(self) -> str:
+        return ACTIVITY_FILTER_TYPES.get(self.activity_filter, ALL_ACTIVITY)
+
+    @rx.var
+    def activity_page_count(self) -> int:
+        count = self._activity_counts.get(self._activity_feed, 0)
+        return max(1, -(-count // ACTIVITY_PAGE_SIZE))
+
+    @rx.var(deps=["_activity_version", "_activity_feed", "activity_page"])
     def filtered_activities(self) -> list[Activity]:
-        if self.activity_filter == "All":
-            return self.activities
-        filter_map = {
-            "Expense": "expense",
-            "Budget": "budget",
-            "System": "system",
-            "Warning": "warning",
-        }
-        target_type = filter_map.get(self.activity_filter, self.activity_filter.lower())
-        return [a for a in self.activities if a["type"] == target_type]
+        """One page of the selected feed, from its ring buffer while the page is
+        within it and from storage for older pages."""
+        feed = self._activity_feeds.get(self._activity_feed, ())
+        start = self.activity_page * ACTIVITY_PAGE_SIZE
+        end = start + ACTIVITY_PAGE_SIZE
+        if end <= len(feed) or len(feed) >= self._activity_counts.get(
+            self._activity_feed, 0
+        ):
+            return list(itertools.islice(feed, start, end))
+        return storage.load_activities(
+            None if self._activity_feed == ALL_ACTIVITY else self._activity_feed,
+            start,
+            ACTIVITY_PAGE_SIZE,
+        )
 
     @rx.var
-    def top_spenders(self) -> list[TeamMember]:
-        return sorted(self.team_members, key=lambda x: x["spent_amount"], reverse=True)[
-            :5
-        ]
+    async def top_spenders(self) -> list[TeamMember]:
+        """The members with the most attributed spend in the report range,
+        picked with a k-sized heap instead of sorting every member.
 
-    @rx.event
-    def set_member_search(self, value: str):
-        self.member_search = value
+        Spend is summed from the ledger's per-(month, member) rollup, so the
+        cost depends on months and members, not on the expenses in range.
+        """
+        bs = await self.get_state(BudgetState)
+        spend = {}
+        # Reading the version makes this var track the store, as above.
+        if bs._store_version:
+            spend = ledger.spent_by_member(STORE.ledger, bs._report_bounds)
+        members = self._team_members
+        top = heapq.nlargest(
+            TOP_SPENDERS_LIMIT,
+            ((amount, id) for id, amount in spend.items() if id in members),
+        )
+        return [{**members[id], "spent_amount": amount} for amount, id in top]
+
+    @rx.event(background=True)
+    async def set_member_search(self, value: str):
+        """Applies only the latest query once typing pauses, dropping stale ones."""
+        async with self:
+            self._member_search_seq += 1
+            seq = self._member_search_seq
+        await asyncio.sleep(SEARCH_DEBOUNCE_SECONDS)
+        async with self:
+            if seq == self._member_search_seq:
+                self.member_search = value
 
     @rx.event
     def set_activity_filter(self, value: str):
         self.activity_filter = value
+        self.activity_page = 0
+
+    @rx.event
+    def next_activity_page(self):
+        if self.activity_page < self.activity_page_count - 1:
+            self.activity_page += 1
+
+    @rx.event
+    def prev_activity_page(self):
+        if self.activity_page > 0:
+            self.activity_page -= 1
 
     @rx.event
     def set_department_filter(self, value: str):
@@ -251,7 +245,7 @@ class TeamState(rx.State):
 
     @rx.event
     def update_current_member(self, key: str, value: str):
-        if key in ["assigned_budget", "spent_amount"]:
+        if key == "assigned_budget":
             try:
                 self.current_member[key] = float(value)
             except ValueError as e:
@@ -263,26 +257,27 @@ class TeamState(rx.State):
     def save_member(self):
         if not self.current_member["name"]:
             return
-        if self.current_member["id"]:
-            self.team_members = [
-                m if m["id"] != self.current_member["id"] else self.current_member
-                for m in self.team_members
-            ]
-            self.add_activity(f"updated profile", self.current_member["name"], "system")
+        # Spend comes from the expense ledger and is never stored with a member.
+        member = {k: v for k, v in self.current_member.items() if k != "spent_amount"}
+        if member["id"]:
+            self._team_members[member["id"]] = member
+            storage.save_team_member(member)
+            self.add_activity(f"updated profile", member["name"], "system")
         else:
-            new_member = self.current_member.copy()
+            new_member = member
             new_member["id"] = str(uuid.uuid4())
             if not new_member["avatar_seed"]:
                 new_member["avatar_seed"] = new_member["name"]
-            self.team_members.append(new_member)
-            self.add_activity(f"joined the team", self.current_member["name"], "system")
+            self._team_members[new_member["id"]] = new_member
+            storage.save_team_member(new_member)
+            self.add_activity(f"joined the team", member["name"], "system")
         self.close_member_modal()
 
     @rx.event
     def delete_member(self, id: str):
-        member = next((m for m in self.team_members if m["id"] == id), None)
+        member = self._team_members.pop(id, None)
         if member:
-            self.team_members = [m for m in self.team_members if m["id"] != id]
+            storage.delete_team_member(id)
             self.add_activity(f"removed member", member["name"], "system")
 
     @rx.event
@@ -293,7 +288,13 @@ class TeamState(rx.State):
             "user_avatar": "Felix",
             "action": action,
             "target": target,
-            "timestamp": "Just now",
+            "timestamp": datetime.datetime.now().strftime("%Y-%m-%d %H:%M"),
             "type": type_str,
         }
-        self.activities.insert(0, new_activity)
\ No newline at end of file
+        storage.save_activity(new_activity)
+        for feed in (ALL_ACTIVITY, type_str):
+            self._activity_feeds.setdefault(
+                feed, collections.deque(maxlen=ACTIVITY_FEED_SIZE)
+            ).appendleft(new_activity)
+            self._activity_counts[feed] = self._activity_counts.get(feed, 0) + 1
+        self._activity_version += 1
\ No newline at end of file
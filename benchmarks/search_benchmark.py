@@ -0,0 +1,136 @@
+"""Per-keystroke latency of expense search: token index vs. a full scan.
+
+Usage: ``python -m benchmarks.search_benchmark [--sizes 100000 1000000]``
+
+Simulates typing a query one character at a time and reports the median and
+worst latency of producing the first page of results, mirroring
+``BudgetState.paged_expenses`` before and after the search and date indexes.
+Both methods apply the index's matching rule (every query token a prefix of
+one of the expense's tokens), and must return the same page.
+"""
+
+import argparse
+import datetime
+import random
+import statistics
+import time
+from app.data.date_index import DateIndex
+from app.data.search_index import ExpenseSearchIndex, expense_tokens, tokenize
+
+CATEGORIES = [
+    "Marketing",
+    "Engineering",
+    "Office Renovation",
+    "Software Licenses",
+    "Team Events",
+    "HR",
+    "Sales",
+    "Operations",
+]
+WORDS = [
+    "aws",
+    "cloud",
+    "services",
+    "client",
+    "dinner",
+    "license",
+    "renewal",
+    "conference",
+    "tickets",
+    "office",
+    "supplies",
+    "workshop",
+    "travel",
+    "hotel",
+    "flight",
+    "laptop",
+    "monitor",
+    "agency",
+    "fee",
+    "campaign",
+]
+PAYMENT_METHODS = ["Credit Card", "Bank Transfer", "Invoice", "Reimbursement"]
+TAGS = ["Travel", "Software", "Equipment", "Food", "Office", "Client", "Internal"]
+PAGE_SIZE = 25
+
+
+def make_expenses(count: int, seed: int = 7) -> list[dict]:
+    rng = random.Random(seed)
+    start = datetime.date(2020, 1, 1).toordinal()
+    return [
+        {
+            "id": f"e{i}",
+            "date": datetime.date.fromordinal(start + rng.randrange(1800)).isoformat(),
+            "category": rng.choice(CATEGORIES),
+            "amount": round(rng.uniform(5, 5000), 2),
+            "payment_method": rng.choice(PAYMENT_METHODS),
+            "description": " ".join(rng.sample(WORDS, 3)).title() + f" #{i}",
+            "approval_status": "Approved",
+            "tags": rng.sample(TAGS, rng.randrange(3)),
+        }
+        for i in range(count)
+    ]
+
+
+def _scan_match(expense: dict, prefixes: set[str]) -> bool:
+    tokens = expense_tokens(expense)
+    return all(any(token.startswith(p) for token in tokens) for p in prefixes)
+
+
+def scan_search(expenses, query: str) -> list[dict]:
+    """Tokenizes every expense per search, as a scan without an index must."""
+    prefixes = set(tokenize(query))
+    filtered = [e for e in expenses if _scan_match(e, prefixes)]
+    filtered.sort(key=lambda x: (x["date"], x["id"]), reverse=True)
+    return filtered[:PAGE_SIZE]
+
+
+def index_search(index, date_index, expenses_by_id, query: str) -> list[dict]:
+    ids = index.search(query)
+    return [expenses_by_id[i] for i in date_index.newest(ids, 0, PAGE_SIZE)]
+
+
+def keystroke_timings(search, query: str) -> list[float]:
+    timings = []
+    for end in range(1, len(query) + 1):
+        started = time.perf_counter()
+        search(query[:end])
+        timings.append((time.perf_counter() - started) * 1000)
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100_000, 1_000_000])
+    parser.add_argument("--query", default="aws cloud serv")
+    args = parser.parse_args()
+    print(f"query={args.query!r}, one search per keystroke, times in ms")
+    print(f"{'expenses':>10} {'method':>6} {'build':>9} {'median':>9} {'worst':>9}")
+    for size in args.sizes:
+        expenses = make_expenses(size)
+        expenses_by_id = {e["id"]: e for e in expenses}
+        started = time.perf_counter()
+        index = ExpenseSearchIndex.build(expenses)
+        date_index = DateIndex.build(expenses)
+        build_ms = (time.perf_counter() - started) * 1000
+        if scan_search(expenses, args.query) != index_search(
+            index, date_index, expenses_by_id, args.query
+        ):
+            raise SystemExit(f"scan and index disagree on {args.query!r}")
+        runs = {
+            "scan": (0.0, lambda q: scan_search(expenses, q)),
+            "index": (
+                build_ms,
+                lambda q: index_search(index, date_index, expenses_by_id, q),
+            ),
+        }
+        for name, (build, search) in runs.items():
+            timings = keystroke_timings(search, args.query)
+            print(
+                f"{size:>10,} {name:>6} {build:>9.1f} "
+                f"{statistics.median(timings):>9.2f} {max(timings):>9.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,13 @@
+import pytest
+from app.data import storage
+
+
+@pytest.fixture
+def db(tmp_path, monkeypatch):
+    """Points storage at an empty database for the test."""
+    monkeypatch.setattr(storage, "DB_PATH", str(tmp_path / "budget.db"))
+    monkeypatch.setattr(storage._local, "conn", None, raising=False)
+    yield
+    if storage._local.conn is not None:
+        storage._local.conn.close()
+        storage._local.conn = None
@@ -0,0 +1,85 @@
+import itertools
+import json
+import random
+import pytest
+from app.data import audit, storage
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Makes audit.timestamp return a later second on every call."""
+    seconds = itertools.count()
+    monkeypatch.setattr(
+        audit,
+        "timestamp",
+        lambda: "2024-01-01T{:02}:{:02}:{:02}".format(*_hms(next(seconds))),
+    )
+
+
+def _hms(seconds: int) -> tuple[int, int, int]:
+    return seconds // 3600, seconds // 60 % 60, seconds % 60
+
+
+def expense(id: str, **fields) -> dict:
+    return {
+        **storage.EXPENSE_DEFAULTS,
+        "id": id,
+        "date": "2024-03-01",
+        "category": "Office",
+        "amount": 10.0,
+        **fields,
+    }
+
+
+def stored(id: str) -> dict:
+    return next(e for e in storage.load_expenses() if e["id"] == id)
+
+
+def last_timestamp() -> str:
+    return storage.connect().execute(
+        "SELECT MAX(timestamp) FROM expense_revisions"
+    ).fetchone()[0]
+
+
+def test_as_of_rebuilds_every_version(db, clock):
+    rng = random.Random(25)
+    storage.save_expense(expense("e1"))
+    (created,) = storage.connect().execute("SELECT created_at FROM expenses").fetchone()
+    versions = [(created, stored("e1"))]
+    for _ in range(3 * audit.SNAPSHOT_EVERY):
+        if rng.random() < 0.3:
+            status = rng.choice(["Pending", "Approved", "Rejected"])
+            storage.set_expense_status(["e1"], status)
+        else:
+            fields = {
+                "amount": float(rng.randrange(1, 500)),
+                "description": rng.choice(["", "Paper", "Pens"]),
+            }
+            storage.save_expense({**stored("e1"), **fields})
+        if last_timestamp() != versions[-1][0]:
+            versions.append((last_timestamp(), stored("e1")))
+    assert len(versions) > audit.SNAPSHOT_EVERY * 2
+    for timestamp, version in versions:
+        assert storage.expense_as_of("e1", timestamp) == version
+
+
+def test_as_of_before_creation_is_none(db, clock):
+    storage.save_expense(expense("e1"))
+    storage.save_expense(expense("e1", amount=20.0))
+    assert storage.expense_as_of("e1", "2023-12-31T23:59:59") is None
+    assert storage.expense_as_of("e1", "2024-01-01T00:00:00")["amount"] == 10.0
+    assert storage.expense_as_of("missing", "2024-01-01T00:00:00") is None
+
+
+def test_unchanged_expenses_record_no_revisions(db):
+    storage.save_expenses([expense(f"e{i}") for i in range(5)])
+    storage.save_expenses([expense(f"e{i}") for i in range(5)])
+    storage.set_expense_status(["e0", "e1"], "Approved")
+    storage.set_expense_status(["e0", "e1"], "Approved")
+    rows = storage.connect().execute(
+        "SELECT expense_id, revision, fields FROM expense_revisions ORDER BY 1"
+    ).fetchall()
+    assert [tuple(r) for r in rows] == [
+        ("e0", 1, json.dumps({"approval_status": "Pending"})),
+        ("e1", 1, json.dumps({"approval_status": "Pending"})),
+    ]
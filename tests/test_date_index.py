@@ -0,0 +1,41 @@
+import random
+import pytest
+from app.data.date_index import DateIndex
+
+
+def newest_first(dates: dict[str, str], ids=None) -> list[str]:
+    keys = [(date, id) for id, date in dates.items() if ids is None or id in ids]
+    return [id for _, id in sorted(keys, reverse=True)]
+
+
+def test_updates_keep_newest_first_order():
+    rng = random.Random(6)
+    dates = {}
+    index = DateIndex()
+    for _ in range(500):
+        id = f"e{rng.randrange(60)}"
+        if id in dates and rng.random() < 0.3:
+            del dates[id]
+            index.remove(id)
+        else:
+            dates[id] = f"2024-{rng.randrange(1, 4):02}-{rng.randrange(1, 4):02}"
+            index.add({"id": id, "date": dates[id]})
+    assert len(index) == len(dates)
+    assert index.newest() == newest_first(dates)
+    dropped = set(rng.sample(sorted(dates), 10))
+    index.remove_ids(dropped)
+    for id in dropped:
+        del dates[id]
+    assert index.newest() == newest_first(dates)
+
+
+@pytest.mark.parametrize("matches", [3, 200])
+def test_restricted_pages_match_sorting(matches):
+    rng = random.Random(matches)
+    dates = {f"e{i}": f"2024-01-{rng.randrange(1, 29):02}" for i in range(400)}
+    index = DateIndex.build({"id": id, "date": d} for id, d in dates.items())
+    ids = set(rng.sample(sorted(dates), matches)) | {"missing"}
+    expected = newest_first(dates, ids)
+    assert index.newest(ids) == expected
+    for start in (0, 1, 10):
+        assert index.newest(ids, start, 5) == expected[start : start + 5]
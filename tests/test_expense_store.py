@@ -0,0 +1,61 @@
+import asyncio
+import datetime
+from app.data import forecast, storage
+from app.data.expense_store import ExpenseStore
+
+TODAY = datetime.date(2024, 6, 15)
+
+
+def expense(id: str, **fields) -> dict:
+    return {
+        **storage.EXPENSE_DEFAULTS,
+        "id": id,
+        "date": "2024-03-01",
+        "category": "Office",
+        "amount": 10.0,
+        **fields,
+    }
+
+
+def test_own_writes_keep_the_store_current(db):
+    store = ExpenseStore()
+    asyncio.run(store.refresh(TODAY))
+    store.add(expense("e1"))
+    store.save(expense("e1", amount=20.0))
+    store.set_status(["e1"], "Approved")
+    store.delete(["e1"])
+    assert not store.stale()
+
+
+def test_refresh_reloads_after_writes_from_elsewhere(db):
+    store = ExpenseStore()
+    asyncio.run(store.refresh(TODAY))
+    store.add(expense("e1"))
+    storage.save_expense(expense("e2", amount=5.0))
+    assert store.stale()
+    # A write of the store's own after an outside one still leaves it stale.
+    store.save(expense("e1", amount=20.0))
+    assert store.stale()
+    asyncio.run(store.refresh(TODAY))
+    assert not store.stale()
+    assert sorted(store.expenses) == ["e1", "e2"]
+    assert store.ledger["category"] == {"Office": [25.0, 2]}
+
+
+def test_forecast_is_refit_only_after_a_change(db, monkeypatch):
+    fits = []
+    project = forecast.project
+    monkeypatch.setattr(
+        forecast, "project", lambda *args: fits.append(args[1]) or project(*args)
+    )
+    store = ExpenseStore()
+    store.add(expense("e1"))
+    start = TODAY.year * 12 + TODAY.month - 1
+    first = store.forecast("average", start, 6)
+    assert store.forecast("average", start, 6) == first
+    store.forecast(forecast.DEFAULT_MODEL, start, 6)
+    assert store.forecast("average", start, 6) == first
+    assert fits == ["average", forecast.DEFAULT_MODEL]
+    store.add(expense("e2"))
+    store.forecast("average", start, 6)
+    assert fits == ["average", forecast.DEFAULT_MODEL, "average"]
@@ -0,0 +1,68 @@
+import csv
+import gzip
+import json
+import pytest
+from app.data import export, storage
+
+
+def expense(id: str, **fields) -> dict:
+    return {
+        **storage.EXPENSE_DEFAULTS,
+        "id": id,
+        "date": "2024-03-01",
+        "category": "Office",
+        "amount": 10.0,
+        "description": f"Item {id}",
+        **fields,
+    }
+
+
+@pytest.fixture
+def expenses(db):
+    rows = [
+        expense("e1"),
+        expense("e2", amount=0.0, approval_status="Approved"),
+        expense("e3", category="Travel", description='Taxi, "airport"'),
+    ]
+    storage.save_expenses(rows)
+    return rows
+
+
+def expected(rows) -> list[dict]:
+    return [{c: e[c] for c in export.COLUMNS} for e in rows]
+
+
+@pytest.mark.parametrize("compress", [False, True])
+def test_csv_writes_header_and_rows(tmp_path, expenses, compress):
+    path = tmp_path / export.filename("out", "csv", compress)
+    progress = export.Progress(len(expenses))
+    assert export.write_expenses(path, "csv", compress=compress, progress=progress) == 3
+    opener = gzip.open if compress else open
+    with opener(path, "rt", encoding="utf-8", newline="") as f:
+        header, *rows = list(csv.reader(f))
+    assert header == [label for _, label in export.CSV_COLUMNS]
+    assert [dict(zip(export.COLUMNS, row)) for row in rows] == [
+        {c: str(v) for c, v in e.items()} for e in expected(expenses)
+    ]
+    assert progress.percent == 100
+    assert not (tmp_path / f"{path.name}.part").exists()
+
+
+def test_jsonl_writes_only_selected_ids(tmp_path, expenses):
+    path = tmp_path / "out.jsonl"
+    assert export.write_expenses(path, "jsonl", ids=["e3", "e1", "missing"]) == 2
+    rows = [json.loads(line) for line in path.read_text().splitlines()]
+    assert rows == expected([expenses[0], expenses[2]])
+
+
+def test_parquet_round_trips(tmp_path, expenses):
+    pq = pytest.importorskip("pyarrow.parquet")
+    path = tmp_path / "out.parquet"
+    assert export.write_expenses(path, "parquet") == 3
+    assert pq.read_table(path).to_pylist() == expected(expenses)
+
+
+def test_unknown_format_writes_nothing(tmp_path, expenses):
+    with pytest.raises(ValueError):
+        export.write_expenses(tmp_path / "out.xml", "xml")
+    assert not (tmp_path / "out.xml").exists()
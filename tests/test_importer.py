@@ -0,0 +1,78 @@
+import csv
+import pytest
+from app.data import export, importer, storage
+
+HEADER = ["Date", "Category", "Description", "Amount", "Payment Method", "Status"]
+
+
+def write_csv(path, rows, header=HEADER):
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(header)
+        writer.writerows(rows)
+    return path
+
+
+def test_import_stores_valid_rows_and_reports_rejects(tmp_path, db):
+    path = write_csv(
+        tmp_path / "in.csv",
+        [
+            ["2024-03-01", "Office", "Paper", "$1,250.50", "Invoice", "Approved"],
+            ["2024-02-30", "Office", "Pens", "5", "", ""],
+            ["2024-03-02", "Office", "Refund", "-5", "", ""],
+            ["", "", "", "", "", ""],
+            ["2024-03-03", "", "Tape", "2", "", ""],
+            ["2024-03-04", "Office", "Stamps", "3", "Barter", ""],
+            ["2024-03-05", "Office", "Free sample", "0", "", "Done"],
+            ["2024-03-06", "Office", "Free sample", "0", "", ""],
+        ],
+    )
+    result = importer.import_expenses(path)
+    assert result.imported == 2
+    assert [(line, reason) for line, reason, _ in result.rejected] == [
+        (3, "Date must be YYYY-MM-DD"),
+        (4, "Amount must be a number, zero or more"),
+        (6, "Category is required"),
+        (7, "Unknown payment method 'Barter'"),
+        (8, "Unknown status 'Done'"),
+    ]
+    stored = {e["description"]: e for e in storage.load_expenses()}
+    assert stored["Paper"]["amount"] == 1250.5
+    assert stored["Paper"]["payment_method"] == "Invoice"
+    assert stored["Paper"]["approval_status"] == "Approved"
+    assert stored["Free sample"]["amount"] == 0
+    assert stored["Free sample"]["approval_status"] == "Pending"
+
+    report = tmp_path / "rejects.csv"
+    importer.write_reject_report(report, result)
+    with open(report, encoding="utf-8", newline="") as f:
+        header, first, *_ = list(csv.reader(f))
+    assert header == ["Line", "Reason", *HEADER]
+    assert first[:5] == ["3", "Date must be YYYY-MM-DD", "2024-02-30", "Office", "Pens"]
+
+
+def test_missing_required_columns_are_named(tmp_path):
+    path = write_csv(tmp_path / "in.csv", [], header=["Date", "Amount"])
+    with pytest.raises(ValueError, match="category, description"):
+        importer.import_expenses(path)
+
+
+def test_export_imports_back(tmp_path, db):
+    storage.save_expenses(
+        [
+            {
+                **storage.EXPENSE_DEFAULTS,
+                "id": id,
+                "date": "2024-03-01",
+                "category": "Office",
+                "amount": amount,
+                "description": f"Item {id}",
+            }
+            for id, amount in [("e1", 12.5), ("e2", 0.0)]
+        ]
+    )
+    path = tmp_path / "out.csv"
+    export.write_expenses(path, "csv")
+    result = importer.import_expenses(path)
+    assert (result.imported, result.rejected) == (2, [])
+    assert storage.count_expenses() == 4
@@ -0,0 +1,87 @@
+import random
+from app.data import ledger, storage
+from app.data.expense_store import ExpenseStore
+
+
+def expense(id: str, **fields) -> dict:
+    return {
+        **storage.EXPENSE_DEFAULTS,
+        "id": id,
+        "date": "2024-03-01",
+        "category": "Office",
+        "amount": 10.0,
+        **fields,
+    }
+
+
+def random_fields(rng: random.Random) -> dict:
+    return {
+        "date": f"2024-{rng.randrange(1, 13):02}-{rng.randrange(1, 29):02}",
+        "category": rng.choice(["Office", "Travel", "Software"]),
+        "amount": round(rng.uniform(1, 500), 2),
+        "approval_status": rng.choice(["Pending", "Approved", "Rejected"]),
+        "submitter_id": rng.choice(["", "t1", "t2"]),
+    }
+
+
+def test_deltas_match_rebuild():
+    rng = random.Random(2)
+    expenses = {}
+    spend = ledger.empty_ledger()
+    for _ in range(500):
+        id = f"e{rng.randrange(40)}"
+        old = expenses.pop(id, None)
+        if old is not None:
+            ledger.apply_expense(spend, old, -1)
+        if old is None or rng.random() < 0.7:
+            expenses[id] = expense(id, **random_fields(rng))
+            ledger.apply_expense(spend, expenses[id])
+        assert ledger.ledger_mismatches(spend, expenses.values()) == []
+
+
+def test_edit_moves_spend_between_buckets():
+    spend = ledger.build_ledger([expense("e1", submitter_id="t1")])
+    edited = expense("e1", date="2024-04-02", category="Travel", amount=25.0)
+    ledger.apply_expense(spend, expense("e1", submitter_id="t1"), -1)
+    ledger.apply_expense(spend, edited)
+    assert spend["category"] == {"Travel": [25.0, 1]}
+    assert spend["month"] == {"2024-04": [25.0, 1]}
+    assert spend["member"] == {}
+    assert spend["cube"] == {("2024-04", "Travel", "Pending"): [25.0, 1]}
+
+
+def test_rejected_expenses_count_only_by_status():
+    spend = ledger.build_ledger([expense("e1", approval_status="Rejected")])
+    assert spend["status"] == {"Rejected": [10.0, 1]}
+    assert spend["category"] == spend["month"] == {}
+
+
+def test_store_ledger_matches_storage(db):
+    rng = random.Random(3)
+    store = ExpenseStore()
+    for i in range(30):
+        store.add(expense(f"e{i}", **random_fields(rng)))
+    for i in range(0, 30, 3):
+        store.save({**store.expenses[f"e{i}"], **random_fields(rng)})
+    store.delete([f"e{i}" for i in range(1, 30, 5)])
+    store.set_status([f"e{i}" for i in range(2, 30, 4)], "Approved")
+    for spend in (store.ledger, storage.load_ledger()):
+        assert ledger.ledger_mismatches(spend, store.expenses.values()) == []
+
+
+def test_split_expense_is_allocated_to_each_category(db):
+    store = ExpenseStore()
+    splits = [
+        {"category": "Travel", "amount": 30.0},
+        {"category": "Software", "amount": 20.0},
+    ]
+    store.add(expense("e1", amount=100.0, splits=splits))
+    assert store.ledger["category"] == {
+        "Travel": [30.0, 1],
+        "Software": [20.0, 1],
+        "Office": [50.0, 1],
+    }
+    assert store.ledger["month"] == {"2024-03": [100.0, 1]}
+    assert storage.load_ledger()["category"] == store.ledger["category"]
+    store.delete(["e1"])
+    assert store.ledger["category"] == storage.load_ledger()["category"] == {}
@@ -0,0 +1,113 @@
+import calendar
+import datetime
+import random
+import pytest
+from app.data import importer, recurring, storage
+
+TODAY = datetime.date(2024, 6, 15)
+
+
+def brute_force(first, frequency, after, until):
+    days, months = recurring.STEPS[frequency]
+    dates = []
+    for n in range(1, 2000):
+        if days:
+            date = first + datetime.timedelta(days=days * n)
+        else:
+            year, month = divmod(first.year * 12 + first.month - 1 + months * n, 12)
+            last = calendar.monthrange(year, month + 1)[1]
+            date = datetime.date(year, month + 1, min(first.day, last))
+        if date > until:
+            break
+        if after is None or date > after:
+            dates.append(date)
+    return dates
+
+
+def template(**fields) -> dict:
+    return {
+        **storage.EXPENSE_DEFAULTS,
+        "id": "rent",
+        "date": "2024-01-31",
+        "category": "Office",
+        "amount": 1200.0,
+        "description": "Rent",
+        "recurring_frequency": "Monthly",
+        **fields,
+    }
+
+
+def occurrence_keys() -> list[tuple]:
+    return storage.connect().execute(
+        "SELECT recurring_parent_id, date FROM expenses "
+        "WHERE recurring_parent_id != '' ORDER BY date"
+    ).fetchall()
+
+
+@pytest.mark.parametrize("frequency", sorted(recurring.STEPS))
+def test_occurrences_match_brute_force(frequency):
+    rng = random.Random(frequency)
+    base = datetime.date(2020, 1, 1)
+    for _ in range(300):
+        first = base + datetime.timedelta(days=rng.randrange(1500))
+        until = first + datetime.timedelta(days=rng.randrange(1200))
+        after = rng.choice(
+            [None, first - datetime.timedelta(days=rng.randrange(60))]
+            + [first + datetime.timedelta(days=rng.randrange(1300))] * 2
+        )
+        assert list(recurring.occurrences(first, frequency, after, until)) == (
+            brute_force(first, frequency, after, until)
+        )
+
+
+def test_monthly_occurrences_return_to_month_end():
+    dates = recurring.occurrences(
+        datetime.date(2024, 1, 31), "Monthly", None, datetime.date(2024, 5, 31)
+    )
+    assert [d.isoformat() for d in dates] == [
+        "2024-02-29",
+        "2024-03-31",
+        "2024-04-30",
+        "2024-05-31",
+    ]
+
+
+def test_materialize_is_idempotent(db):
+    storage.save_expense(template())
+    created = storage.materialize_recurring(TODAY)
+    assert [e["date"] for e in created] == [
+        "2024-02-29",
+        "2024-03-31",
+        "2024-04-30",
+        "2024-05-31",
+    ]
+    assert storage.materialize_recurring(TODAY) == []
+    with storage.connect() as conn:
+        conn.execute("UPDATE expenses SET recurring_through = ''")
+    assert storage.materialize_recurring(TODAY) == []
+    assert len(occurrence_keys()) == 4
+
+
+def test_stale_template_copy_keeps_recurring_through(db):
+    stale = template()
+    storage.save_expense(stale)
+    storage.materialize_recurring(TODAY)
+    storage.save_expense({**stale, "description": "Office rent"})
+    (through,) = storage.connect().execute(
+        "SELECT recurring_through FROM expenses WHERE id = 'rent'"
+    ).fetchone()
+    assert through == TODAY.isoformat()
+    assert storage.materialize_recurring(TODAY) == []
+    assert len(occurrence_keys()) == 4
+
+
+def test_import_stores_recurring_rows_as_one_time():
+    header = ["Date", "Category", "Description", "Amount", "Recurring"]
+    values, reason = importer.validate_row(
+        importer.column_positions(header),
+        ["2023-03-01", "Office", "Rent", "1200", "Monthly"],
+    )
+    assert reason == ""
+    expense = dict(zip(storage.EXPENSE_COLUMNS, values))
+    assert expense["recurring_frequency"] == "One-time"
+    assert not recurring.is_template(expense)
@@ -0,0 +1,67 @@
+import random
+from app.data.search_index import ExpenseSearchIndex, expense_tokens, tokenize
+
+WORDS = ["aws", "awning", "cloud", "client", "clock", "services", "server"]
+CATEGORIES = ["Office", "Software Licenses", "Travel"]
+
+
+def expense(id: str, description: str, category: str = "Office", **fields) -> dict:
+    return {
+        "id": id,
+        "description": description,
+        "category": category,
+        "payment_method": "Invoice",
+        "tags": [],
+        **fields,
+    }
+
+
+def scan(expenses, query: str) -> set[str]:
+    prefixes = set(tokenize(query))
+    return {
+        e["id"]
+        for e in expenses
+        if all(any(t.startswith(p) for t in expense_tokens(e)) for p in prefixes)
+    }
+
+
+def test_every_token_must_prefix_a_word():
+    index = ExpenseSearchIndex.build(
+        [
+            expense("e1", "AWS Cloud Services"),
+            expense("e2", "Cloud backup", "Software Licenses"),
+            expense("e3", "Client dinner", tags=["Travel"]),
+        ]
+    )
+    assert index.search("aws clo") == {"e1"}
+    assert index.search("CL") == {"e1", "e2", "e3"}
+    assert index.search("soft clo") == {"e2"}
+    assert index.search("travel client") == {"e3"}
+    assert index.search("invoice") == {"e1", "e2", "e3"}
+    assert index.search("loud") == set()
+    assert index.search("aws dinner") == set()
+    assert index.search("  ,. ") is None
+
+
+def test_updates_match_a_rebuild():
+    rng = random.Random(5)
+    expenses = {}
+    index = ExpenseSearchIndex()
+    for _ in range(300):
+        id = f"e{rng.randrange(30)}"
+        if id in expenses and rng.random() < 0.3:
+            del expenses[id]
+            index.remove(id)
+        else:
+            expenses[id] = expense(
+                id, " ".join(rng.sample(WORDS, 2)), rng.choice(CATEGORIES)
+            )
+            index.add(expenses[id])
+    rebuilt = ExpenseSearchIndex.build(expenses.values())
+    for query in ["a", "aw", "aws", "cl", "clo ser", "se cl", "x", "office"]:
+        assert index.search(query) == rebuilt.search(query)
+        assert index.search(query) == scan(expenses.values(), query)
+    for category in CATEGORIES:
+        assert index.category_ids(category) == {
+            id for id, e in expenses.items() if e["category"] == category
+        }